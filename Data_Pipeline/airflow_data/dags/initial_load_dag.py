@@ -81,7 +81,7 @@ def process_company_data(ticker, company_name, cik, **context):
     from src.data_processing.table_processor import TableProcessor
     from src.utils.table_summarizer import GroqTableSummarizer
     from src.embedding import Embedder
-    from src.cloud.gcs_connector import GCSConnector
+    from src.cloud.gcs_connector import get_gcs_connector
     from src.cloud.qdrant_connector import QdrantConnector
     
     print(f"\n{'='*80}")
@@ -91,7 +91,7 @@ def process_company_data(ticker, company_name, cik, **context):
     # Initialize components
     print("🔧 Initializing components...")
     
-    gcs = GCSConnector(
+    gcs = get_gcs_connector(
         bucket_name=os.getenv('GCP_BUCKET_NAME'),
         project_id=os.getenv('GCP_PROJECT_ID'),
         credentials_path=os.getenv('GCP_CREDENTIALS_PATH')
@@ -141,109 +141,111 @@ def process_company_data(ticker, company_name, cik, **context):
         stats['sec']['filings'] = len(filings)
         print(f"   Found {len(filings)} filings")
         
-        for filing in filings:
-            print(f"   Processing {filing['filing_type']} - {filing['filing_date']}")
-            
-            for section in filing['sections']:
-                # Process tables
-                processed_text, tables = table_processor.process_section(
-                    section_html=section.get('section_html_doc'),
-                    section_text=section['section_text'],
-                    metadata={
-                        'ticker': ticker,
-                        'filing_type': filing['filing_type'],
-                        'section': section['section_code'],
-                        'section_name': section['section_name']
-                    }
-                )
-                
-                stats['sec']['tables'] += len(tables)
-                
-                # Chunk text
-                chunks = chunker.chunk_text(processed_text)
-                if not chunks:
-                    continue
+        # Indexing is suspended while all filings upload, then built once
+        with qdrant.bulk_upload_mode(collection_name):
+            for filing in filings:
+                print(f"   Processing {filing['filing_type']} - {filing['filing_date']}")
                 
-                stats['sec']['chunks'] += len(chunks)
-                
-                # Generate embeddings
-                embeddings = embedder.embed_documents(chunks, batch_size=32)
-                
-                # Upload raw data to GCS
-                gcs_path = f"raw/sec/{ticker}/{filing['fiscal_year']}/{filing['accession_number']}_section_{section['section_code']}.json"
-                gcs.upload_data(
-                    data={
-                        'filing_metadata': {
+                for section in filing['sections']:
+                    # Process tables
+                    processed_text, tables = table_processor.process_section(
+                        section_html=section.get('section_html_doc'),
+                        section_text=section['section_text'],
+                        metadata={
                             'ticker': ticker,
                             'filing_type': filing['filing_type'],
-                            'accession_number': filing['accession_number']
+                            'section': section['section_code'],
+                            'section_name': section['section_name']
+                        }
+                    )
+                    
+                    stats['sec']['tables'] += len(tables)
+                    
+                    # Chunk text
+                    chunks = chunker.chunk_text(processed_text)
+                    if not chunks:
+                        continue
+                    
+                    stats['sec']['chunks'] += len(chunks)
+                    
+                    # Generate embeddings
+                    embeddings = embedder.embed_documents(chunks, batch_size=32)
+                    
+                    # Upload raw data to GCS
+                    gcs_path = f"raw/sec/{ticker}/{filing['fiscal_year']}/{filing['accession_number']}_section_{section['section_code']}.json"
+                    gcs.upload_data(
+                        data={
+                            'filing_metadata': {
+                                'ticker': ticker,
+                                'filing_type': filing['filing_type'],
+                                'accession_number': filing['accession_number']
+                            },
+                            'section': {'code': section['section_code'], 'name': section['section_name']},
+                            'tables': tables,
+                            'chunks': chunks
                         },
-                        'section': {'code': section['section_code'], 'name': section['section_name']},
-                        'tables': tables,
-                        'chunks': chunks
-                    },
-                    gcs_path=gcs_path
-                )
-                
-                # Prepare comprehensive metadata payloads
-                current_time = datetime.utcnow().isoformat() + 'Z'
-                payloads = []
-                
-                # Generate table references
-                table_refs = []
-                if tables:
-                    for t_idx, table in enumerate(tables):
-                        table_refs.append(f"TABLE_{ticker}_{filing['accession_number']}_{section['section_code']}_{t_idx}")
-                
-                for i, chunk_text in enumerate(chunks):
-                    chunk_tokens = len(chunker.encoding.encode(chunk_text))
+                        gcs_path=gcs_path
+                    )
                     
-                    payloads.append({
-                        # Core identifiers
-                        'chunk_id': f"{ticker}_sec_{filing['accession_number']}_{section['section_code']}_{i}",
-                        'ticker': ticker,
-                        'company_name': company_name,  # Renamed from 'company'
-                        'source': 'sec',  # Renamed from 'data_source'
-                        
-                        # Filing metadata
-                        'filing_type': filing['filing_type'],
-                        'filing_date': filing['filing_date'],
-                        'fiscal_year': filing['fiscal_year'],
-                        'fiscal_quarter': filing.get('fiscal_quarter'),
-                        'accession_number': filing['accession_number'],
-                        'filing_url': filing.get('filing_url', ''),
-                        
-                        # Section metadata
-                        'section_code': section['section_code'],  # Renamed from 'section'
-                        'section_title': section['section_name'],  # Renamed from 'section_name'
-                        
-                        # Chunk metadata
-                        'chunk_index': i,
-                        'total_chunks': len(chunks),
-                        'chunk_text': chunk_text,
-                        'chunk_size': len(chunk_text),  # Renamed from 'chunk_length'
-                        'chunk_tokens': chunk_tokens,
-                        
-                        # Table metadata
-                        'has_tables': len(tables) > 0,
-                        'table_references': table_refs,
-                        'num_tables': len(tables),
-                        
-                        # Storage
-                        'gcs_path': gcs_path,
-                        
-                        # Timestamps
-                        'processed_date': current_time,
-                        'created_at': current_time,
-                        'fetched_at': current_time,
-                        'expires_at': None,
+                    # Prepare comprehensive metadata payloads
+                    current_time = datetime.utcnow().isoformat() + 'Z'
+                    payloads = []
+                    
+                    # Generate table references
+                    table_refs = []
+                    if tables:
+                        for t_idx, table in enumerate(tables):
+                            table_refs.append(f"TABLE_{ticker}_{filing['accession_number']}_{section['section_code']}_{t_idx}")
+                    
+                    for i, chunk_text in enumerate(chunks):
+                        chunk_tokens = len(chunker.encoding.encode(chunk_text))
                         
-                        # Bias mitigation
-                        'boost_factor': 0.0,  # Default for large companies
-                        'coverage_classification': 'medium'
-                    })
-                
-                qdrant.upload_vectors(collection_name=collection_name, vectors=embeddings, payloads=payloads)
+                        payloads.append({
+                            # Core identifiers
+                            'chunk_id': f"{ticker}_sec_{filing['accession_number']}_{section['section_code']}_{i}",
+                            'ticker': ticker,
+                            'company_name': company_name,  # Renamed from 'company'
+                            'source': 'sec',  # Renamed from 'data_source'
+                            
+                            # Filing metadata
+                            'filing_type': filing['filing_type'],
+                            'filing_date': filing['filing_date'],
+                            'fiscal_year': filing['fiscal_year'],
+                            'fiscal_quarter': filing.get('fiscal_quarter'),
+                            'accession_number': filing['accession_number'],
+                            'filing_url': filing.get('filing_url', ''),
+                            
+                            # Section metadata
+                            'section_code': section['section_code'],  # Renamed from 'section'
+                            'section_title': section['section_name'],  # Renamed from 'section_name'
+                            
+                            # Chunk metadata
+                            'chunk_index': i,
+                            'total_chunks': len(chunks),
+                            'chunk_text': chunk_text,
+                            'chunk_size': len(chunk_text),  # Renamed from 'chunk_length'
+                            'chunk_tokens': chunk_tokens,
+                            
+                            # Table metadata
+                            'has_tables': len(tables) > 0,
+                            'table_references': table_refs,
+                            'num_tables': len(tables),
+                            
+                            # Storage
+                            'gcs_path': gcs_path,
+                            
+                            # Timestamps
+                            'processed_date': current_time,
+                            'created_at': current_time,
+                            'fetched_at': current_time,
+                            'expires_at': None,
+                            
+                            # Bias mitigation
+                            'boost_factor': 0.0,  # Default for large companies
+                            'coverage_classification': 'medium'
+                        })
+                    
+                    qdrant.upload_vectors(collection_name=collection_name, vectors=embeddings, payloads=payloads)
     
     except Exception as e:
         print(f"   ❌ SEC Error: {e}")
@@ -464,7 +466,7 @@ def process_company_data(ticker, company_name, cik, **context):
     # Import connectors (actual classes that exist)
     from src.cloud.postgres_connector import PostgresConnector
     from src.cloud.qdrant_connector import QdrantConnector
-    from src.cloud.gcs_connector import GCSConnector
+    from src.cloud.gcs_connector import get_gcs_connector
     
     # Import processors - NOTE: These expect Manager classes but we have Connectors
     # We'll use connectors directly instead
@@ -495,7 +497,7 @@ def process_company_data(ticker, company_name, cik, **context):
     )
     
     # Initialize GCS connector (for news processing)
-    gcs = GCSConnector(
+    gcs = get_gcs_connector(
         bucket_name=os.getenv('GCP_BUCKET_NAME'),
         project_id=os.getenv('GCP_PROJECT_ID'),
         credentials_path=os.getenv('GCP_CREDENTIALS_PATH')
@@ -45,14 +45,14 @@ def fetch_news_articles(**context):
     from src.data_ingestion.news_fetcher import NewsFetcher
     from src.data_processing.chunker import TextChunker
     from src.embedding import Embedder
-    from src.cloud import GCSConnector, QdrantConnector
+    from src.cloud import QdrantConnector, get_gcs_connector
     from src.orchestration.utils.airflow_helpers import get_companies_list
     
     companies = get_companies_list()
     news_fetcher = NewsFetcher(mode='auto')
     
     # Initialize processing components
-    gcs = GCSConnector(
+    gcs = get_gcs_connector(
         bucket_name=os.getenv('GCP_BUCKET_NAME'),
         project_id=os.getenv('GCP_PROJECT_ID'),
         credentials_path=os.getenv('GCP_CREDENTIALS_PATH')
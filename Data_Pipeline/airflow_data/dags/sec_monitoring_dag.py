@@ -95,7 +95,7 @@ def process_new_filings(**context):
     from src.data_processing.table_processor import TableProcessor
     from src.utils.table_summarizer import GroqTableSummarizer
     from src.embedding import Embedder
-    from src.cloud import GCSConnector, QdrantConnector
+    from src.cloud import QdrantConnector, get_gcs_connector
     
     # Get new filings from previous task
     new_filings = context['task_instance'].xcom_pull(key='new_filings', task_ids='check_new_filings')
@@ -105,7 +105,7 @@ def process_new_filings(**context):
         return
     
     # Initialize components
-    gcs = GCSConnector(
+    gcs = get_gcs_connector(
         bucket_name=os.getenv('GCP_BUCKET_NAME'),
         project_id=os.getenv('GCP_PROJECT_ID'),
         credentials_path=os.getenv('GCP_CREDENTIALS_PATH')
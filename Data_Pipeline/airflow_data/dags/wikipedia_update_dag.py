@@ -88,7 +88,7 @@ def update_wikipedia_pages(**context):
     
     from src.data_processing.chunker import TextChunker
     from src.embedding import Embedder
-    from src.cloud import GCSConnector, QdrantConnector
+    from src.cloud import QdrantConnector, get_gcs_connector
     
     # Get changed pages
     changed_pages = context['task_instance'].xcom_pull(key='changed_pages', task_ids='check_page_changes')
@@ -98,7 +98,7 @@ def update_wikipedia_pages(**context):
         return
     
     # Initialize components
-    gcs = GCSConnector(
+    gcs = get_gcs_connector(
         bucket_name=os.getenv('GCP_BUCKET_NAME'),
         project_id=os.getenv('GCP_PROJECT_ID'),
         credentials_path=os.getenv('GCP_CREDENTIALS_PATH')
@@ -7,8 +7,14 @@ Provides connectors for cloud storage and database services:
 - QdrantConnector: Qdrant vector database
 """
 
-from .gcs_connector import GCSConnector
-from .postgres_connector import PostgresConnector
+from .gcs_connector import GCSConnector, get_gcs_connector
+from .postgres_connector import PostgresConnector, get_postgres_connector
 from .qdrant_connector import QdrantConnector
 
-__all__ = ['GCSConnector', 'PostgresConnector', 'QdrantConnector']
+__all__ = [
+    'GCSConnector',
+    'PostgresConnector',
+    'QdrantConnector',
+    'get_gcs_connector',
+    'get_postgres_connector',
+]
@@ -7,9 +7,11 @@ Handles file operations with Google Cloud Storage buckets
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import json
+import time
 from datetime import datetime
+from functools import lru_cache
 import os
 
 import sys
@@ -102,7 +104,7 @@ class GCSConnector:
                 blob.metadata = metadata
             
             blob.upload_from_filename(str(local_path))
-            logger.info(f"Uploaded: {local_path.name} -> gs://{self.bucket_name}/{gcs_path}")
+            logger.debug("Uploaded: %s -> gs://%s/%s", local_path.name, self.bucket_name, gcs_path)
             return True
         
         except FileNotFoundError:
@@ -148,13 +150,40 @@ class GCSConnector:
                 content_type = 'application/octet-stream'
             
             blob.upload_from_string(content, content_type=content_type)
-            logger.info(f"Uploaded data -> gs://{self.bucket_name}/{gcs_path}")
+            logger.debug("Uploaded data -> gs://%s/%s", self.bucket_name, gcs_path)
             return True
         
         except Exception as e:
             logger.error(f"Data upload failed: {e}")
             return False
     
+    def upload_many(
+        self,
+        files: List[Tuple[Path, str]],
+        metadata: Optional[Dict[str, str]] = None
+    ) -> int:
+        """
+        Upload several files to GCS, logging one summary line for the batch
+        
+        Args:
+            files: List of (local_path, gcs_path) tuples
+            metadata: Optional metadata dict applied to every blob
+        
+        Returns:
+            Number of files uploaded successfully
+        """
+        start = time.perf_counter()
+        uploaded = sum(
+            1 for local_path, gcs_path in files
+            if self.upload_file(local_path, gcs_path, metadata=metadata)
+        )
+        prefix = os.path.commonprefix([gcs_path for _, gcs_path in files])
+        logger.info(
+            "Uploaded %d/%d files to gs://%s/%s in %.2fs",
+            uploaded, len(files), self.bucket_name, prefix, time.perf_counter() - start
+        )
+        return uploaded
+    
     def download_file(self, gcs_path: str, local_path: Path) -> bool:
         """
         Download a file from GCS
@@ -173,7 +202,7 @@ class GCSConnector:
             blob = self.bucket.blob(gcs_path)
             blob.download_to_filename(str(local_path))
             
-            logger.info(f"Downloaded: gs://{self.bucket_name}/{gcs_path} -> {local_path}")
+            logger.debug("Downloaded: gs://%s/%s -> %s", self.bucket_name, gcs_path, local_path)
             return True
         
         except NotFound:
@@ -261,7 +290,7 @@ class GCSConnector:
         try:
             blob = self.bucket.blob(gcs_path)
             blob.delete()
-            logger.info(f"Deleted: gs://{self.bucket_name}/{gcs_path}")
+            logger.debug("Deleted: gs://%s/%s", self.bucket_name, gcs_path)
             return True
         
         except NotFound:
@@ -271,6 +300,25 @@ class GCSConnector:
             logger.error(f"Delete failed: {e}")
             return False
     
+    def delete_many(self, gcs_paths: List[str]) -> int:
+        """
+        Delete several files from GCS, logging one summary line for the batch
+        
+        Args:
+            gcs_paths: List of GCS object paths
+        
+        Returns:
+            Number of files deleted (or already missing)
+        """
+        start = time.perf_counter()
+        deleted = sum(1 for gcs_path in gcs_paths if self.delete_file(gcs_path))
+        prefix = os.path.commonprefix(list(gcs_paths))
+        logger.info(
+            "Deleted %d/%d files from gs://%s/%s in %.2fs",
+            deleted, len(gcs_paths), self.bucket_name, prefix, time.perf_counter() - start
+        )
+        return deleted
+    
     def file_exists(self, gcs_path: str) -> bool:
         """
         Check if file exists in GCS
@@ -314,6 +362,34 @@ class GCSConnector:
             return None
 
 
+@lru_cache(maxsize=16)
+def get_gcs_connector(
+    bucket_name: str,
+    project_id: Optional[str] = None,
+    credentials_path: Optional[str] = None
+) -> GCSConnector:
+    """
+    Get a shared GCS connector for this process
+    
+    Connectors are cached per (bucket_name, project_id, credentials_path) so
+    repeated tasks reuse one storage.Client (and its HTTP/TLS pool) instead of
+    re-running client setup and the bucket lookup each time.
+    
+    Args:
+        bucket_name: GCS bucket name
+        project_id: GCP project ID (optional if set in credentials)
+        credentials_path: Path to service account JSON key file
+    
+    Returns:
+        Cached GCSConnector instance
+    """
+    return GCSConnector(
+        bucket_name=bucket_name,
+        project_id=project_id,
+        credentials_path=credentials_path
+    )
+
+
 if __name__ == "__main__":
     # Example usage
     print("Testing GCSConnector...")
@@ -9,6 +9,7 @@ from psycopg2 import pool, sql
 from psycopg2.extras import RealDictCursor, execute_batch
 from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 import sys
@@ -24,7 +25,7 @@ class PostgresConnector:
     PostgreSQL connector for state management
     
     Features:
-    - Connection pooling
+    - Thread-safe connection pooling
     - Automatic reconnection
     - Transaction support
     - Batch operations
@@ -59,9 +60,10 @@ class PostgresConnector:
         
         logger.info(f"Initializing PostgreSQL connection to {host}:{port}/{database}")
         
-        # Create connection pool
+        # Create connection pool (ThreadedConnectionPool is safe to share
+        # across worker threads; SimpleConnectionPool is not)
         try:
-            self.pool = psycopg2.pool.SimpleConnectionPool(
+            self.pool = psycopg2.pool.ThreadedConnectionPool(
                 min_connections,
                 max_connections,
                 host=host,
@@ -285,6 +287,45 @@ class PostgresConnector:
             logger.info("All database connections closed")
 
 
+@lru_cache(maxsize=16)
+def get_postgres_connector(
+    host: str,
+    port: int = 5432,
+    database: str = 'data_pipeline',
+    user: str = 'postgres',
+    password: str = '',
+    min_connections: int = 1,
+    max_connections: int = 10
+) -> PostgresConnector:
+    """
+    Get a shared PostgreSQL connector for this process
+    
+    Connectors are cached per connection settings so every caller in the
+    process shares one connection pool instead of opening a new one.
+    
+    Args:
+        host: Database host
+        port: Database port
+        database: Database name
+        user: Username
+        password: Password
+        min_connections: Minimum pool size
+        max_connections: Maximum pool size
+    
+    Returns:
+        Cached PostgresConnector instance
+    """
+    return PostgresConnector(
+        host=host,
+        port=port,
+        database=database,
+        user=user,
+        password=password,
+        min_connections=min_connections,
+        max_connections=max_connections
+    )
+
+
 if __name__ == "__main__":
     # Example usage
     print("Testing PostgresConnector...")
@@ -4,12 +4,25 @@ Qdrant Connector
 Handles vector database operations for RAG retrieval
 """
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient, grpc
+from qdrant_client.conversions.conversion import RestToGrpc, payload_to_grpc
 from qdrant_client.http import models
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from types import MappingProxyType
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+import asyncio
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import weakref
 import numpy as np
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -18,6 +31,268 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# orjson serializes payloads in C (datetime/numpy aware); stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Allow large upsert/search messages over gRPC (default limit is 4 MiB)
+GRPC_OPTIONS = {
+    'grpc.max_send_message_length': 64 << 20,
+    'grpc.max_receive_message_length': 64 << 20,
+}
+
+# Uploads at or above this size go through client.upload_collection()
+BULK_UPLOAD_THRESHOLD = 1000
+
+# upload_collection worker processes unless the caller opts in to more: child
+# processes cannot be started from daemonic workers (Celery, Composer tasks)
+DEFAULT_UPLOAD_PARALLEL = 1
+
+# Target request size used to pick upload batch sizes (see _adaptive_batch_size)
+UPLOAD_BATCH_TARGET_BYTES = 4 * 1024 * 1024
+MIN_UPLOAD_BATCH_SIZE = 16
+MAX_UPLOAD_BATCH_SIZE = 1024
+
+# Qdrant's default optimizer indexing_threshold (restored after bulk loads)
+DEFAULT_INDEXING_THRESHOLD = 20000
+
+# Distance metric names accepted by create_collection()
+DISTANCE_MAP = {
+    'Cosine': models.Distance.COSINE,
+    'Euclid': models.Distance.EUCLID,
+    'Dot': models.Distance.DOT
+}
+
+# Payload fields indexed for fast filtering
+INDEX_FIELDS = (
+    ('ticker', models.PayloadSchemaType.KEYWORD),
+    ('data_source', models.PayloadSchemaType.KEYWORD),
+    ('filing_type', models.PayloadSchemaType.KEYWORD),
+    ('fiscal_year', models.PayloadSchemaType.INTEGER),
+    ('section', models.PayloadSchemaType.KEYWORD),
+    ('has_tables', models.PayloadSchemaType.BOOL),
+    ('expires_at', models.PayloadSchemaType.DATETIME),
+)
+
+
+class _SearchCache:
+    """
+    LRU + TTL cache of search results
+    
+    Entries are keyed by the search parameters (collection, limit, filter,
+    score threshold) plus a hash of the raw query vector. For Cosine
+    collections only, a query that misses on the hash still hits if its
+    cosine similarity to a cached query with the same parameters is at
+    least similarity_threshold (Euclid/Dot results depend on the magnitude).
+    
+    Cached query vectors live L2-normalized in one preallocated matrix, so
+    the near-duplicate lookup is a single matrix-vector product. Results are
+    deep-copied on the way in and out, so callers can't alter cached payloads.
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0, similarity_threshold: float = 0.97):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self._lock = threading.Lock()
+        self._reset(dimension=0)
+    
+    def _reset(self, dimension: int):
+        """Clear the cache and (re)allocate slot storage for a vector size"""
+        self._entries: OrderedDict = OrderedDict()  # key -> slot (LRU order)
+        self._free_slots = list(range(self.max_size - 1, -1, -1))
+        self._param_ids: Dict[Tuple, int] = {}
+        self._matrix = np.zeros((self.max_size, dimension), dtype=np.float32)
+        self._slot_param = np.full(self.max_size, -1, dtype=np.int64)
+        self._slot_created = np.zeros(self.max_size, dtype=np.float64)
+        self._slot_keys: List[Optional[Tuple]] = [None] * self.max_size
+        self._slot_results: List[Optional[List[Dict[str, Any]]]] = [None] * self.max_size
+    
+    @staticmethod
+    def _normalize(query_vector: np.ndarray) -> np.ndarray:
+        query = np.asarray(query_vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(query)
+        return query / norm if norm else query
+    
+    @staticmethod
+    def _key(params: Tuple, query_vector: np.ndarray) -> Tuple:
+        raw = np.ascontiguousarray(query_vector, dtype=np.float32).ravel()
+        return params, hashlib.blake2b(raw.tobytes(), digest_size=16).digest()
+    
+    def _nearest_slot(self, params: Tuple, query: np.ndarray, expires_before: float) -> Optional[int]:
+        """Most similar unexpired cached query with the same params, if close enough"""
+        param_id = self._param_ids.get(params)
+        if param_id is None or self._matrix.shape[1] != query.shape[0]:
+            return None
+        
+        scores = self._matrix @ query
+        scores[(self._slot_param != param_id) | (self._slot_created < expires_before)] = -np.inf
+        best = int(scores.argmax())
+        return best if scores[best] >= self.similarity_threshold else None
+    
+    def _remove(self, key: Tuple):
+        slot = self._entries.pop(key)
+        self._slot_param[slot] = -1
+        self._slot_keys[slot] = None
+        self._slot_results[slot] = None
+        self._free_slots.append(slot)
+    
+    def get(
+        self,
+        params: Tuple,
+        query_vector: np.ndarray,
+        match_similar: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return cached results for an identical query, or a near-identical one
+        if match_similar (only valid for Cosine collections)
+        """
+        key = self._key(params, query_vector)
+        expires_before = time.monotonic() - self.ttl
+        
+        with self._lock:
+            slot = self._entries.get(key)
+            if slot is None:
+                if not match_similar:
+                    return None
+                slot = self._nearest_slot(params, self._normalize(query_vector), expires_before)
+                if slot is None:
+                    return None
+                key = self._slot_keys[slot]
+            
+            if self._slot_created[slot] < expires_before:
+                self._remove(key)
+                return None
+            
+            self._entries.move_to_end(key)
+            results = self._slot_results[slot]
+        
+        return copy.deepcopy(results)
+    
+    def put(self, params: Tuple, query_vector: np.ndarray, results: List[Dict[str, Any]]):
+        """Cache results for a query, evicting the least recently used entry"""
+        query = self._normalize(query_vector)
+        key = self._key(params, query_vector)
+        results = copy.deepcopy(results)
+        
+        with self._lock:
+            if self._matrix.shape[1] != query.shape[0]:
+                self._reset(dimension=query.shape[0])
+            
+            slot = self._entries.get(key)
+            if slot is None:
+                if not self._free_slots:
+                    self._remove(next(iter(self._entries)))
+                slot = self._free_slots.pop()
+                self._entries[key] = slot
+            else:
+                self._entries.move_to_end(key)
+            
+            self._matrix[slot] = query
+            self._slot_param[slot] = self._param_ids.setdefault(params, len(self._param_ids))
+            self._slot_created[slot] = time.monotonic()
+            self._slot_keys[slot] = key
+            self._slot_results[slot] = results
+    
+    def invalidate(self, collection_name: str):
+        """Drop cached results for a collection (after writes)"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0][0] == collection_name]:
+                self._remove(key)
+
+
+# id(filter) -> canonical key; entries are dropped when the filter is collected
+_FILTER_KEYS: Dict[int, bytes] = {}
+
+
+def _filter_key(query_filter: Optional[models.Filter]) -> Optional[bytes]:
+    """
+    Canonical, memoized cache key for a search filter
+    
+    Equal filters built separately map to the same key (fields are dumped
+    with sorted keys), and a filter object reused across searches is only
+    serialized once. Filters should not be mutated after first use.
+    """
+    if query_filter is None:
+        return None
+    
+    key = _FILTER_KEYS.get(id(query_filter))
+    if key is None:
+        key = json.dumps(
+            query_filter.model_dump(mode='json', exclude_none=True),
+            sort_keys=True
+        ).encode()
+        _FILTER_KEYS[id(query_filter)] = key
+        weakref.finalize(query_filter, _FILTER_KEYS.pop, id(query_filter), None)
+    return key
+
+
+def _payload_digest(payload: Dict[str, Any]) -> bytes:
+    """Stable digest of a full payload (keys sorted, non-JSON values as str)"""
+    content = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+
+def _content_hash(point_id: Any, payload_digest: bytes) -> str:
+    """Hash of a point's id and payload, used to detect re-uploads of the same point"""
+    return hashlib.blake2b(
+        f"{point_id}\x00".encode('utf-8') + payload_digest, digest_size=16
+    ).hexdigest()
+
+
+class _UploadHashCache:
+    """
+    Disk-backed set of (collection, content hash) pairs already uploaded
+    
+    Stored in SQLite so it persists across runs and is safe to share
+    between threads of one process.
+    """
+    
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS uploaded ("
+                "collection TEXT NOT NULL, content_hash TEXT NOT NULL, "
+                "PRIMARY KEY (collection, content_hash))"
+            )
+            self._conn.commit()
+    
+    def existing(self, collection_name: str, content_hashes: List[str]) -> set:
+        """Return the subset of content_hashes already uploaded to the collection"""
+        found = set()
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(content_hashes), 500):
+                chunk = content_hashes[i:i + 500]
+                rows = self._conn.execute(
+                    "SELECT content_hash FROM uploaded WHERE collection = ? "
+                    f"AND content_hash IN ({','.join('?' * len(chunk))})",
+                    (collection_name, *chunk)
+                )
+                found.update(row[0] for row in rows)
+        return found
+    
+    def add(self, collection_name: str, content_hashes: List[str]):
+        """Record content hashes as uploaded to the collection"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO uploaded (collection, content_hash) VALUES (?, ?)",
+                [(collection_name, h) for h in content_hashes]
+            )
+            self._conn.commit()
+    
+    def clear(self, collection_name: str):
+        """Forget uploads to a collection (after it is recreated or points are deleted)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM uploaded WHERE collection = ?", (collection_name,))
+            self._conn.commit()
+
 
 class QdrantConnector:
     """
@@ -25,8 +300,8 @@ class QdrantConnector:
     
     Features:
     - Collection management
-    - Vector upload with metadata
-    - Semantic search with filters
+    - Vector upload with metadata (sync or concurrent async batches)
+    - Semantic search with filters (LRU/TTL result cache)
     - Metadata updates
     - Vector deletion
     """
@@ -37,7 +312,13 @@ class QdrantConnector:
         api_key: Optional[str] = None,
         host: Optional[str] = None,
         port: Optional[int] = 6333,
-        prefer_grpc: bool = False
+        prefer_grpc: Optional[bool] = None,
+        pool_size: int = 32,
+        timeout: int = 120,
+        search_cache_size: int = 1024,
+        search_cache_ttl: float = 300.0,
+        upload_cache_path: Optional[str] = None,
+        upload_cache_text_field: str = 'chunk_text'
     ):
         """
         Initialize Qdrant connector
@@ -47,28 +328,74 @@ class QdrantConnector:
             api_key: Qdrant Cloud API key
             host: Self-hosted Qdrant host (if not using cloud)
             port: Self-hosted Qdrant port
-            prefer_grpc: Use gRPC instead of HTTP
+            prefer_grpc: Use gRPC instead of HTTP (defaults to True for
+                         remote servers; ignored for in-memory Qdrant)
+            pool_size: Connection pool size shared by concurrent requests
+            timeout: Request timeout in seconds
+            search_cache_size: Max cached search results (0 disables the cache)
+            search_cache_ttl: Seconds a cached search result stays valid
+            upload_cache_path: SQLite file recording hashes of uploaded points
+                               (id plus full payload); when set, upload_vectors
+                               skips points already uploaded to the collection
+            upload_cache_text_field: Payload field holding the chunk text; only
+                                     rows that have it are checked against the cache
         """
-        # Connect based on configuration
+        remote_kwargs = {
+            'prefer_grpc': True if prefer_grpc is None else prefer_grpc,
+            'pool_size': pool_size,
+            'timeout': timeout,
+            'grpc_options': GRPC_OPTIONS,
+        }
+        
+        # Connect based on configuration (kwargs are kept so the async
+        # client can be built against the same server on demand)
         if url and api_key:
             # Qdrant Cloud
-            self.client = QdrantClient(url=url, api_key=api_key, prefer_grpc=prefer_grpc)
+            self._client_kwargs = {'url': url, 'api_key': api_key, **remote_kwargs}
+            self.client = QdrantClient(**self._client_kwargs)
             logger.info(f"Connected to Qdrant Cloud: {url}")
         elif host:
             # Self-hosted
-            self.client = QdrantClient(host=host, port=port, prefer_grpc=prefer_grpc)
+            self._client_kwargs = {'host': host, 'port': port, **remote_kwargs}
+            self.client = QdrantClient(**self._client_kwargs)
             logger.info(f"Connected to Qdrant: {host}:{port}")
         else:
             # Local in-memory (for testing)
+            self._client_kwargs = None
             self.client = QdrantClient(":memory:")
             logger.warning("Using in-memory Qdrant (data will be lost on restart)")
+        
+        self.prefer_grpc = bool(self._client_kwargs and self._client_kwargs['prefer_grpc'])
+        self._async_client: Optional[AsyncQdrantClient] = None
+        self._search_cache = (
+            _SearchCache(max_size=search_cache_size, ttl=search_cache_ttl)
+            if search_cache_size > 0 else None
+        )
+        self._upload_cache = _UploadHashCache(upload_cache_path) if upload_cache_path else None
+        self._upload_cache_text_field = upload_cache_text_field
+        
+        # collection -> distance metric, looked up once (see _is_cosine)
+        self._distances: Dict[str, Optional[models.Distance]] = {}
+    
+    @property
+    def async_client(self) -> Optional[AsyncQdrantClient]:
+        """Lazily created async client (None for in-memory Qdrant)"""
+        if self._async_client is None and self._client_kwargs is not None:
+            self._async_client = self._new_async_client()
+        return self._async_client
+    
+    def _new_async_client(self) -> AsyncQdrantClient:
+        """Create an async client for the configured server"""
+        return AsyncQdrantClient(**self._client_kwargs)
     
     def create_collection(
         self,
         collection_name: str,
         vector_size: int = 1024,
         distance: str = 'Cosine',
-        recreate: bool = False
+        recreate: bool = False,
+        datatype: str = 'float32',
+        quantize: bool = False
     ) -> bool:
         """
         Create a vector collection
@@ -78,6 +405,8 @@ class QdrantConnector:
             vector_size: Dimension of vectors (1024 for BGE-large)
             distance: Distance metric ('Cosine', 'Euclid', 'Dot')
             recreate: If True, delete existing and recreate
+            datatype: Stored vector datatype ('float32' or 'float16')
+            quantize: Enable int8 scalar quantization (kept in RAM)
         
         Returns:
             True if successful
@@ -90,23 +419,32 @@ class QdrantConnector:
             if exists and recreate:
                 logger.info(f"Deleting existing collection: {collection_name}")
                 self.client.delete_collection(collection_name)
+                self._distances.pop(collection_name, None)
+                self._invalidate_search_cache(collection_name)
+                if self._upload_cache is not None:
+                    self._upload_cache.clear(collection_name)
                 exists = False
             
             if not exists:
-                # Map distance string to enum
-                distance_map = {
-                    'Cosine': models.Distance.COSINE,
-                    'Euclid': models.Distance.EUCLID,
-                    'Dot': models.Distance.DOT
-                }
+                quantization_config = None
+                if quantize:
+                    quantization_config = models.ScalarQuantization(
+                        scalar=models.ScalarQuantizationConfig(
+                            type=models.ScalarType.INT8,
+                            always_ram=True
+                        )
+                    )
                 
                 self.client.create_collection(
                     collection_name=collection_name,
                     vectors_config=models.VectorParams(
                         size=vector_size,
-                        distance=distance_map.get(distance, models.Distance.COSINE)
-                    )
+                        distance=DISTANCE_MAP.get(distance, models.Distance.COSINE),
+                        datatype=models.Datatype.FLOAT16 if datatype == 'float16' else None
+                    ),
+                    quantization_config=quantization_config
                 )
+                self._distances.pop(collection_name, None)
                 logger.info(f"Created collection: {collection_name} (size={vector_size}, distance={distance})")
                 
                 # Create payload indexes for fast filtering
@@ -121,35 +459,39 @@ class QdrantConnector:
             return False
     
     def _create_indexes(self, collection_name: str):
-        """Create payload indexes for filtering"""
-        index_fields = [
-            ('ticker', models.PayloadSchemaType.KEYWORD),
-            ('data_source', models.PayloadSchemaType.KEYWORD),
-            ('filing_type', models.PayloadSchemaType.KEYWORD),
-            ('fiscal_year', models.PayloadSchemaType.INTEGER),
-            ('section', models.PayloadSchemaType.KEYWORD),
-            ('has_tables', models.PayloadSchemaType.BOOL),
-            ('expires_at', models.PayloadSchemaType.DATETIME),
-        ]
+        """Create payload indexes for filtering (one concurrent request per field)"""
+        create_payload_index = self.client.create_payload_index
         
-        for field_name, schema_type in index_fields:
-            try:
-                self.client.create_payload_index(
+        with ThreadPoolExecutor(max_workers=len(INDEX_FIELDS)) as executor:
+            futures = {
+                executor.submit(
+                    create_payload_index,
                     collection_name=collection_name,
                     field_name=field_name,
                     field_schema=schema_type
-                )
-                logger.debug(f"Created index on field: {field_name}")
-            except Exception as e:
-                # Index might already exist
-                logger.debug(f"Index creation for {field_name}: {e}")
+                ): field_name
+                for field_name, schema_type in INDEX_FIELDS
+            }
+            
+            for future in as_completed(futures):
+                field_name = futures[future]
+                try:
+                    future.result()
+                    logger.debug(f"Created index on field: {field_name}")
+                except Exception as e:
+                    # Index might already exist
+                    logger.debug(f"Index creation for {field_name}: {e}")
     
     def upload_vectors(
         self,
         collection_name: str,
         vectors: np.ndarray,
         payloads: List[Dict[str, Any]],
-        ids: Optional[List[str]] = None
+        ids: Optional[List[str]] = None,
+        bulk_mode: bool = False,
+        dtype: str = 'float32',
+        batch_size: Optional[int] = None,
+        parallel: int = DEFAULT_UPLOAD_PARALLEL
     ) -> bool:
         """
         Upload vectors with metadata
@@ -158,50 +500,461 @@ class QdrantConnector:
             collection_name: Target collection
             vectors: Array of shape (n, dimension)
             payloads: List of metadata dicts (one per vector)
-            ids: Optional list of IDs (auto-generated if None)
+            ids: Optional list of IDs (auto-generated if None; derived from the
+                 payload when the upload cache is enabled, so re-runs map to
+                 the same points)
+            bulk_mode: Disable HNSW indexing during the upload and restore it
+                       afterwards (faster for large initial loads)
+            dtype: Vector dtype to send ('float32' or 'float16'; use float16
+                   with collections created with datatype='float16')
+            batch_size: Points per request (default: sized from vector
+                        dimension and payload size, see _adaptive_batch_size)
+            parallel: Worker processes for large uploads (opt-in; only from
+                      processes that may start children)
         
         Returns:
-            True if successful
+            True if successful (upload errors are logged and re-raised)
         """
+        if not bulk_mode:
+            return self._upload_vectors(collection_name, vectors, payloads, ids, dtype, batch_size, parallel)
+        
+        with self.bulk_upload_mode(collection_name):
+            return self._upload_vectors(collection_name, vectors, payloads, ids, dtype, batch_size, parallel)
+    
+    @contextmanager
+    def bulk_upload_mode(self, collection_name: str):
+        """
+        Suspend HNSW indexing on a collection for a bulk load (context manager)
+        
+        Points uploaded inside the block are stored without building the graph
+        as they arrive; on exit the previous indexing threshold is restored and
+        Qdrant indexes everything in one optimization pass.
+        
+        Usage:
+            with connector.bulk_upload_mode(collection_name):
+                for batch in batches:
+                    connector.upload_vectors(collection_name, ...)
+        """
+        previous = self._get_indexing_threshold(collection_name)
+        self._set_indexing_threshold(collection_name, 0)
         try:
-            n_vectors = len(vectors)
+            yield
+        finally:
+            self._set_indexing_threshold(collection_name, previous)
+    
+    def _invalidate_search_cache(self, collection_name: str):
+        """Drop cached search results after a write to the collection"""
+        if self._search_cache is not None:
+            self._search_cache.invalidate(collection_name)
+    
+    def _get_indexing_threshold(self, collection_name: str) -> int:
+        """
+        Current optimizer indexing threshold of a collection
+        
+        Falls back to DEFAULT_INDEXING_THRESHOLD if it can't be read, or if it
+        is 0 (indexing left disabled, e.g. by an interrupted bulk load).
+        """
+        try:
+            info = self.client.get_collection(collection_name=collection_name)
+            threshold = info.config.optimizer_config.indexing_threshold
+        except Exception as e:
+            logger.warning(f"Failed to read indexing threshold of {collection_name}: {e}")
+            threshold = None
+        return threshold or DEFAULT_INDEXING_THRESHOLD
+    
+    def _set_indexing_threshold(self, collection_name: str, threshold: int):
+        """Update the collection's optimizer indexing threshold (0 disables indexing)"""
+        try:
+            self.client.update_collection(
+                collection_name=collection_name,
+                optimizer_config=models.OptimizersConfigDiff(indexing_threshold=threshold)
+            )
+            logger.debug(f"Set indexing_threshold={threshold} on {collection_name}")
+        except Exception as e:
+            logger.warning(f"Failed to set indexing threshold on {collection_name}: {e}")
+    
+    def _upload_vectors(
+        self,
+        collection_name: str,
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        ids: Optional[List[str]],
+        dtype: str = 'float32',
+        batch_size: Optional[int] = None,
+        parallel: int = DEFAULT_UPLOAD_PARALLEL
+    ) -> bool:
+        """Upload vectors (see upload_vectors)"""
+        try:
+            digests = None
+            if self._upload_cache is not None:
+                # Hash the caller's payloads before REST normalization
+                digests = [_payload_digest(payload) for payload in payloads]
+                if ids is None:
+                    ids = [str(UUID(bytes=digest)) for digest in digests]
             
-            # Generate IDs if not provided
-            if ids is None:
-                ids = [str(uuid4()) for _ in range(n_vectors)]
+            ids, vectors, payloads = self._prepare_upload(vectors, payloads, ids, dtype)
             
-            # Validate
-            if len(payloads) != n_vectors:
-                raise ValueError(f"Payloads ({len(payloads)}) != vectors ({n_vectors})")
+            content_hashes = None
+            if digests is not None:
+                ids, vectors, payloads, content_hashes = self._skip_uploaded(
+                    collection_name, ids, vectors, payloads, digests
+                )
             
-            if len(ids) != n_vectors:
-                raise ValueError(f"IDs ({len(ids)}) != vectors ({n_vectors})")
+            n_vectors = len(vectors)
+            if n_vectors == 0:
+                logger.info(f"All vectors already uploaded to {collection_name}, skipping")
+                return True
             
-            # Create points
-            points = []
-            for i in range(n_vectors):
-                points.append(models.PointStruct(
-                    id=ids[i],
-                    vector=vectors[i].tolist(),
-                    payload=payloads[i]
-                ))
+            batch_size = batch_size or self._adaptive_batch_size(vectors, payloads)
             
-            # Upload in batches
-            batch_size = 100
-            for i in range(0, len(points), batch_size):
-                batch = points[i:i+batch_size]
-                self.client.upsert(
+            if n_vectors >= BULK_UPLOAD_THRESHOLD:
+                # Bulk path: qdrant-client takes the ndarray directly and can
+                # spread batches over worker processes for remote servers
+                parallel = self._upload_parallelism(parallel)
+                self.client.upload_collection(
                     collection_name=collection_name,
-                    points=batch
+                    vectors=vectors,
+                    payload=payloads,
+                    ids=ids,
+                    batch_size=batch_size,
+                    parallel=parallel,
+                    wait=True
                 )
-                logger.debug(f"Uploaded batch {i//batch_size + 1}: {len(batch)} vectors")
+                logger.info(f"Uploaded {n_vectors} vectors to {collection_name} (parallel={parallel})")
+            else:
+                # Upload in batches. Over gRPC, concurrent callers share the
+                # client's pool and multiplex HTTP/2 streams.
+                for i in range(0, n_vectors, batch_size):
+                    end = i + batch_size
+                    self.client.upsert(
+                        collection_name=collection_name,
+                        points=self._make_points(ids[i:end], vectors[i:end], payloads[i:end])
+                    )
+                    logger.debug(f"Uploaded batch {i//batch_size + 1}: {min(end, n_vectors) - i} vectors")
+                
+                logger.info(f"Uploaded {n_vectors} vectors to {collection_name}")
+            
+            self._invalidate_search_cache(collection_name)
+            if content_hashes:
+                self._upload_cache.add(collection_name, content_hashes)
+            return True
+        
+        except Exception as e:
+            logger.error(f"Failed to upload vectors to {collection_name}: {e}")
+            raise
+    
+    def _skip_uploaded(
+        self,
+        collection_name: str,
+        ids: List[str],
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        digests: List[bytes]
+    ) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]], List[str]]:
+        """
+        Drop rows whose point (id and full payload) was already uploaded
+        
+        Keying on the whole payload means the same text uploaded with new
+        metadata (e.g. boilerplate in a new filing) is still written.
+        
+        Returns the remaining ids, vectors and payloads plus their content
+        hashes (rows without the cache's text field are always uploaded).
+        """
+        text_field = self._upload_cache_text_field
+        row_hashes = [
+            _content_hash(point_id, digest) if text_field in payload else None
+            for point_id, digest, payload in zip(ids, digests, payloads)
+        ]
+        uploaded = self._upload_cache.existing(
+            collection_name, [h for h in row_hashes if h is not None]
+        )
+        keep = [i for i, h in enumerate(row_hashes) if h is None or h not in uploaded]
+        
+        if len(keep) < len(row_hashes):
+            logger.info(f"Skipping {len(row_hashes) - len(keep)} already-uploaded vectors")
+        
+        return (
+            [ids[i] for i in keep],
+            vectors[keep],
+            [payloads[i] for i in keep],
+            [row_hashes[i] for i in keep if row_hashes[i] is not None]
+        )
+    
+    def upload_vectors_shared(
+        self,
+        collection_name: str,
+        vectors: np.ndarray,
+        shared_payload: Dict[str, Any],
+        per_row_payloads: List[Dict[str, Any]],
+        ids: Optional[List[str]] = None,
+        batch_size: int = 256,
+        parallel: int = DEFAULT_UPLOAD_PARALLEL
+    ) -> bool:
+        """
+        Upload vectors whose payloads share common fields
+        
+        Fields such as ticker/data_source/filing_type are passed once in
+        shared_payload instead of being repeated in every row dict; merged
+        payloads are built lazily, one batch at a time, during the upload.
+        
+        Args:
+            collection_name: Target collection
+            vectors: Array of shape (n, dimension)
+            shared_payload: Fields common to every point
+            per_row_payloads: Per-point fields (override shared fields)
+            ids: Optional list of IDs (auto-generated if None)
+            batch_size: Points per upload request
+            parallel: Worker processes for large uploads (opt-in, see upload_vectors)
+        
+        Returns:
+            True if successful (upload errors are logged and re-raised)
+        """
+        try:
+            n_vectors = len(vectors)
+            ids, vectors, per_row_payloads = self._prepare_upload(vectors, per_row_payloads, ids)
+            shared = MappingProxyType(dict(shared_payload))
             
+            self.client.upload_collection(
+                collection_name=collection_name,
+                vectors=vectors,
+                payload=({**shared, **row} for row in per_row_payloads),
+                ids=ids,
+                batch_size=batch_size,
+                parallel=self._upload_parallelism(parallel) if n_vectors >= BULK_UPLOAD_THRESHOLD else 1,
+                wait=True
+            )
+            
+            self._invalidate_search_cache(collection_name)
             logger.info(f"Uploaded {n_vectors} vectors to {collection_name}")
             return True
         
         except Exception as e:
-            logger.error(f"Failed to upload vectors: {e}")
-            return False
+            logger.error(f"Failed to upload vectors to {collection_name}: {e}")
+            raise
+    
+    @staticmethod
+    def _normalize_payloads(payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Round-trip payloads through JSON once before upload
+        
+        Converts datetimes to ISO strings and numpy scalars/arrays to plain
+        Python values, and raises immediately on anything unserializable
+        instead of failing batch by batch inside the client.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.loads(orjson.dumps(
+                payloads,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+        
+        def default(value):
+            if hasattr(value, 'isoformat'):
+                return value.isoformat()
+            if isinstance(value, (np.generic, np.ndarray)):
+                return value.tolist()
+            raise TypeError(f"Payload value of type {type(value).__name__} is not JSON serializable")
+        
+        return json.loads(json.dumps(payloads, default=default))
+    
+    def _make_points(
+        self,
+        ids: List[str],
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]]
+    ):
+        """
+        Build one upsert batch without per-point pydantic validation
+        
+        Over gRPC the protobuf points are built directly (the client would
+        otherwise validate a models.Batch and then convert it point by
+        point), filling each vector straight from the float32 row buffer;
+        over HTTP a models.Batch is validated once for the batch.
+        """
+        if self.prefer_grpc:
+            convert_id = RestToGrpc.convert_extended_point_id
+            # memoryview rows skip building a Python float list per vector
+            # (memoryview has no float16 format, so those go through tolist)
+            rows = map(memoryview, vectors) if vectors.dtype == np.float32 else vectors.tolist()
+            return [
+                grpc.PointStruct(
+                    id=convert_id(point_id),
+                    vectors=grpc.Vectors(vector=grpc.Vector(data=row)),
+                    payload=payload_to_grpc(payload)
+                )
+                for point_id, row, payload in zip(ids, rows, payloads)
+            ]
+        
+        # One C-level conversion per batch
+        return models.Batch(ids=ids, vectors=vectors.tolist(), payloads=payloads)
+    
+    @staticmethod
+    def _adaptive_batch_size(vectors: np.ndarray, payloads: List[Dict[str, Any]]) -> int:
+        """
+        Pick points per request so each request is about UPLOAD_BATCH_TARGET_BYTES
+        
+        Small vectors get large batches (fewer round-trips) and large vectors
+        or payloads get smaller ones (no oversized requests that stall or
+        time out). Payload size is estimated from a sample of rows.
+        """
+        sample = payloads[:32]
+        if sample:
+            if ORJSON_AVAILABLE:
+                sample_bytes = len(orjson.dumps(sample, option=orjson.OPT_SERIALIZE_NUMPY, default=str))
+            else:
+                sample_bytes = len(json.dumps(sample, default=str))
+            avg_payload_bytes = sample_bytes // len(sample)
+        else:
+            avg_payload_bytes = 0
+        
+        bytes_per_point = vectors.shape[1] * vectors.itemsize + avg_payload_bytes
+        return max(
+            MIN_UPLOAD_BATCH_SIZE,
+            min(MAX_UPLOAD_BATCH_SIZE, UPLOAD_BATCH_TARGET_BYTES // max(bytes_per_point, 1))
+        )
+    
+    def _upload_parallelism(self, parallel: int) -> int:
+        """Worker processes for upload_collection (1 for in-memory Qdrant)"""
+        return max(1, parallel) if self._client_kwargs else 1
+    
+    def _prepare_upload(
+        self,
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        ids: Optional[List[str]],
+        dtype: str = 'float32'
+    ) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]]]:
+        """Validate upload inputs and return (ids, contiguous vectors of dtype, payloads)"""
+        n_vectors = len(vectors)
+        
+        # Generate IDs if not provided
+        if ids is None:
+            ids = [str(uuid4()) for _ in range(n_vectors)]
+        
+        # Validate
+        if len(payloads) != n_vectors:
+            raise ValueError(f"Payloads ({len(payloads)}) != vectors ({n_vectors})")
+        
+        if len(ids) != n_vectors:
+            raise ValueError(f"IDs ({len(ids)}) != vectors ({n_vectors})")
+        
+        # REST payloads are JSON-encoded by the client; pre-normalize them in one pass
+        if not self.prefer_grpc:
+            payloads = self._normalize_payloads(payloads)
+        
+        # No-op when the embedder already produced a contiguous array of dtype
+        return ids, np.ascontiguousarray(vectors, dtype=dtype), payloads
+    
+    async def _upload_batches_async(
+        self,
+        client: AsyncQdrantClient,
+        collection_name: str,
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        ids: Optional[List[str]],
+        batch_size: Optional[int],
+        concurrency: int
+    ) -> bool:
+        """Upsert batches concurrently, bounded by a semaphore"""
+        try:
+            n_vectors = len(vectors)
+            ids, vectors, payloads = self._prepare_upload(vectors, payloads, ids)
+            batch_size = batch_size or self._adaptive_batch_size(vectors, payloads)
+            semaphore = asyncio.Semaphore(concurrency)
+            
+            async def upsert_batch(start: int):
+                end = start + batch_size
+                async with semaphore:
+                    await client.upsert(
+                        collection_name=collection_name,
+                        points=self._make_points(
+                            ids[start:end], vectors[start:end], payloads[start:end]
+                        )
+                    )
+            
+            await asyncio.gather(*[
+                upsert_batch(start) for start in range(0, n_vectors, batch_size)
+            ])
+            
+            self._invalidate_search_cache(collection_name)
+            logger.info(f"Uploaded {n_vectors} vectors to {collection_name} (concurrency={concurrency})")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Failed to upload vectors to {collection_name}: {e}")
+            raise
+    
+    async def upload_vectors_async(
+        self,
+        collection_name: str,
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        ids: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+        concurrency: int = 8
+    ) -> bool:
+        """
+        Upload vectors with concurrent in-flight upsert batches
+        
+        Args:
+            collection_name: Target collection
+            vectors: Array of shape (n, dimension)
+            payloads: List of metadata dicts (one per vector)
+            ids: Optional list of IDs (auto-generated if None)
+            batch_size: Points per upsert request (default: adaptive)
+            concurrency: Maximum upsert requests in flight
+        
+        Returns:
+            True if successful (upload errors are logged and re-raised)
+        """
+        if self.async_client is None:
+            # In-memory Qdrant cannot be shared with a second client
+            return self.upload_vectors(collection_name, vectors, payloads, ids)
+        
+        return await self._upload_batches_async(
+            self.async_client, collection_name, vectors, payloads, ids,
+            batch_size, concurrency
+        )
+    
+    def upload_vectors_concurrent(
+        self,
+        collection_name: str,
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        ids: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+        concurrency: int = 8
+    ) -> bool:
+        """
+        Synchronous wrapper around concurrent async upload
+        
+        Uses a short-lived async client so it is safe to call repeatedly
+        (each asyncio.run() call gets its own event loop).
+        
+        Args:
+            collection_name: Target collection
+            vectors: Array of shape (n, dimension)
+            payloads: List of metadata dicts (one per vector)
+            ids: Optional list of IDs (auto-generated if None)
+            batch_size: Points per upsert request (default: adaptive)
+            concurrency: Maximum upsert requests in flight
+        
+        Returns:
+            True if successful (upload errors are logged and re-raised)
+        """
+        if self._client_kwargs is None:
+            return self.upload_vectors(collection_name, vectors, payloads, ids)
+        
+        async def run() -> bool:
+            client = self._new_async_client()
+            try:
+                return await self._upload_batches_async(
+                    client, collection_name, vectors, payloads, ids,
+                    batch_size, concurrency
+                )
+            finally:
+                await client.close()
+        
+        return asyncio.run(run())
     
     def search(
         self,
@@ -209,7 +962,8 @@ class QdrantConnector:
         query_vector: np.ndarray,
         limit: int = 10,
         query_filter: Optional[models.Filter] = None,
-        score_threshold: Optional[float] = None
+        score_threshold: Optional[float] = None,
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Search for similar vectors
@@ -220,35 +974,141 @@ class QdrantConnector:
             limit: Number of results
             query_filter: Optional filter on metadata
             score_threshold: Minimum similarity score
+            use_cache: Serve identical/near-identical recent queries from cache
         
         Returns:
             List of result dicts with 'id', 'score', and 'payload'
         """
+        cache = self._search_cache if use_cache else None
+        if cache is not None:
+            cache_params = (collection_name, limit, _filter_key(query_filter), score_threshold)
+            cached = cache.get(cache_params, query_vector, match_similar=self._is_cosine(collection_name))
+            if cached is not None:
+                logger.debug(f"Search cache hit ({len(cached)} results)")
+                return cached
+        
         try:
-            results = self.client.search_points(
+            results = self.client.query_points(
                 collection_name=collection_name,
-                query=query_vector.tolist(),
+                query=np.asarray(query_vector, dtype=np.float32).tolist(),
                 query_filter=query_filter,
                 limit=limit,
-                score_threshold=score_threshold
-            )
+                score_threshold=score_threshold,
+                with_payload=True
+            ).points
             
             # Convert to dict format
-            output = []
-            for hit in results:
-                output.append({
-                    'id': hit.id,
-                    'score': hit.score,
-                    'payload': hit.payload
-                })
+            output = [
+                {'id': hit.id, 'score': hit.score, 'payload': hit.payload}
+                for hit in results
+            ]
             
             logger.debug(f"Search returned {len(output)} results")
+            if cache is not None:
+                cache.put(cache_params, query_vector, output)
             return output
         
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
     
+    def _is_cosine(self, collection_name: str) -> bool:
+        """Whether the collection's (unnamed) vectors use Cosine distance"""
+        if collection_name not in self._distances:
+            try:
+                vectors = self.client.get_collection(collection_name).config.params.vectors
+                self._distances[collection_name] = (
+                    vectors.distance if isinstance(vectors, models.VectorParams) else None
+                )
+            except Exception as e:
+                logger.debug(f"Could not read distance for {collection_name}: {e}")
+                return False
+        
+        return self._distances[collection_name] == models.Distance.COSINE
+    
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: np.ndarray,
+        limit: int = 10,
+        query_filter: Optional[models.Filter] = None,
+        score_threshold: Optional[float] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query vectors in one request
+        
+        Args:
+            collection_name: Collection to search
+            query_vectors: Array of shape (n_queries, dimension)
+            limit: Number of results per query
+            query_filter: Optional filter on metadata (applied to every query)
+            score_threshold: Minimum similarity score
+        
+        Returns:
+            One list of result dicts (with 'id', 'score', 'payload') per query
+        """
+        try:
+            requests = [
+                models.QueryRequest(
+                    query=vector,
+                    filter=query_filter,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_payload=True
+                )
+                for vector in np.asarray(query_vectors, dtype=np.float32).tolist()
+            ]
+            
+            responses = self.client.query_batch_points(
+                collection_name=collection_name,
+                requests=requests
+            )
+            
+            output = [
+                [{'id': hit.id, 'score': hit.score, 'payload': hit.payload} for hit in response.points]
+                for response in responses
+            ]
+            
+            logger.debug(f"Batch search returned results for {len(output)} queries")
+            return output
+        
+        except Exception as e:
+            logger.error(f"Batch search failed: {e}")
+            return [[] for _ in range(len(query_vectors))]
+    
+    @staticmethod
+    def match_filter(
+        conditions: Dict[str, Any],
+        exclude: Optional[Dict[str, Any]] = None
+    ) -> models.Filter:
+        """
+        Build a filter that requires every payload field to match
+        
+        Scalar values become MatchValue; list/tuple/set values become
+        MatchAny, so a single filter covers "field is any of these".
+        
+        Args:
+            conditions: Payload field -> required value (or collection of values)
+            exclude: Payload field -> value(s) that must not match
+        
+        Returns:
+            Qdrant filter with one 'must' (and 'must_not') condition per field
+        """
+        def field_conditions(fields: Dict[str, Any]) -> List[models.FieldCondition]:
+            field_conditions = []
+            for key, value in fields.items():
+                if isinstance(value, (list, tuple, set)):
+                    match = models.MatchAny(any=list(value))
+                else:
+                    match = models.MatchValue(value=value)
+                field_conditions.append(models.FieldCondition(key=key, match=match))
+            return field_conditions
+        
+        return models.Filter(
+            must=field_conditions(conditions),
+            must_not=field_conditions(exclude) if exclude else None
+        )
+    
     def delete_vectors(
         self,
         collection_name: str,
@@ -275,6 +1135,7 @@ class QdrantConnector:
                     collection_name=collection_name,
                     points_selector=models.FilterSelector(filter=filters)
                 )
+                self._invalidate_search_cache(collection_name)
                 logger.info(f"Deleted vectors matching filter from {collection_name}")
             elif ids:
                 # Delete by IDs
@@ -282,11 +1143,16 @@ class QdrantConnector:
                     collection_name=collection_name,
                     points_selector=models.PointIdsList(points=ids)
                 )
+                self._invalidate_search_cache(collection_name)
                 logger.info(f"Deleted {len(ids)} vectors from {collection_name}")
             else:
                 logger.warning("No filters or IDs provided for deletion")
                 return False
             
+            # Deleted points can't be mapped back to content hashes, so
+            # forget the collection's uploads rather than skip re-uploads
+            if self._upload_cache is not None:
+                self._upload_cache.clear(collection_name)
             return True
         
         except Exception as e:
@@ -328,6 +1194,7 @@ class QdrantConnector:
                 payload=payload,
                 points=selector
             )
+            self._invalidate_search_cache(collection_name)
             logger.info(f"Updated payload in {collection_name}")
             return True
         
@@ -1,8 +1,12 @@
 # src/data_ingestion/base_fetcher.py
 """Base fetcher class with rate limiting and retry logic"""
 
+import asyncio
+import random
+import threading
 import time
-from typing import Callable, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, List, Optional
 from functools import wraps
 
 import sys
@@ -19,8 +23,8 @@ class BaseFetcher:
     Base class for all data fetchers
     
     Features:
-    - Rate limiting
-    - Retry logic with exponential backoff
+    - Thread-safe rate limiting (monotonic clock)
+    - Retry logic with exponential backoff (sync, or async with jitter)
     - Error handling
     """
     
@@ -35,18 +39,35 @@ class BaseFetcher:
         self.rate_limit = rate_limit
         self.max_retries = max_retries
         self.min_interval = 1.0 / rate_limit  # Minimum time between requests
-        self.last_request_time = 0
+        self._interval_ns = int(1e9 / rate_limit)
+        self._next_slot_ns = 0
+        self._rate_lock = threading.Lock()
     
     def _rate_limit_wait(self):
-        """Wait to respect rate limit"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            time.sleep(wait_time)
+        """
+        Wait to respect rate limit
         
-        self.last_request_time = time.time()
+        Each caller reserves the next free request slot under a lock and then
+        sleeps outside it, so concurrent threads are spaced min_interval apart
+        without blocking each other while waiting.
+        """
+        wait_ns = self._reserve_request_slot()
+        if wait_ns > 0:
+            time.sleep(wait_ns / 1e9)
+    
+    async def _rate_limit_wait_async(self):
+        """Async variant of _rate_limit_wait (shares the same request slots)"""
+        wait_ns = self._reserve_request_slot()
+        if wait_ns > 0:
+            await asyncio.sleep(wait_ns / 1e9)
+    
+    def _reserve_request_slot(self) -> int:
+        """Reserve the next request slot and return nanoseconds until it starts"""
+        with self._rate_lock:
+            now = time.monotonic_ns()
+            slot = max(now, self._next_slot_ns)
+            self._next_slot_ns = slot + self._interval_ns
+        return slot - now
     
     def fetch_with_retry(self, *args, **kwargs) -> Any:
         """
@@ -72,6 +93,63 @@ class BaseFetcher:
                     logger.error(f"All {self.max_retries} attempts failed")
                     raise
     
+    def fetch_many(self, arg_list: List[tuple], max_workers: int = 8) -> List[Optional[Any]]:
+        """
+        Fetch several items concurrently within the rate limit
+        
+        Each worker goes through fetch_with_retry(), so all requests share
+        this fetcher's rate limiter while their network latency overlaps.
+        
+        Args:
+            arg_list: List of positional-argument tuples for fetch()
+            max_workers: Maximum concurrent fetches
+        
+        Returns:
+            Results in the same order as arg_list (None for failed fetches)
+        """
+        def fetch_one(args: tuple) -> Optional[Any]:
+            try:
+                return self.fetch_with_retry(*args)
+            except Exception as e:
+                logger.error(f"Fetch failed for {args}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch_one, arg_list))
+    
+    async def fetch_with_retry_async(self, *args, **kwargs) -> Any:
+        """
+        Async fetch with retry logic
+        
+        Awaits self.fetch_async() with retries. Backoff sleeps are non-blocking
+        and jittered so failing fetchers don't retry in lockstep.
+        """
+        for attempt in range(self.max_retries):
+            try:
+                await self._rate_limit_wait_async()
+                return await self.fetch_async(*args, **kwargs)
+            
+            except Exception as e:
+                logger.warning(f"Fetch attempt {attempt + 1}/{self.max_retries} failed: {e}")
+                
+                if attempt < self.max_retries - 1:
+                    # Exponential backoff with jitter, capped at 60s
+                    wait_time = min(2 ** attempt + random.uniform(0, 1), 60)
+                    logger.info(f"Retrying in {wait_time:.1f} seconds...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(f"All {self.max_retries} attempts failed")
+                    raise
+    
+    async def fetch_async(self, *args, **kwargs) -> Any:
+        """
+        Async fetch method
+        
+        Runs the blocking fetch() in a worker thread by default; subclasses
+        with a native async client can override this.
+        """
+        return await asyncio.to_thread(self.fetch, *args, **kwargs)
+    
     def fetch(self, *args, **kwargs) -> Any:
         """
         Main fetch method (to be overridden by subclasses)
@@ -1,12 +1,26 @@
 import os
+import heapq
 import json
 import requests
 import newspaper
+from newspaper import network
 import re
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import Levenshtein
-from fuzzywuzzy import fuzz
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from functools import lru_cache
+import numpy as np
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from src.data_ingestion.base_fetcher import BaseFetcher
 from src.utils.config import config
@@ -14,6 +28,84 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Concurrent newspaper3k downloads per fetcher, shared by all tickers fetched
+# at once (also the HTTP connection pool size)
+EXTRACTION_WORKERS = 16
+
+# Untruncated API content at least this long is used as-is (no newspaper3k)
+FULL_CONTENT_MIN_CHARS = 500
+
+# Relevance signal weights (sum to 1.0)
+RELEVANCE_WEIGHTS = {
+    # Fuzzy matching (40%)
+    'exact_company': 0.15,
+    'exact_ticker': 0.15,
+    'fuzzy_company': 0.10,
+    
+    # Semantic context (30%)
+    'business_context': 0.20,
+    'has_org_entities': 0.10,
+    
+    # Structural signals (30%)
+    'position': 0.10,
+    'mention_density': 0.20
+}
+RELEVANCE_COMPONENTS = tuple(RELEVANCE_WEIGHTS)
+RELEVANCE_WEIGHT_VECTOR = np.array([RELEVANCE_WEIGHTS[c] for c in RELEVANCE_COMPONENTS])
+TITLE_MATCH_BOOST = 0.1
+
+# CJK, Arabic and Cyrillic scripts (non-English titles)
+_NON_LATIN_RE = re.compile(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0600-\u06ff\u0400-\u04ff]')
+
+# ASCII bytes that are not letters; deleting them leaves only [A-Za-z]
+_ASCII_NON_LETTERS = bytes(b for b in range(128) if not chr(b).isalpha())
+
+
+# Corporate suffixes stripped from company names (case-insensitive)
+COMPANY_SUFFIXES = (
+    " Inc.", " Inc", " Corporation", " Corp.", " Corp",
+    " LLC", " L.L.C.", " Ltd.", " Ltd", " Company", " Co.",
+    " Co", " Limited", " li", " nv", " sa",
+    " S.A.", " ag", " Group", " Holdings", " Technologies",
+    " International", " Incorporated", " PLC", ".com", " Platforms"
+)
+# Trailing run of suffixes, e.g. "Amazon.com Inc." -> "Amazon"; longest
+# alternatives first so " Inc." wins over " Inc"
+_SUFFIX_RE = re.compile(
+    '(?:' + '|'.join(re.escape(s) for s in sorted(COMPANY_SUFFIXES, key=len, reverse=True)) + r')+\s*$',
+    re.IGNORECASE
+)
+
+# Query parameters that only track the referrer; dropped when comparing URLs
+TRACKING_PARAMS = ('fbclid', 'gclid')
+TRACKING_PARAM_PREFIX = 'utm_'
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize a URL for duplicate detection (lowercase host, no tracking params or fragment)"""
+    if not url:
+        return url
+    
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.startswith(TRACKING_PARAM_PREFIX)
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+
+def _json_response(response: requests.Response) -> Any:
+    """Parse a JSON response body, with orjson straight from bytes when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@lru_cache(maxsize=256)
+def _word_boundary_pattern(term: str) -> re.Pattern:
+    """Compiled case-insensitive whole-word pattern for a term (e.g. a ticker)"""
+    return re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE)
+
 
 class NewsFetcher(BaseFetcher):
     """
@@ -41,7 +133,16 @@ class NewsFetcher(BaseFetcher):
         self.newsapi_base_url = "https://newsapi.org/v2/everything"
         self.gdelt_base_url = "https://api.gdeltproject.org/api/v2/doc/doc"
         
-        self.session = requests.Session()
+        # One connection pool for every thread; each thread gets its own
+        # Session on top of it (Session cookies/state aren't thread-safe)
+        self._adapter = HTTPAdapter(pool_connections=EXTRACTION_WORKERS, pool_maxsize=EXTRACTION_WORKERS)
+        self._local = threading.local()
+        
+        # One extraction pool per fetcher, so tickers fetched concurrently
+        # share EXTRACTION_WORKERS downloads instead of each starting their own
+        self._extraction_pool = ThreadPoolExecutor(
+            max_workers=EXTRACTION_WORKERS, thread_name_prefix='news-extract'
+        )
         
         # Business keywords for context scoring
         self.business_keywords = [
@@ -53,11 +154,36 @@ class NewsFetcher(BaseFetcher):
             'acquire', 'regulation', 'lawsuit', 'litigation', 'strike' 
         ]
         
+        # One-pass keyword scan: a lookahead alternation reports the longest
+        # keyword starting at each position; shorter keywords that are
+        # prefixes of it (share/shares) are credited via _business_implied
+        keywords = sorted(set(self.business_keywords), key=len, reverse=True)
+        self._business_re = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+        self._business_implied = {
+            kw: frozenset(k for k in keywords if kw.startswith(k)) for kw in keywords
+        }
+        
         logger.info(f"NewsFetcher initialized (mode={self.mode})")
+    
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's HTTP session (all share one connection pool)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+        return session
 
-    def _extract_name_variations(self, company_name: str) -> List[str]:
+    def _extract_name_variations(self, company_name: str) -> Tuple[str, ...]:
         """Generate common name variations for fuzzy matching"""
-        clean_name = self._clean_company_name(company_name)
+        return self._variations_cached(company_name)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _variations_cached(company_name: str) -> Tuple[str, ...]:
+        """Cached worker for _extract_name_variations (same name on every article)"""
+        clean_name = NewsFetcher._clean_company_name(company_name)
         words = clean_name.split()
         
         variations = set()
@@ -80,93 +206,156 @@ class NewsFetcher(BaseFetcher):
         if words and words[0].lower() == 'the':
             variations.add(' '.join(words[1:]))
         
-        return list(variations)
+        return tuple(variations)
 
-    def _calculate_fuzzy_scores(self, text: str, company_name: str, ticker: str) -> Dict[str, float]:
-        """Calculate multiple fuzzy matching scores"""
-        text_lower = text.lower()
-        company_lower = company_name.lower()
-        variations = self._extract_name_variations(company_name)
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _mention_matcher(company_name: str) -> Tuple[re.Pattern, Dict[str, int]]:
+        """
+        Single-scan counter for company name and variation mentions
         
-        scores = {}
+        The lookahead alternation reports the longest pattern starting at
+        each position; the weight of a match is the number of patterns
+        (with repeats) that are prefixes of it, so one findall reproduces
+        the sum of str.count() over every pattern.
         
-        # 1. Exact matches
-        scores['exact_company'] = 1.0 if company_lower in text_lower else 0.0
-        scores['exact_ticker'] = 1.0 if self._has_word_boundary_match(text, ticker) else 0.0
+        Returns:
+            (pattern, weight per matched string)
+        """
+        patterns = [company_name.lower()] + [
+            v.lower() for v in NewsFetcher._variations_cached(company_name) if len(v) >= 2
+        ]
+        patterns = [p for p in patterns if p]
         
-        # 2. Fuzzy matches for company name variations
-        fuzzy_scores = []
-        for variation in variations:
-            if len(variation) < 2:  # Skip very short variations
-                continue
-                
-            # Partial ratio (substring match)
-            partial_score = fuzz.partial_ratio(variation, text_lower) / 100.0
-            # Token set ratio (handles word order changes)
-            token_score = fuzz.token_set_ratio(variation, text_lower) / 100.0
-            # Weighted average
-            fuzzy_scores.append(max(partial_score, token_score * 0.8))
+        distinct = sorted(set(patterns), key=len, reverse=True)
+        regex = re.compile('(?=(' + '|'.join(map(re.escape, distinct)) + '))')
+        weights = {m: sum(1 for p in patterns if m.startswith(p)) for m in distinct}
         
-        scores['fuzzy_company'] = max(fuzzy_scores) if fuzzy_scores else 0.0
+        return regex, weights
+
+    def _batch_fuzzy_company(self, texts: List[str], company_name: str) -> np.ndarray:
+        """
+        Fuzzy company score for many texts at once
         
-        # 3. Position-based scoring
-        if text_lower.startswith(company_lower):
-            scores['position'] = 1.0
-        elif company_lower in text_lower[:100]:  # First 100 chars
-            scores['position'] = 0.7
-        else:
-            scores['position'] = 0.3
+        Scores every name variation against every text in a single
+        RapidFuzz cdist call per scorer instead of one Python call per pair.
         
-        return scores
+        Args:
+            texts: Lowercased texts to score
+            company_name: Company name
+            
+        Returns:
+            Array of fuzzy_company scores (0-1), one per text
+        """
+        variations = [
+            v.lower() for v in self._extract_name_variations(company_name)
+            if len(v) >= 2  # Skip very short variations
+        ]
+        if not variations or not texts:
+            return np.zeros(len(texts))
+        
+        # Partial ratio (substring match); texts are already lowercased,
+        # so skip RapidFuzz's per-call preprocessing
+        partial = process.cdist(variations, texts, scorer=fuzz.partial_ratio,
+                                processor=None, workers=-1)
+        # Token set ratio (handles word order changes)
+        token = process.cdist(variations, texts, scorer=fuzz.token_set_ratio,
+                              processor=None, workers=-1)
+        
+        # Best variation per text
+        return np.maximum(partial, token * 0.8).max(axis=0) / 100.0
 
-    def _analyze_semantic_context(self, text: str) -> Dict[str, float]:
-        """Analyze semantic context using business keywords"""
-        text_lower = text.lower()
+    def _score_components(
+        self,
+        title_lower: str,
+        full_lower: str,
+        company_name: str,
+        ticker: str,
+        fuzzy_company: Optional[float] = None,
+        ticker_re: Optional[re.Pattern] = None
+    ) -> Dict[str, float]:
+        """
+        Compute every relevance signal in one pass over the article text
         
-        # Count business keywords
-        business_matches = sum(1 for kw in self.business_keywords if kw in text_lower)
+        Takes the text already lowercased (see _article_texts), tokenizes
+        once and shares the buffers between the exact/fuzzy matching,
+        business context and mention density signals.
         
-        # Calculate business context score
-        word_count = len(text_lower.split())
-        business_score = min(business_matches / max(word_count / 50, 1), 1.0)
+        Args:
+            title_lower: Lowercased article title
+            full_lower: Lowercased title, description and content
+            company_name: Company name
+            ticker: Company ticker
+            fuzzy_company: Precomputed fuzzy score from _batch_fuzzy_company
+            ticker_re: Precompiled word-boundary ticker pattern
+            
+        Returns:
+            Component scores keyed like the weights in _calculate_relevance_score
+        """
+        if ticker_re is None:
+            ticker_re = _word_boundary_pattern(ticker)
         
-        return {
-            'business_context': business_score,
-            'has_org_entities': 0.5,  
-        }
-
-    def _calculate_mention_density(self, text: str, company_name: str, ticker: str) -> float:
-        """Calculate how densely the company is mentioned"""
-        text_lower = text.lower()
         company_lower = company_name.lower()
-        variations = self._extract_name_variations(company_name)
+        word_count = len(full_lower.split())
         
-        total_mentions = 0
+        # The title counts twice: the head of "title + full text" stands in
+        # for a title-weighted copy without duplicating the article body
+        weighted_head = f"{title_lower} {full_lower[:100]}"
         
-        # Count company name mentions
-        total_mentions += text_lower.count(company_lower)
+        scores = {}
         
-        # Count variation mentions
-        for variation in variations:
-            if len(variation) >= 2:
-                total_mentions += text_lower.count(variation.lower())
+        # 1. Exact matches
+        ticker_mentions = len(ticker_re.findall(full_lower))
+        scores['exact_company'] = 1.0 if company_lower in full_lower or company_lower in weighted_head else 0.0
+        scores['exact_ticker'] = 1.0 if ticker_mentions else 0.0
+        
+        # 2. Fuzzy matches for company name variations (precomputed in batch
+        # by fetch_by_ticker when available)
+        if fuzzy_company is None:
+            fuzzy_company = float(self._batch_fuzzy_company([full_lower], company_name)[0])
+        scores['fuzzy_company'] = fuzzy_company
+        
+        # 3. Business context: distinct business keywords present
+        found = set(self._business_re.findall(full_lower))
+        business_matches = len(frozenset().union(*(self._business_implied[m] for m in found)))
+        scores['business_context'] = min(business_matches / max(word_count / 50, 1), 1.0)
+        scores['has_org_entities'] = 0.5
+        
+        # 4. Position-based scoring
+        if weighted_head.startswith(company_lower):
+            scores['position'] = 1.0
+        elif company_lower in weighted_head[:100]:  # First 100 chars
+            scores['position'] = 0.7
+        else:
+            scores['position'] = 0.3
         
-        # Count ticker mentions with word boundaries
-        ticker_pattern = r'\b' + re.escape(ticker) + r'\b'
-        ticker_mentions = len(re.findall(ticker_pattern, text, re.IGNORECASE))
-        total_mentions += ticker_mentions
+        # 5. Mention density: company name, variations and ticker
+        mention_re, mention_weights = self._mention_matcher(company_name)
+        total_mentions = ticker_mentions + sum(
+            mention_weights[m] for m in mention_re.findall(full_lower)
+        )
         
-        # Normalize by text length
-        word_count = len(text_lower.split())
         density = total_mentions / max(word_count / 100, 1)  # Mentions per 100 words
+        scores['mention_density'] = min(density, 1.0)
+        
+        return scores
+
+    @staticmethod
+    def _article_texts(article: Dict) -> Tuple[str, str]:
+        """Return lowercased (title, full_text) for scoring; computed once per article"""
+        title = article.get("title", "")
+        description = article.get("description", "")
+        content = article.get("content", "")
         
-        return min(density, 1.0)
+        return title.lower(), f"{title} {description} {content}".lower()
 
     def _calculate_relevance_score(
         self,
         article: Dict,
         ticker: str,
-        company_name: str
+        company_name: str,
+        fuzzy_company: Optional[float] = None,
+        ticker_re: Optional[re.Pattern] = None
     ) -> float:
         """
         Enhanced relevance scoring with multiple signals
@@ -176,58 +365,89 @@ class NewsFetcher(BaseFetcher):
         - Fuzzy matching algorithms  
         - Business context analysis
         - Mention density
+        
+        Args:
+            article: Article dict
+            ticker: Company ticker
+            company_name: Company name
+            fuzzy_company: Precomputed fuzzy score from _batch_fuzzy_company
+            ticker_re: Precompiled word-boundary ticker pattern
         """
-        title = article.get("title", "")
-        description = article.get("description", "")
-        content = article.get("content", "")
+        if ticker_re is None:
+            ticker_re = _word_boundary_pattern(ticker)
         
-        # Combine text fields with weights
-        full_text = f"{title} {description} {content}"
-        weighted_text = f"{title} {title} {description} {content}"  # Title has double weight
+        title_lower, full_lower = self._article_texts(article)
         
-        # Calculate component scores
-        fuzzy_scores = self._calculate_fuzzy_scores(weighted_text, company_name, ticker)
-        semantic_scores = self._analyze_semantic_context(full_text)
-        mention_density = self._calculate_mention_density(full_text, company_name, ticker)
+        scores = self._score_components(title_lower, full_lower, company_name, ticker, fuzzy_company, ticker_re)
         
         # Weighted scoring
-        weights = {
-            # Fuzzy matching (40%)
-            'exact_company': 0.15,
-            'exact_ticker': 0.15,
-            'fuzzy_company': 0.10,
-            
-            # Semantic context (30%)
-            'business_context': 0.20,
-            'has_org_entities': 0.10,
+        total_score = sum(scores[name] * weight for name, weight in RELEVANCE_WEIGHTS.items())
+        
+        # Boost for title matches
+        if self._title_matches(title_lower, company_name, ticker, ticker_re):
+            total_score = min(total_score + TITLE_MATCH_BOOST, 1.0)
+        
+        return round(total_score, 3)
+
+    def _title_matches(self, title_lower: str, company_name: str, ticker: str, ticker_re: re.Pattern) -> bool:
+        """Exact company or ticker match in the lowercased title (no fuzzy pass needed)"""
+        return company_name.lower() in title_lower or self._has_word_boundary_match(title_lower, ticker, ticker_re)
+
+    def _score_articles(
+        self,
+        articles: List[Dict[str, Any]],
+        ticker: str,
+        company_name: str,
+        threshold: float
+    ) -> np.ndarray:
+        """
+        Relevance scores for a batch of articles
+        
+        Cheap signals are computed first; articles that cannot reach the
+        threshold even with a perfect fuzzy score skip the RapidFuzz pass.
+        The weighted sum runs as one (n, 7) @ (7,) matmul.
+        
+        Args:
+            articles: Articles to score
+            ticker: Company ticker
+            company_name: Company name
+            threshold: Minimum relevance score of interest
             
-            # Structural signals (30%)
-            'position': 0.10,
-            'mention_density': 0.20
-        }
+        Returns:
+            Scores rounded like _calculate_relevance_score; articles that
+            were skipped get their score without the fuzzy component
+            (below threshold either way)
+        """
+        if not articles:
+            return np.zeros(0)
         
-        # Combine scores
-        total_score = 0.0
+        ticker_re = _word_boundary_pattern(ticker)
+        fuzzy_idx = RELEVANCE_COMPONENTS.index('fuzzy_company')
         
-        # Add fuzzy scores
-        total_score += fuzzy_scores['exact_company'] * weights['exact_company']
-        total_score += fuzzy_scores['exact_ticker'] * weights['exact_ticker']
-        total_score += fuzzy_scores['fuzzy_company'] * weights['fuzzy_company']
+        components = np.empty((len(articles), len(RELEVANCE_COMPONENTS)))
+        boost = np.zeros(len(articles))
+        full_texts = []
         
-        # Add semantic scores
-        total_score += semantic_scores['business_context'] * weights['business_context']
-        total_score += semantic_scores['has_org_entities'] * weights['has_org_entities']
+        for i, article in enumerate(articles):
+            title_lower, full_lower = self._article_texts(article)
+            scores = self._score_components(title_lower, full_lower, company_name, ticker, 0.0, ticker_re)
+            components[i] = [scores[name] for name in RELEVANCE_COMPONENTS]
+            if self._title_matches(title_lower, company_name, ticker, ticker_re):
+                boost[i] = TITLE_MATCH_BOOST
+            full_texts.append(full_lower)
         
-        # Add structural scores
-        total_score += fuzzy_scores['position'] * weights['position']
-        total_score += mention_density * weights['mention_density']
+        # Upper bound with a perfect fuzzy match; only candidates need RapidFuzz
+        base = components @ RELEVANCE_WEIGHT_VECTOR + boost
+        upper = np.minimum(base + RELEVANCE_WEIGHT_VECTOR[fuzzy_idx], 1.0)
+        candidates = np.flatnonzero(np.round(upper, 3) >= threshold)
         
-        # Boost for title matches
-        title_fuzzy = self._calculate_fuzzy_scores(title, company_name, ticker)
-        if title_fuzzy['exact_company'] > 0 or title_fuzzy['exact_ticker'] > 0:
-            total_score = min(total_score + 0.1, 1.0)
+        if len(candidates):
+            texts = [full_texts[i] for i in candidates]
+            components[candidates, fuzzy_idx] = self._batch_fuzzy_company(texts, company_name)
         
-        return round(total_score, 3)
+        logger.debug(f"Fuzzy scoring {len(candidates)}/{len(articles)} articles")
+        
+        return np.round(np.minimum(components @ RELEVANCE_WEIGHT_VECTOR + boost, 1.0), 3)
 
     # ALL OTHER METHODS REMAIN EXACTLY THE SAME AS YOUR ORIGINAL CODE
     def fetch_by_ticker(
@@ -254,23 +474,14 @@ class NewsFetcher(BaseFetcher):
         
         logger.info(f"Fetching news for {ticker} ({company_name}) - last {days_back} days")
         
-        articles = []
+        # 1-2. Fetch NewsAPI and GDELT concurrently (independent hosts)
+        newsapi_articles, gdelt_articles = self._fetch_sources(ticker, company_name, days_back, max_records * 2)
         
-        # 1. Fetch from NewsAPI
-        if self.mode in ["newsapi", "auto"] and self.news_api_key:
-            try:
-                newsapi_articles = self._fetch_from_newsapi(ticker, company_name, days_back, max_records * 2)
-                articles.extend(newsapi_articles)
-            except Exception as e:
-                logger.error(f"NewsAPI fetch failed: {e}")
+        articles = list(newsapi_articles)
         
-        # 2. Fetch from GDELT (if needed)
-        if self.mode in ["gdelt", "auto"] and len(articles) < max_records:
-            try:
-                gdelt_articles = self._fetch_from_gdelt(ticker, company_name, days_back, max_records * 2)
-                articles.extend(gdelt_articles)
-            except Exception as e:
-                logger.error(f"GDELT fetch failed: {e}")
+        # GDELT tops up NewsAPI only when needed
+        if len(articles) < max_records:
+            articles.extend(gdelt_articles)
         
         if not articles:
             logger.warning(f"No articles found for {ticker}")
@@ -280,78 +491,150 @@ class NewsFetcher(BaseFetcher):
         unique_articles = self.deduplicate_articles(articles)
         
         # 4. Calculate relevance scores and filter
+        scores = self._score_articles(unique_articles, ticker, company_name, relevance_threshold)
+        
         relevant_articles = []
-        for article in unique_articles:
-            score = self._calculate_relevance_score(article, ticker, company_name)
+        for article, score in zip(unique_articles, scores.tolist()):
             article['relevance_score'] = score
             
             if score >= relevance_threshold:
                 relevant_articles.append(article)
         
-        # Sort by relevance (highest first)
-        relevant_articles.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-        
-        # Limit to max_records
-        final_articles = relevant_articles[:max_records]
+        # Top max_records by relevance (highest first)
+        final_articles = heapq.nlargest(
+            max_records, relevant_articles, key=lambda x: x.get('relevance_score', 0)
+        )
         
         logger.info(f"After filtering: {len(final_articles)} relevant articles")
         
-        # 5. Extract full content using newspaper3k
+        # 5. Extract full content using newspaper3k (downloads run concurrently,
+        # results keep relevance order)
         logger.info(f"Extracting full content for {len(final_articles)} articles...")
-        articles_with_content = []
+        total = len(final_articles)
         
-        for i, article in enumerate(final_articles):
-            url = article.get('url')
-            if not url:
-                logger.debug(f"[{i+1}/{len(final_articles)}] No URL, skipping")
-                continue
-            
-            # Check if content is truncated NewsAPI format
-            original_content = article.get('content', '')
-            is_truncated = '[+' in original_content and 'chars]' in original_content
-            
-            logger.debug(f"[{i+1}/{len(final_articles)}] URL: {url[:60]}...")
-            logger.debug(f"  Original content length: {len(original_content)} chars, truncated: {is_truncated}")
-            
-            try:
-                # Use newspaper3k to extract full article content
-                news_article = newspaper.Article(url)
-                news_article.download()
-                news_article.parse()
-                
-                # Get the full text content
-                full_text = news_article.text
-
-                logger.debug(f"  Newspaper3k extracted: {len(full_text)} chars")
-                
-                # Only keep articles with substantial content
-                if full_text and len(full_text) > 200:  # At least 200 chars
-                    article['content'] = full_text
-                    article['newsapi_truncated_content'] = original_content
-                    article['content_length'] = len(full_text)
-                    article['extraction_method'] = 'newspaper3k'
-                    article['authors'] = news_article.authors
-                    article['publish_date'] = news_article.publish_date
-                    articles_with_content.append(article)
-                    logger.debug(f"✓ [{i+1}/{len(final_articles)}] Extracted: {article.get('title', '')[:50]}... ({len(full_text)} chars)")
-                else:
-                    logger.debug(f"✗ [{i+1}/{len(final_articles)}] Insufficient content from: {article.get('title', '')[:50]}...")
-                    
-            except Exception as e:
-                logger.warning(f"✗ [{i+1}/{len(final_articles)}] Extraction failed: {str(e)[:100]}")
-                # Fallback: use NewsAPI content even if truncated
-                if len(original_content) > 50:
-                    article['extraction_method'] = 'newsapi_truncated'
-                    articles_with_content.append(article)
-                    logger.info(f"⚠ [{i+1}/{len(final_articles)}] Using NewsAPI content ({len(original_content)} chars)")
-                continue
+        extracted = self._extraction_pool.map(self._extract_one, final_articles, range(total), repeat(total))
+        articles_with_content = [a for a in extracted if a is not None]
 
         logger.info(f"Successfully extracted {len(articles_with_content)} articles")
         logger.info(f"  Full extractions: {sum(1 for a in articles_with_content if a.get('extraction_method') == 'newspaper3k')}")
+        logger.info(f"  Full API content: {sum(1 for a in articles_with_content if a.get('extraction_method') == 'newsapi_full')}")
         logger.info(f"  NewsAPI fallbacks: {sum(1 for a in articles_with_content if a.get('extraction_method') == 'newsapi_truncated')}")
 
         return articles_with_content
 
+    def _fetch_sources(
+        self,
+        ticker: str,
+        company_name: str,
+        days_back: int,
+        max_records: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch from NewsAPI and GDELT in parallel threads
+        
+        Args:
+            ticker: Company ticker
+            company_name: Company name
+            days_back: Number of days to look back
+            max_records: Max records to request from each source
+            
+        Returns:
+            (newsapi_articles, gdelt_articles); a source that is disabled
+            or fails contributes an empty list
+        """
+        sources = {}
+        if self.mode in ["newsapi", "auto"] and self.news_api_key:
+            sources['NewsAPI'] = self._fetch_from_newsapi
+        if self.mode in ["gdelt", "auto"]:
+            sources['GDELT'] = self._fetch_from_gdelt
+        
+        results = {}
+        if sources:
+            with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+                futures = {
+                    name: executor.submit(fetch, ticker, company_name, days_back, max_records)
+                    for name, fetch in sources.items()
+                }
+                for name, future in futures.items():
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"{name} fetch failed: {e}")
+        
+        return results.get('NewsAPI', []), results.get('GDELT', [])
+
+    def _extract_one(self, article: Dict[str, Any], i: int, total: int) -> Optional[Dict[str, Any]]:
+        """
+        Download and parse one article's full text with newspaper3k
+        
+        Args:
+            article: Article dict (updated in place)
+            i: Position in the extraction batch (for logging)
+            total: Batch size (for logging)
+            
+        Returns:
+            The article with full content, the article with its truncated
+            NewsAPI content as a fallback, or None if neither is usable
+        """
+        url = article.get('url')
+        if not url:
+            logger.debug(f"[{i+1}/{total}] No URL, skipping")
+            return None
+        
+        # Check if content is truncated NewsAPI format
+        original_content = article.get('content', '')
+        is_truncated = '[+' in original_content and 'chars]' in original_content
+        
+        logger.debug(f"[{i+1}/{total}] URL: {url[:60]}...")
+        logger.debug(f"  Original content length: {len(original_content)} chars, truncated: {is_truncated}")
+        
+        # Source already returned the full article; skip the download + parse
+        if not is_truncated and len(original_content) >= FULL_CONTENT_MIN_CHARS:
+            article['content_length'] = len(original_content)
+            article['extraction_method'] = 'newsapi_full'
+            logger.debug(f"✓ [{i+1}/{total}] Using full API content ({len(original_content)} chars)")
+            return article
+        
+        try:
+            # Download through this thread's session (pooled connections), then
+            # let newspaper3k parse the HTML
+            news_article = newspaper.Article(url)
+            cfg = news_article.config
+            response = self.session.get(url, **network.get_request_kwargs(
+                cfg.request_timeout, cfg.browser_user_agent, cfg.proxies, cfg.headers
+            ))
+            response.raise_for_status()
+            news_article.download(input_html=network.get_html_2XX_only(url, cfg, response=response))
+            news_article.parse()
+            
+            # Get the full text content
+            full_text = news_article.text
+
+            logger.debug(f"  Newspaper3k extracted: {len(full_text)} chars")
+            
+            # Only keep articles with substantial content
+            if full_text and len(full_text) > 200:  # At least 200 chars
+                article['content'] = full_text
+                article['newsapi_truncated_content'] = original_content
+                article['content_length'] = len(full_text)
+                article['extraction_method'] = 'newspaper3k'
+                article['authors'] = news_article.authors
+                article['publish_date'] = news_article.publish_date
+                logger.debug(f"✓ [{i+1}/{total}] Extracted: {article.get('title', '')[:50]}... ({len(full_text)} chars)")
+                return article
+            
+            logger.debug(f"✗ [{i+1}/{total}] Insufficient content from: {article.get('title', '')[:50]}...")
+                
+        except Exception as e:
+            logger.warning(f"✗ [{i+1}/{total}] Extraction failed: {str(e)[:100]}")
+            # Fallback: use NewsAPI content even if truncated
+            if len(original_content) > 50:
+                article['extraction_method'] = 'newsapi_truncated'
+                logger.info(f"⚠ [{i+1}/{total}] Using NewsAPI content ({len(original_content)} chars)")
+                return article
+        
+        return None
+
     def _fetch_from_newsapi(self, ticker: str, company_name: str, days_back: int, max_records: int) -> List[Dict[str, Any]]:
         """Fetch from NewsAPI"""
         if not self.news_api_key:
@@ -376,7 +659,7 @@ class NewsFetcher(BaseFetcher):
         response = self.session.get(self.newsapi_base_url, params=params, timeout=15)
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_response(response)
         
         if data.get('status') != 'ok':
             raise Exception(f"NewsAPI error: {data.get('message')}")
@@ -407,7 +690,7 @@ class NewsFetcher(BaseFetcher):
             return []
         
         try:
-            data = response.json()
+            data = _json_response(response)
             articles = self._parse_gdelt_response(data)
             
             # Filter English only
@@ -474,14 +757,12 @@ class NewsFetcher(BaseFetcher):
             return False
         
         # Check for non-Latin scripts
-        non_latin_pattern = r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0600-\u06ff\u0400-\u04ff]'
-        
-        if re.search(non_latin_pattern, text):
+        if _NON_LATIN_RE.search(text):
             return False
         
-        # Check Latin character ratio
-        latin_chars = sum(1 for c in text if c.isalpha() and ord(c) < 128)
-        total_chars = sum(1 for c in text if c.isalpha())
+        # Check Latin character ratio (counting stays in C)
+        latin_chars = len(text.encode('ascii', 'ignore').translate(None, _ASCII_NON_LETTERS))
+        total_chars = sum(map(str.isalpha, text))
         
         if total_chars == 0:
             return True
@@ -489,7 +770,7 @@ class NewsFetcher(BaseFetcher):
         return (latin_chars / total_chars) >= 0.8
     
     @staticmethod
-    def _has_word_boundary_match(text: str, term: str) -> bool:
+    def _has_word_boundary_match(text: str, term: str, pattern: Optional[re.Pattern] = None) -> bool:
         """
         Word-boundary matching - prevents false positives
         
@@ -497,13 +778,15 @@ class NewsFetcher(BaseFetcher):
         - "BAC stock rises" -> TRUE (BAC is standalone word)
         - "Chelsea's backup system" -> FALSE (bac is part of backup)
         - "$MSFT earnings" -> TRUE (MSFT with symbol prefix)
+        
+        Hot callers can pass the precompiled pattern for the term.
         """
         if not text or not term:
             return False
         
         # Match term as complete word, not substring
-        pattern = r'\b' + re.escape(term) + r'\b'
-        return bool(re.search(pattern, text, re.IGNORECASE))
+        pattern = pattern or _word_boundary_pattern(term)
+        return bool(pattern.search(text))
     
     def _filter_by_relevance(
         self,
@@ -526,14 +809,14 @@ class NewsFetcher(BaseFetcher):
         """
         filtered = []
         
-        for article in articles:
-            # Language check first
-            if not self._is_english(article.get('title', '')):
-                continue
-            
-            # Calculate relevance score
-            score = self._calculate_relevance_score(article, ticker, company_name)
-            
+        # Language check first
+        english = [a for a in articles if self._is_english(a.get('title', ''))]
+        
+        # Score the whole batch at once (vectorized weighted sum, fuzzy pass
+        # only for articles that can reach the threshold)
+        scores = self._score_articles(english, ticker, company_name, threshold)
+        
+        for article, score in zip(english, scores.tolist()):
             if score >= threshold:
                 article['relevance_score'] = round(score, 2)
                 filtered.append(article)
@@ -551,33 +834,19 @@ class NewsFetcher(BaseFetcher):
         return filtered
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def _clean_company_name(company_name: str) -> str:
         """Remove corporate suffixes"""
-        name = company_name
-        
-        suffixes = [
-            " Inc.", " Inc", " Corporation", " Corp.", " Corp",
-            " LLC", " L.L.C.", " Ltd.", " Ltd", " Company", " Co.",
-            " Co", " limited", " Limited", " li", " nv", " sa", 
-            " S.A.", " ag", " group", " holdings", " technologies", 
-            " international", " incorporated", " inc", " inc.", 
-            " plc", " PLC", ".com", " Platforms", " Group", " holdings"
-        ]
-        
-        for suffix in suffixes:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)]
-        
-        return name.strip()
+        return _SUFFIX_RE.sub('', company_name).strip()
     
     def deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicates"""
+        """Remove duplicates (same canonical URL or same title)"""
         seen_urls = set()
         seen_titles = set()
         deduplicated = []
         
         for article in articles:
-            url = article.get('url', '')
+            url = _canonical_url(article.get('url', ''))
             title = (article.get('title') or '').lower().strip()
             
             if url in seen_urls or title in seen_titles:
@@ -619,7 +888,7 @@ class NewsFetcher(BaseFetcher):
         try:
             response = self.session.get(self.newsapi_base_url, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = _json_response(response)
             
             if data.get('status') == 'ok':
                 return self._parse_newsapi_response(data)
@@ -648,7 +917,7 @@ class NewsFetcher(BaseFetcher):
             response.raise_for_status()
             
             if response.text and len(response.text) > 10:
-                data = response.json()
+                data = _json_response(response)
                 articles = self._parse_gdelt_response(data)
                 return [a for a in articles if self._is_english(a.get('title', ''))]
         except:
@@ -1,9 +1,16 @@
 # src/data_ingestion/sec_fetcher.py
 """Simplified SEC fetcher using edgartools to fetch entire 10-K and 10-Q filings"""
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import time
+import asyncio
+import itertools
+import os
+import pickle
+import tempfile
+import threading
 
 import sys
 from pathlib import Path
@@ -11,8 +18,44 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.utils.logging_config import get_logger
 
+try:
+    from edgar.files.htmltools import ChunkedDocument
+    from edgar.files.html_documents import HtmlDocument, TextBlock
+except ImportError:  # edgartools missing: SECFetcher() raises with install instructions
+    ChunkedDocument = HtmlDocument = TextBlock = None
+
 logger = get_logger(__name__)
 
+# Companies fetched concurrently; request pacing is left to edgartools'
+# process-wide limiter (EDGAR_RATE_LIMIT_PER_SEC, SEC allows 10 req/s)
+MAX_CONCURRENT_COMPANIES = 8
+
+# Sections with this many chars or fewer (after stripping) are skipped
+MIN_SECTION_CHARS = 100
+
+# Processed filings are cached by accession number (immutable once filed)
+DEFAULT_CACHE_DIR = ".cache/sec"
+
+# Parsed ChunkedDocuments kept in memory for retries (tens of MB each, keep small)
+CHUNKED_DOC_CACHE_SIZE = 8
+
+# Filing HTML bodies downloaded ahead of processing (paced by edgartools' limiter)
+HTML_PREFETCH_WORKERS = 4
+
+
+def _stripped_len_exceeds(text: str, n: int) -> bool:
+    """len(text.strip()) > n without copying the (possibly huge) string"""
+    if len(text) <= n:
+        return False
+    
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    
+    return end - start > n
+
 
 class SECFetcher:
     """
@@ -29,14 +72,20 @@ class SECFetcher:
     - edgartools package (pip install edgartools)
     """
     
-    def __init__(self, user_identity: str):
+    def __init__(self, user_identity: str, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
         """
         Initialize SEC fetcher with edgartools
         
         Args:
             user_identity: Email address for SEC compliance
                           (e.g., "your.name@example.com")
+            cache_dir: Directory for the on-disk filing cache
+                       ({cache_dir}/{cik}/{accession_no}.pkl), None to disable
         """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._chunked_docs: OrderedDict = OrderedDict()  # accession_no -> ChunkedDocument (LRU)
+        self._chunked_docs_lock = threading.Lock()
+        
         try:
             from edgar import set_identity
             set_identity(user_identity)
@@ -92,148 +141,179 @@ class SECFetcher:
             
             logger.info(f"Found {len(filings)} filings")
             
-            # Process each filing
-            results = []
-            for i, filing in enumerate(filings):
-                try:
-                    logger.info(f"Processing filing {i+1}/{len(filings)}: {filing.form} on {filing.filing_date}")
-                    
-                    # Extract fiscal year and quarter
-                    period = filing.period_of_report
-                    if isinstance(period, str):
-                        fiscal_year = int(period[:4])
-                    else:
-                        fiscal_year = period.year
-                    
-                    fiscal_quarter = self._get_fiscal_quarter(filing)
+            # Download HTML of upcoming uncached filings in the background while
+            # earlier ones are processed (bounded lookahead, see _prefetch_html)
+            prefetch_pool = ThreadPoolExecutor(max_workers=HTML_PREFETCH_WORKERS)
+            upcoming = iter(filings)
+            html_prefetch = deque()
+            try:
+                # Process each filing
+                results = []
+                total_filings = len(filings)
+                for i, filing in enumerate(filings):
+                    # Keep the next HTML_PREFETCH_WORKERS filings' HTML downloading
+                    self._prefetch_html(prefetch_pool, upcoming, html_prefetch)
+                    html_future = html_prefetch.popleft()
                     
-                    # Get structured document (TenK or TenQ object)
-                    # filing.obj() returns the appropriate report object based on form type
-                    doc = None
                     try:
-                        doc = filing.obj()
-                        logger.info(f"  Got document object: {type(doc).__name__}")
-                    except Exception as e:
-                        logger.warning(f"  Could not get document via filing.obj(): {e}")
-                    
-                    # Extract all sections using ChunkedDocument for proper block-level access
-                    sections_data = []
-                    
-                    if doc and hasattr(doc, 'items'):
-                        # Get list of all available items in the filing
-                        available_items = doc.items
-                        logger.info(f"  Found {len(available_items)} items: {available_items}")
+                        # Read filing properties once (edgartools resolves some lazily)
+                        form = filing.form
+                        filing_date = filing.filing_date
+                        accession_no = filing.accession_no
+                        filing_cik = filing.cik
                         
-                        # Create ChunkedDocument ONCE for the entire filing
-                        # This parses the HTML into blocks and associates them with items
-                        chunked_doc = None
+                        logger.info(f"Processing filing {i+1}/{total_filings}: {form} on {filing_date}")
+                        
+                        cached = self._load_cached_filing(filing_cik, accession_no)
+                        if cached is not None:
+                            logger.info(f"  ✓ Loaded from cache ({cached['total_sections']} sections)")
+                            results.append(cached)
+                            continue
+                        
+                        # Extract fiscal year and quarter
+                        period = filing.period_of_report
+                        if isinstance(period, str):
+                            fiscal_year = int(period[:4])
+                        else:
+                            fiscal_year = period.year
+                        
+                        fiscal_quarter = self._get_fiscal_quarter(filing)
+                        
+                        # Get structured document (TenK or TenQ object)
+                        # filing.obj() returns the appropriate report object based on form type
+                        doc = None
                         try:
-                            from edgar.files.htmltools import ChunkedDocument
-                            from edgar.files.html_documents import HtmlDocument
-                            chunked_doc = ChunkedDocument(filing.html())
-                            logger.debug(f"  Created ChunkedDocument for section-level block extraction")
-                        except Exception as chunk_err:
-                            logger.warning(f"  Could not create ChunkedDocument: {chunk_err}")
+                            doc = filing.obj()
+                            logger.info(f"  Got document object: {type(doc).__name__}")
+                        except Exception as e:
+                            logger.warning(f"  Could not get document via filing.obj(): {e}")
                         
-                        # Extract each section
-                        for item in available_items:
+                        # Extract all sections using ChunkedDocument for proper block-level access
+                        sections_data = []
+                        attempted_sections = []  # Every extracted section text, even below the length filter
+                        
+                        if doc and hasattr(doc, 'items'):
+                            # Get list of all available items in the filing
+                            available_items = doc.items
+                            logger.info(f"  Found {len(available_items)} items: {available_items}")
+                            section_entries = self._section_entries(doc)
+                            
+                            # Create ChunkedDocument ONCE for the entire filing
+                            # This parses the HTML into blocks and associates them with items
+                            chunked_doc = None
                             try:
-                                # Use bracket notation to get section text
-                                section_text = doc[item]
-                                
-                                if section_text and len(section_text.strip()) > 100:  # Filter very short sections
-                                    # Extract item number from item string (e.g., "Item 1" -> "1", "Item 1A" -> "1A")
-                                    item_code = item.replace("Item ", "").replace("ITEM ", "").strip()
-                                    
-                                    # Get section title from structure
-                                    section_title = self._get_section_title(doc, item)
+                                html = html_future.result() if html_future else None
+                                chunked_doc = self._get_chunked_document(filing, accession_no, html)
+                                logger.debug(f"  Created ChunkedDocument for section-level block extraction")
+                            except Exception as chunk_err:
+                                logger.warning(f"  Could not create ChunkedDocument: {chunk_err}")
+                            
+                            # Extract each section
+                            for item in available_items:
+                                try:
+                                    # Use bracket notation to get section text
+                                    section_text = doc[item]
+                                    if section_text:
+                                        attempted_sections.append(section_text)
                                     
-                                    # Get section-specific HTML blocks
-                                    section_html_doc = None
-                                    try:
-                                        if chunked_doc:
-                                            # Get chunks (blocks) for this specific item only
-                                            item_chunks = list(chunked_doc.chunks_for_item(item))
-                                            
-                                            if item_chunks:
-                                                # Flatten all blocks from all chunks for this section
-                                                section_blocks = []
-                                                for chunk in item_chunks:
-                                                    section_blocks.extend(chunk)  # chunk is a List[Block]
+                                    if section_text and _stripped_len_exceeds(section_text, MIN_SECTION_CHARS):  # Filter very short sections
+                                        # Extract item number from item string (e.g., "Item 1" -> "1", "Item 1A" -> "1A")
+                                        item_code = item.replace("Item ", "").replace("ITEM ", "").strip()
+                                        
+                                        # Get section title from structure
+                                        section_title = self._get_section_title(section_entries, item)
+                                        
+                                        # Get section-specific HTML blocks
+                                        section_html_doc = None
+                                        try:
+                                            if chunked_doc:
+                                                # Get chunks (blocks) for this specific item only
+                                                item_chunks = list(chunked_doc.chunks_for_item(item))
                                                 
-                                                # Create HtmlDocument from section-specific blocks
-                                                section_html_doc = HtmlDocument(blocks=section_blocks)
-                                                logger.debug(f"    Created HtmlDocument for {item} with {len(section_blocks)} blocks")
-                                            else:
-                                                logger.debug(f"    No chunks found for {item}, using fallback")
-                                    except Exception as html_err:
-                                        logger.debug(f"Could not extract blocks for {item}: {html_err}")
-                                    
-                                    # Fallback: create simple HTML from text
-                                    if section_html_doc is None:
-                                        fallback_html = f"<html><body><p>{section_text}</p></body></html>"
-                                        section_html_doc = HtmlDocument.from_html(fallback_html)
-                                        logger.debug(f"    Using fallback HTML for {item}")
-                                    
-                                    sections_data.append({
-                                        'section_code': item_code,
-                                        'section_name': section_title,
-                                        'section_text': section_text,
-                                        'section_html_doc': section_html_doc,  # HtmlDocument object with section-specific blocks
-                                        'section_length': len(section_text)
-                                    })
-                                    logger.info(f"    ✓ {item}: {section_title} ({len(section_text)} chars)")
+                                                if item_chunks:
+                                                    # Flatten all blocks from all chunks for this section
+                                                    section_blocks = list(itertools.chain.from_iterable(item_chunks))  # each chunk is a List[Block]
+                                                    
+                                                    # Create HtmlDocument from section-specific blocks
+                                                    section_html_doc = HtmlDocument(blocks=section_blocks)
+                                                    logger.debug(f"    Created HtmlDocument for {item} with {len(section_blocks)} blocks")
+                                                else:
+                                                    logger.debug(f"    No chunks found for {item}, using fallback")
+                                        except Exception as html_err:
+                                            logger.debug(f"Could not extract blocks for {item}: {html_err}")
+                                        
+                                        # Fallback: one text block per paragraph (no HTML round-trip)
+                                        if section_html_doc is None:
+                                            section_html_doc = HtmlDocument(blocks=[
+                                                TextBlock(para.strip() + "\n\n")
+                                                for para in section_text.split("\n\n")
+                                                if para.strip()
+                                            ])
+                                            logger.debug(f"    Using fallback text blocks for {item}")
+                                        
+                                        sections_data.append({
+                                            'section_code': item_code,
+                                            'section_name': section_title,
+                                            'section_text': section_text,
+                                            'section_html_doc': section_html_doc,  # HtmlDocument object with section-specific blocks
+                                            'section_length': len(section_text)
+                                        })
+                                        logger.info(f"    ✓ {item}: {section_title} ({len(section_text)} chars)")
+                                except Exception as e:
+                                    logger.warning(f"    ✗ Failed to extract {item}: {e}")
+                                    continue
+                        
+                        # Final fallback: use full document text
+                        if not sections_data:
+                            logger.warning(f"  No sections found in document, falling back to full text")
+                            # Fallback: single section from the item texts already extracted,
+                            # fetching the full document text only if those are empty
+                            try:
+                                full_text = "\n\n".join(attempted_sections)
+                                if not _stripped_len_exceeds(full_text, MIN_SECTION_CHARS):
+                                    full_text = filing.text()
+                                sections_data.append({
+                                    'section_code': 'FULL_DOCUMENT',
+                                    'section_name': 'Full Document',
+                                    'section_text': full_text,
+                                    'section_length': len(full_text)
+                                })
                             except Exception as e:
-                                logger.warning(f"    ✗ Failed to extract {item}: {e}")
+                                logger.error(f"  Failed to get full text fallback: {e}")
                                 continue
-                    
-                    # Final fallback: use full document text
-                    if not sections_data:
-                        logger.warning(f"  No sections found in document, falling back to full text")
-                        # Fallback: use full document text as single section
-                        try:
-                            full_text = filing.text()
-                            sections_data.append({
-                                'section_code': 'FULL_DOCUMENT',
-                                'section_name': 'Full Document',
-                                'section_text': full_text,
-                                'section_length': len(full_text)
-                            })
-                        except Exception as e:
-                            logger.error(f"  Failed to get full text fallback: {e}")
+                        
+                        if not sections_data:
+                            logger.warning(f"  No content extracted from filing")
                             continue
-                    
-                    if not sections_data:
-                        logger.warning(f"  No content extracted from filing")
+                        
+                        # Create filing result with sections
+                        filing_data = {
+                            'cik': filing_cik,
+                            'company': filing.company,
+                            'filing_type': form,
+                            'filing_date': str(filing_date),
+                            'fiscal_year': fiscal_year,
+                            'fiscal_quarter': fiscal_quarter,
+                            'accession_number': accession_no,
+                            'filing_url': filing.homepage_url,
+                            'sections': sections_data,  # List of sections with metadata
+                            'total_sections': len(sections_data),
+                            'total_length': sum(s['section_length'] for s in sections_data)
+                        }
+                        
+                        results.append(filing_data)
+                        self._store_cached_filing(filing_data)
+                        
+                        logger.info(f"  ✓ Extracted {len(sections_data)} sections, {filing_data['total_length']:,} total characters")
+                        
+                    except Exception as e:
+                        logger.error(f"  ✗ Failed to process filing {filing.accession_no}: {e}")
                         continue
-                    
-                    # Create filing result with sections
-                    filing_data = {
-                        'cik': filing.cik,
-                        'company': filing.company,
-                        'filing_type': filing.form,
-                        'filing_date': str(filing.filing_date),
-                        'fiscal_year': fiscal_year,
-                        'fiscal_quarter': fiscal_quarter,
-                        'accession_number': filing.accession_no,
-                        'filing_url': filing.homepage_url,
-                        'sections': sections_data,  # List of sections with metadata
-                        'total_sections': len(sections_data),
-                        'total_length': sum(s['section_length'] for s in sections_data)
-                    }
-                    
-                    results.append(filing_data)
-                    
-                    logger.info(f"  ✓ Extracted {len(sections_data)} sections, {filing_data['total_length']:,} total characters")
-                    
-                    # Rate limiting (be nice to SEC servers)
-                    time.sleep(0.1)
-                    
-                except Exception as e:
-                    logger.error(f"  ✗ Failed to process filing {filing.accession_no}: {e}")
-                    continue
+                
+            finally:
+                prefetch_pool.shutdown(wait=False, cancel_futures=True)
             
-            logger.info(f"Successfully fetched {len(results)}/{len(filings)} filings")
+            logger.info(f"Successfully fetched {len(results)}/{total_filings} filings")
             
             return results
             
@@ -241,6 +321,97 @@ class SECFetcher:
             logger.error(f"Failed to fetch filings for CIK {cik_str}: {e}")
             raise
     
+    def _prefetch_html(self, pool: ThreadPoolExecutor, upcoming, queue: deque):
+        """
+        Top up the HTML lookahead queue from the upcoming filings
+        
+        Adds one entry per filing, in order, until the queue holds the
+        current filing plus the next HTML_PREFETCH_WORKERS. An entry is a
+        Future of filing.html(), or None for filings in the disk cache, so
+        at most that many HTML bodies are in memory at once.
+        
+        Args:
+            pool: Executor running the downloads
+            upcoming: Iterator over the filings not yet queued
+            queue: Entries for queued filings not yet processed
+        """
+        while len(queue) <= HTML_PREFETCH_WORKERS:
+            filing = next(upcoming, None)
+            if filing is None:
+                return
+            cache_path = self._cache_path(filing.cik, filing.accession_no)
+            cached = cache_path is not None and cache_path.exists()
+            queue.append(None if cached else pool.submit(filing.html))
+    
+    def _get_chunked_document(self, filing, accession_no: str, html: Optional[str] = None):
+        """
+        Parse a filing's HTML into a ChunkedDocument, reusing recent parses
+        
+        Keyed on accession number (a filing never changes once filed); the
+        least recently used parse is dropped beyond CHUNKED_DOC_CACHE_SIZE.
+        
+        Args:
+            filing: edgartools Filing object
+            accession_no: Filing accession number
+            html: Already downloaded filing HTML, fetched here if None
+        """
+        with self._chunked_docs_lock:
+            chunked_doc = self._chunked_docs.get(accession_no)
+            if chunked_doc is not None:
+                self._chunked_docs.move_to_end(accession_no)
+                return chunked_doc
+        
+        chunked_doc = ChunkedDocument(html if html is not None else filing.html())
+        
+        with self._chunked_docs_lock:
+            self._chunked_docs[accession_no] = chunked_doc
+            if len(self._chunked_docs) > CHUNKED_DOC_CACHE_SIZE:
+                self._chunked_docs.popitem(last=False)
+        
+        return chunked_doc
+    
+    def _cache_path(self, cik: Any, accession_no: str) -> Optional[Path]:
+        """Cache file for a filing, or None when caching is disabled"""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / str(cik) / f"{accession_no}.pkl"
+    
+    def _load_cached_filing(self, cik: Any, accession_no: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a processed filing from the on-disk cache
+        
+        Returns:
+            Cached filing dict, or None on a miss or unreadable entry
+        """
+        cache_path = self._cache_path(cik, accession_no)
+        if cache_path is None or not cache_path.exists():
+            return None
+        
+        try:
+            with cache_path.open("rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"  Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+    
+    def _store_cached_filing(self, filing_data: Dict[str, Any]) -> None:
+        """Write a processed filing to the cache (atomically via temp file + rename)"""
+        cache_path = self._cache_path(filing_data['cik'], filing_data['accession_number'])
+        if cache_path is None:
+            return
+        
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                pickle.dump(filing_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"  Could not cache filing {filing_data['accession_number']}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
     def _get_fiscal_quarter(self, filing) -> Optional[int]:
         """
         Extract fiscal quarter from filing
@@ -287,78 +458,138 @@ class SECFetcher:
             logger.warning(f"Could not determine fiscal quarter: {e}")
             return None
     
-    def _get_section_title(self, doc, item: str) -> str:
+    def _section_entries(self, doc) -> Dict[str, Dict[str, Any]]:
         """
-        Get section title from TenK/TenQ structure
+        Flatten the TenK/TenQ structure into one item lookup, built once per filing
         
         Args:
             doc: TenK or TenQ object
+        
+        Returns:
+            Dict of upper-cased item key (e.g., "ITEM 1A") -> structure entry;
+            the first part listing an item wins
+        """
+        entries = {}
+        try:
+            if hasattr(doc, 'structure') and hasattr(doc.structure, 'structure'):
+                for part, items in doc.structure.structure.items():
+                    for item_key, entry in items.items():
+                        entries.setdefault(item_key, entry)
+        except Exception as e:
+            logger.warning(f"Could not read document structure: {e}")
+        return entries
+    
+    def _get_section_title(self, entries: Dict[str, Dict[str, Any]], item: str) -> str:
+        """
+        Get section title from the flattened TenK/TenQ structure
+        
+        Args:
+            entries: Item lookup from _section_entries
             item: Item name (e.g., "Item 1", "Item 1A")
         
         Returns:
             Section title from structure, or the item name if not found
         """
+        # Normalize item key: "Item 1" -> "ITEM 1"
+        entry = entries.get(item.upper())
+        if entry is None:
+            return item
+        return entry.get('Title', item)
+    
+    def _fetch_company(
+        self,
+        company: Dict[str, str],
+        filing_types: List[str],
+        start_date: str,
+        end_date: Optional[str] = None
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Fetch filings for one company, tagging each filing with its ticker
+        
+        Returns:
+            (ticker, filings); filings is empty if the fetch failed
+        """
+        ticker = company['ticker']
+        
         try:
-            # Normalize item key: "Item 1" -> "ITEM 1"
-            item_key = item.upper()
+            filings = self.fetch_filings_by_cik(
+                cik=company['cik'],
+                filing_types=filing_types,
+                start_date=start_date,
+                end_date=end_date
+            )
             
-            # Look through structure to find matching item
-            if hasattr(doc, 'structure') and hasattr(doc.structure, 'structure'):
-                for part, items in doc.structure.structure.items():
-                    if item_key in items:
-                        return items[item_key].get('Title', item)
+            # Add ticker to each filing
+            for filing in filings:
+                filing['ticker'] = ticker
+            
+            return ticker, filings
             
-            # Fallback: return the item name itself
-            return item
         except Exception as e:
-            logger.warning(f"Could not get title for {item}: {e}")
-            return item
+            logger.error(f"Failed to fetch filings for {ticker}: {e}")
+            return ticker, []
     
     def fetch_multiple_companies(
         self,
         companies: List[Dict[str, str]],
         filing_types: List[str],
         start_date: str,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        max_workers: int = MAX_CONCURRENT_COMPANIES
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Fetch filings for multiple companies
+        Fetch filings for multiple companies concurrently
         
         Args:
             companies: List of company dicts with 'cik' and 'ticker' keys
             filing_types: List of form types
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD), None = today
+            max_workers: Maximum companies fetched at once
         
         Returns:
-            Dict mapping ticker to list of filings
+            Dict mapping ticker to list of filings (in input order)
         """
-        results = {}
+        logger.info(f"Fetching {len(companies)} companies ({max_workers} concurrent)")
         
-        for i, company in enumerate(companies):
-            ticker = company['ticker']
-            cik = company['cik']
-            
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Fetching {ticker} ({i+1}/{len(companies)})")
-            logger.info(f"{'='*60}")
-            
-            try:
-                filings = self.fetch_filings_by_cik(
-                    cik=cik,
-                    filing_types=filing_types,
-                    start_date=start_date,
-                    end_date=end_date
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = executor.map(
+                lambda company: self._fetch_company(company, filing_types, start_date, end_date),
+                companies
+            )
+            return dict(fetched)
+    
+    async def fetch_multiple_companies_async(
+        self,
+        companies: List[Dict[str, str]],
+        filing_types: List[str],
+        start_date: str,
+        end_date: Optional[str] = None,
+        max_concurrency: int = MAX_CONCURRENT_COMPANIES
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Async variant of fetch_multiple_companies
+        
+        edgartools is blocking, so each company runs in a worker thread;
+        a semaphore bounds how many are in flight.
+        
+        Args:
+            companies: List of company dicts with 'cik' and 'ticker' keys
+            filing_types: List of form types
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD), None = today
+            max_concurrency: Maximum companies fetched at once
+        
+        Returns:
+            Dict mapping ticker to list of filings (in input order)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_one(company: Dict[str, str]) -> Tuple[str, List[Dict[str, Any]]]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._fetch_company, company, filing_types, start_date, end_date
                 )
-                
-                # Add ticker to each filing
-                for filing in filings:
-                    filing['ticker'] = ticker
-                
-                results[ticker] = filings
-                
-            except Exception as e:
-                logger.error(f"Failed to fetch filings for {ticker}: {e}")
-                results[ticker] = []
         
-        return results
+        fetched = await asyncio.gather(*(fetch_one(company) for company in companies))
+        return dict(fetched)
@@ -1,8 +1,9 @@
 # src/data_ingestion/wikipedia_fetcher.py
-"""Fetcher for Wikipedia pages using Wikipedia-API library"""
+"""Fetcher for Wikipedia pages using the MediaWiki action API"""
 
-import wikipediaapi
-from typing import Dict, Optional, Any, List
+import re
+import requests
+from typing import Dict, Optional, Any, List, Tuple
 from datetime import datetime 
 
 import sys
@@ -15,32 +16,42 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+USER_AGENT = "DataPipeline/1.0 (Educational Project)"
+REQUEST_TIMEOUT = 30
+MAX_LINKS = 50
+
+# Section headings in plaintext extracts with exsectionformat=wiki ("\n\n== History ==\n")
+_SECTION_HEADING_RE = re.compile(r"\n\n *(==+) (.*?) (==+) *\n")
+
+# Heading lines ("== History ==") and paragraph breaks for the HTML rendering
+_WIKI_HEADING_RE = re.compile(r'^(={2,6})\s*(.+?)\s*\1\s*$', re.M)
+_PARA_SPLIT_RE = re.compile(r'\n\n+')
+
 
 class WikipediaFetcher(BaseFetcher):
     """
-    Fetches Wikipedia pages using Wikipedia-API library
+    Fetches Wikipedia pages using the MediaWiki action API
     
     Features:
     - Gets English Wikipedia pages only
-    - Simpler interface than REST API
-    - Automatic page resolution
+    - One request per page (extract, categories, links and URL together)
+    - Automatic page resolution (redirects followed)
     """
     
     def __init__(self):
         """Initialize Wikipedia fetcher"""
         super().__init__(rate_limit=200.0, max_retries=3)
         
-        # Initialize Wikipedia-API client (English Wikipedia)
-        self.wiki = wikipediaapi.Wikipedia(
-            language='en',
-            user_agent='DataPipeline/1.0 (Educational Project)'
-        )
+        # Reused HTTP session (English Wikipedia)
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
         
-        logger.info("WikipediaFetcher initialized (Wikipedia-API library, English only)")
+        logger.info("WikipediaFetcher initialized (MediaWiki action API, English only)")
     
     def fetch(self, page_title: str) -> Dict[str, Any]:
         """
-        Fetch Wikipedia page using Wikipedia-API library
+        Fetch Wikipedia page in a single MediaWiki API request
         
         Args:
             page_title: Wikipedia page title (e.g., "Apple Inc.")
@@ -50,73 +61,134 @@ class WikipediaFetcher(BaseFetcher):
         """
         logger.info(f"Fetching Wikipedia page: {page_title}")
         
-        # Fetch page using Wikipedia-API
-        page = self.wiki.page(page_title)
+        page = self._query_page(page_title, {
+            'prop': 'extracts|categories|links|info',
+            'explaintext': 1,
+            'exsectionformat': 'wiki',
+            'cllimit': 'max',
+            'pllimit': MAX_LINKS,
+            'inprop': 'url'
+        })
         
-        if not page.exists():
+        if page is None:
             raise ValueError(f"Wikipedia page not found: {page_title}")
         
+        summary, sections = self._parse_extract(page.get('extract', ''))
+        text = self._compose_text(summary, sections)
+        
         # Extract content
         result = {
-            "page_title": page.title,
-            "page_url": page.fullurl,
-            "revision_id": page.pageid,  # Using page ID as revision tracking
-            "summary": page.summary,
-            "text_content": page.text,  # Full text content
-            "html_content": self._text_to_html(page.text, page.title),  # Convert to simple HTML
-            "sections": self._extract_sections(page),
-            "categories": list(page.categories.keys()) if page.categories else [],
-            "links": list(page.links.keys())[:50] if page.links else [],  # Limit to 50 links
-            "language": page.language,
+            "page_title": page['title'],
+            "page_url": page.get('fullurl', ''),
+            "revision_id": page['pageid'],  # Using page ID as revision tracking
+            "summary": summary,
+            "text_content": text,  # Full text content
+            "html_content": self._text_to_html(text, page['title']),  # Convert to simple HTML
+            "sections": sections,
+            "categories": [category['title'] for category in page.get('categories', [])],
+            "links": [link['title'] for link in page.get('links', [])][:MAX_LINKS],
+            "language": 'en',
             "timestamp": datetime.now().isoformat()
         }
         
         logger.info(
-            f"Fetched Wikipedia: {page.title} "
-            f"(ID: {page.pageid}, size: {len(page.text)} chars)"
+            f"Fetched Wikipedia: {page['title']} "
+            f"(ID: {page['pageid']}, size: {len(text)} chars)"
         )
         
         return result
     
-    def _extract_sections(self, page) -> List[Dict[str, str]]:
-        """Extract sections from Wikipedia page"""
-        sections = []
+    def _query_page(self, page_title: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run an action=query request for a single title
+        
+        Args:
+            page_title: Wikipedia page title
+            params: Extra query parameters (prop, limits, ...)
+        
+        Returns:
+            Page dict from the response, or None if the page doesn't exist
+        """
+        response = self.session.get(
+            WIKIPEDIA_API_URL,
+            params={
+                'action': 'query',
+                'format': 'json',
+                'formatversion': 2,
+                'redirects': 1,
+                'titles': page_title,
+                **params
+            },
+            timeout=REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        
+        pages = response.json().get('query', {}).get('pages', [])
+        if not pages or pages[0].get('missing') or pages[0].get('invalid'):
+            return None
+        return pages[0]
+    
+    @staticmethod
+    def _parse_extract(extract: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Split a plaintext extract into summary and flat section list
+        
+        Sections are in document order; level 1 is a top-level (==) heading.
+        
+        Returns:
+            (summary, sections)
+        """
+        matches = list(_SECTION_HEADING_RE.finditer(extract))
+        if not matches:
+            return extract.strip(), []
         
-        def extract_recursive(section_obj, level=1):
-            """Recursively extract sections"""
-            for section in section_obj:
-                sections.append({
-                    "title": section.title,
-                    "content": section.text,
-                    "level": level
-                })
-                
-                # Recursively get subsections
-                if section.sections:
-                    extract_recursive(section.sections, level + 1)
-        
-        if page.sections:
-            extract_recursive(page.sections)
-        
-        return sections
+        sections = []
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(extract)
+            sections.append({
+                "title": match.group(2).strip(),
+                "content": extract[match.end():end].strip(),
+                "level": len(match.group(1)) - 1
+            })
+        
+        return extract[:matches[0].start()].strip(), sections
+    
+    @staticmethod
+    def _compose_text(summary: str, sections: List[Dict[str, Any]]) -> str:
+        """Full page text: summary, then each section title followed by its content"""
+        parts = [summary + "\n\n"] if summary else []
+        for section in sections:
+            parts.append(f"{section['title']}\n{section['content']}")
+            if section['content']:
+                parts.append("\n\n")
+        return "".join(parts).strip()
     
     def _text_to_html(self, text: str, title: str) -> str:
         """Convert plain text to simple HTML"""
-        html = f"<html><head><title>{title}</title></head><body>"
-        html += f"<h1>{title}</h1>"
-        
-        # Convert text to paragraphs
-        paragraphs = text.split('\n\n')
-        for para in paragraphs:
-            if para.strip():
-                # Check if it's a heading (usually all caps or starts with ==)
-                if para.strip().isupper() or para.startswith('=='):
-                    html += f"<h2>{para.strip()}</h2>"
+        parts = ["<html><head><title>", title, "</title></head><body><h1>", title, "</h1>"]
+        
+        # Wiki headings (== ... ==) in one regex scan, paragraphs in between
+        pos = 0
+        for match in _WIKI_HEADING_RE.finditer(text):
+            self._append_paragraphs(parts, text[pos:match.start()])
+            level = len(match.group(1))
+            parts.append(f"<h{level}>{match.group(2)}</h{level}>")
+            pos = match.end()
+        self._append_paragraphs(parts, text[pos:])
+        
+        parts.append("</body></html>")
+        return "".join(parts)
+    
+    @staticmethod
+    def _append_paragraphs(parts: List[str], text: str):
+        """Append each paragraph of text as <p> (all-caps paragraphs as <h2>)"""
+        for para in _PARA_SPLIT_RE.split(text):
+            stripped = para.strip()
+            if stripped:
+                if stripped.isupper():
+                    parts.append(f"<h2>{stripped}</h2>")
                 else:
-                    html += f"<p>{para.strip()}</p>"
-        
-        html += "</body></html>"
-        return html
+                    parts.append(f"<p>{stripped}</p>")
     
     def fetch_by_ticker(self, ticker: str) -> Dict[str, Any]:
         """
@@ -145,8 +217,8 @@ class WikipediaFetcher(BaseFetcher):
     
     def get_page_id(self, page_title: str) -> int:
         """Get Wikipedia page ID (used as revision tracking)"""
-        page = self.wiki.page(page_title)
-        return page.pageid if page.exists() else 0
+        page = self._query_page(page_title, {'prop': 'info'})
+        return page['pageid'] if page else 0
     
     def has_page_changed(self, page_title: str, stored_page_id: int) -> bool:
         """Check if page changed (using page ID as proxy)"""
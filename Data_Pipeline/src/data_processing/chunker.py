@@ -1,8 +1,12 @@
 # src/data_processing/chunker.py
-"""Text chunking using LangChain RecursiveCharacterTextSplitter with tiktoken"""
+"""Token-native text chunking (encode once, slice token windows)"""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Callable
+from functools import lru_cache
+from collections import deque
+import copy
 import sys
+import threading
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -10,64 +14,242 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Chunk boundaries, best first: paragraph, line, sentence
+BOUNDARY_SEPARATORS = (b"\n\n", b"\n", b".")
+
+# How far back (fraction of chunk_size) a window end may move to reach a boundary
+BOUNDARY_LOOKBACK = 0.2
+
+ENCODING_NAME = "cl100k_base"
+
+# Literal separators for character-based splitting, coarsest first ("" = per character)
+CHARACTER_SEPARATORS = ("\n\n", "\n", " ", "")
+
+# (boundary rank, starts with whitespace) per token id, shared by all chunkers
+_TOKEN_INFOS: Dict[int, Tuple[int, bool]] = {}
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(name: str = ENCODING_NAME):
+    """Load a tiktoken encoding once per process (BPE file + Rust encoder setup)"""
+    import tiktoken
+    return tiktoken.get_encoding(name)
+
 
 class TextChunker:
     """
-    Text chunker using LangChain's RecursiveCharacterTextSplitter
+    Token-window text chunker
     
     Features:
-    - Exact token-based chunking using tiktoken
+    - Exact token-based chunking (text is encoded once)
+    - tiktoken by default, or the embedding model's own tokenizer
     - Overlap between chunks for context preservation
     - Sentence-boundary aware splitting
     - Preserves table references intact
     """
     
-    def __init__(self, chunk_size: int = 800, overlap: int = 100):
+    def __init__(self, chunk_size: int = 800, overlap: int = 100, tokenizer=None):
         """
         Initialize chunker
         
         Args:
             chunk_size: Target chunk size in tokens (exact)
             overlap: Overlap between chunks in tokens (exact)
+            tokenizer: Optional Hugging Face fast tokenizer to count tokens with
+                       (e.g. FinancialEmbedder.tokenizer); tiktoken if None
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.lookback = max(1, int(chunk_size * BOUNDARY_LOOKBACK))
+        self.tokenizer = tokenizer
+        self._local = threading.local()
         
-        # Initialize LangChain splitter with tiktoken
-        try:
-            from langchain_text_splitters import RecursiveCharacterTextSplitter
-            import tiktoken
-            
-            self.encoding = tiktoken.get_encoding("cl100k_base")
-            
-            self.splitter = RecursiveCharacterTextSplitter(
-                chunk_size=chunk_size,
-                chunk_overlap=overlap,
-                length_function=lambda text: len(self.encoding.encode(text)),
-                separators=["\n\n", "\n", ". ", " ", ""],
-                keep_separator=True,
-                is_separator_regex=False
+        if tokenizer is not None:
+            logger.info(
+                f"TextChunker initialized: {chunk_size} tokens (exact), "
+                f"overlap: {overlap} tokens ({type(tokenizer).__name__})"
             )
+            return
+        
+        try:
+            self.encoding = _get_encoding()
             
             logger.info(
                 f"TextChunker initialized: {chunk_size} tokens (exact), "
                 f"overlap: {overlap} tokens (tiktoken)"
             )
-            
+        
         except ImportError as e:
-            logger.error(f"LangChain/tiktoken required: {e}")
+            logger.error(f"tiktoken required: {e}")
             raise
     
-    def chunk_text(self, text: str) -> List[str]:
-        """Chunk text using LangChain splitter"""
-        if not text or not text.strip():
+    @classmethod
+    def for_embedder(cls, embedder, chunk_size: int = 800, overlap: int = 100) -> 'TextChunker':
+        """
+        Chunker that measures tokens with the embedder's tokenizer
+        
+        chunk_size is capped at what the model reads (max_seq_length minus
+        special tokens), so chunks are never silently truncated at embed time.
+        
+        Args:
+            embedder: FinancialEmbedder instance
+            chunk_size: Target chunk size in tokens
+            overlap: Overlap between chunks in tokens
+        """
+        tokenizer = embedder.tokenizer
+        limit = embedder.max_seq_length - tokenizer.num_special_tokens_to_add()
+        if chunk_size > limit:
+            logger.warning(
+                f"chunk_size {chunk_size} exceeds the embedding model's {limit} "
+                f"token input, using {limit}"
+            )
+            chunk_size = limit
+        
+        return cls(chunk_size=chunk_size, overlap=overlap, tokenizer=tokenizer)
+    
+    def count_tokens(self, text: str) -> int:
+        """Number of tokens in text (same tokenizer the chunks are sized with)"""
+        if self.tokenizer is not None:
+            return len(self._hf_encode(text)['input_ids'])
+        return len(self.encoding.encode(text))
+    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Token count per text, with one batched tokenizer call instead of one per text"""
+        if not texts:
             return []
+        if self.tokenizer is not None:
+            return [len(ids) for ids in self._hf_encode(texts)['input_ids']]
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(texts)]
+    
+    def _thread_tokenizer(self):
+        """
+        This thread's copy of the Hugging Face tokenizer
+        
+        Fast tokenizers are not thread-safe: a call that toggles truncation
+        while another thread encodes raises "Already borrowed". The tokenizer
+        is shared with the embedder and chunking runs on worker threads, so
+        each thread encodes with its own deep copy.
+        """
+        tokenizer = getattr(self._local, 'tokenizer', None)
+        if tokenizer is None:
+            tokenizer = self._local.tokenizer = copy.deepcopy(self.tokenizer)
+        return tokenizer
+    
+    def _hf_encode(self, text: str, offsets: bool = False):
+        """Encode with this thread's Hugging Face tokenizer (no special tokens, no length warning)"""
+        return self._thread_tokenizer()(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=offsets,
+            verbose=False
+        )
+    
+    def _token_info(self, token: int) -> Tuple[int, bool]:
+        """
+        Boundary rank of a token and whether it starts with whitespace
+        
+        Rank as a chunk end: 3 paragraph, 2 line, 1 sentence, 0 none.
+        """
+        info = _TOKEN_INFOS.get(token)
+        if info is None:
+            token_bytes = self.encoding.decode_single_token_bytes(token)
+            rank = 0
+            for i, separator in enumerate(BOUNDARY_SEPARATORS):
+                if token_bytes.rstrip(b" ").endswith(separator):
+                    rank = len(BOUNDARY_SEPARATORS) - i
+                    break
+            info = (rank, token_bytes[:1].isspace())
+            _TOKEN_INFOS[token] = info
+        return info
+    
+    def _tiktoken_rank(self, tokens: List[int]) -> Callable[[int], int]:
+        """Boundary rank of ending a chunk after tokens[i], for tiktoken tokens"""
+        def rank_at(i: int) -> int:
+            rank = self._token_info(tokens[i])[0]
+            # A period only ends a sentence when whitespace follows ("3.5" doesn't)
+            if rank == 1 and not self._token_info(tokens[i + 1])[1]:
+                return 0
+            return rank
+        return rank_at
+    
+    @staticmethod
+    def _offset_rank(text: str, offsets: List[Tuple[int, int]]) -> Callable[[int], int]:
+        """
+        Boundary rank of ending a chunk after token i, from character offsets
+        
+        Used with tokenizers that drop whitespace: the gap between token i and
+        token i + 1 in the original text decides the boundary.
+        """
+        def rank_at(i: int) -> int:
+            token_end = offsets[i][1]
+            gap = text[token_end:offsets[i + 1][0]]
+            if "\n\n" in gap:
+                return 3
+            if "\n" in gap:
+                return 2
+            if gap and text[token_end - 1] == ".":
+                return 1
+            return 0
+        return rank_at
+    
+    def _window_end(self, n_tokens: int, start: int, boundary_rank: Callable[[int], int]) -> int:
+        """End index of the window starting at start, snapped back to the best nearby boundary"""
+        end = start + self.chunk_size
+        if end >= n_tokens:
+            return n_tokens
+        
+        best_rank, best_end = 0, end
+        # Never snap into the overlap region so every window makes progress
+        floor = max(start + self.overlap + 1, end - self.lookback)
+        for i in range(end - 1, floor - 1, -1):
+            rank = boundary_rank(i)
+            if rank > best_rank:
+                best_rank, best_end = rank, i + 1
+                if rank == len(BOUNDARY_SEPARATORS):
+                    break
+        return best_end
+    
+    def _windows(self, n_tokens: int, boundary_rank: Callable[[int], int]) -> List[Tuple[int, int]]:
+        """(start, end) token index pairs of the overlapping windows"""
+        windows = []
+        start = 0
+        while start < n_tokens:
+            end = self._window_end(n_tokens, start, boundary_rank)
+            windows.append((start, end))
+            if end >= n_tokens:
+                break
+            start = max(end - self.overlap, start + 1)
+        return windows
+    
+    def _split(self, text: str) -> Tuple[List[str], List[int]]:
+        """Split text into chunks; returns (chunks, token count per chunk)"""
+        if not text or not text.strip():
+            return [], []
+        
+        if self.tokenizer is None:
+            tokens = self.encoding.encode(text)
+            windows = self._windows(len(tokens), self._tiktoken_rank(tokens))
+            pieces = self.encoding.decode_batch([tokens[start:end] for start, end in windows])
+        else:
+            # Slice the original text by character offsets (keeps its formatting)
+            offsets = self._hf_encode(text, offsets=True)['offset_mapping']
+            windows = self._windows(len(offsets), self._offset_rank(text, offsets))
+            pieces = [text[offsets[start][0]:offsets[end - 1][1]] for start, end in windows]
         
-        chunks = self.splitter.split_text(text)
-        chunks = [c.strip() for c in chunks if c.strip()]
+        chunks, token_counts = [], []
+        for (start, end), chunk in zip(windows, pieces):
+            chunk = chunk.strip()
+            if chunk:
+                chunks.append(chunk)
+                token_counts.append(end - start)
+        
+        return chunks, token_counts
+    
+    def chunk_text(self, text: str) -> List[str]:
+        """Chunk text into overlapping token windows"""
+        chunks, token_counts = self._split(text)
         
         if chunks:
-            token_counts = [len(self.encoding.encode(c)) for c in chunks]
             logger.debug(
                 f"Chunked: {len(chunks)} chunks, "
                 f"tokens: min={min(token_counts)}, max={max(token_counts)}, "
@@ -77,18 +259,109 @@ class TextChunker:
         return chunks
     
     def chunk_with_metadata(self, text: str, base_metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
-        chunks = self.chunk_text(text)
+        chunks, token_counts = self._split(text)
         
         result = []
-        for i, chunk_text in enumerate(chunks):
+        for i, (chunk_text, chunk_tokens) in enumerate(zip(chunks, token_counts)):
             chunk_data = {
                 **base_metadata,
                 'chunk_text': chunk_text,
                 'chunk_index': i,
                 'total_chunks': len(chunks),
                 'chunk_length': len(chunk_text),
-                'chunk_tokens': len(self.encoding.encode(chunk_text))
+                'chunk_tokens': chunk_tokens
             }
             result.append(chunk_data)
         
         return result
+
+
+class CharacterSplitter:
+    """
+    Recursive character splitter with plain string operations
+    
+    Same chunk boundaries as LangChain's RecursiveCharacterTextSplitter with
+    literal separators, length=len and the default keep_separator/strip
+    settings, but separators are found with `in`/str.split instead of
+    building and running a regex on every piece of every text.
+    """
+    
+    def __init__(self, chunk_size: int = 768, overlap: int = 256, separators=CHARACTER_SEPARATORS):
+        """
+        Initialize splitter
+        
+        Args:
+            chunk_size: Maximum chunk size in characters
+            overlap: Overlap between chunks in characters
+            separators: Literal separators to try, coarsest first
+        """
+        if overlap > chunk_size:
+            raise ValueError(f"overlap ({overlap}) must not exceed chunk_size ({chunk_size})")
+        
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.separators = tuple(separators)
+    
+    def split_text(self, text: str) -> List[str]:
+        """Split text into chunks of at most chunk_size characters where possible"""
+        return self._split(text, self.separators)
+    
+    @staticmethod
+    def _split_keep(text: str, separator: str) -> List[str]:
+        """Split on separator, keeping each separator at the start of the piece it precedes"""
+        if not separator:
+            return list(text)
+        first, *rest = text.split(separator)
+        pieces = [first] + [separator + piece for piece in rest]
+        return [piece for piece in pieces if piece]
+    
+    def _split(self, text: str, separators: Tuple[str, ...]) -> List[str]:
+        """Split on the first separator present, recursing into pieces that are still too long"""
+        separator = separators[-1]
+        finer = ()
+        for i, candidate in enumerate(separators):
+            if not candidate:
+                separator = candidate
+                break
+            if candidate in text:
+                separator = candidate
+                finer = separators[i + 1:]
+                break
+        
+        chunks = []
+        small = []
+        for piece in self._split_keep(text, separator):
+            if len(piece) < self.chunk_size:
+                small.append(piece)
+                continue
+            if small:
+                chunks.extend(self._merge(small))
+                small = []
+            if finer:
+                chunks.extend(self._split(piece, finer))
+            else:
+                chunks.append(piece)
+        if small:
+            chunks.extend(self._merge(small))
+        return chunks
+    
+    def _merge(self, pieces: List[str]) -> List[str]:
+        """Greedily join pieces into chunks, carrying up to overlap characters into the next"""
+        chunks = []
+        window = deque()
+        total = 0
+        for piece in pieces:
+            size = len(piece)
+            if window and total + size > self.chunk_size:
+                chunk = "".join(window).strip()
+                if chunk:
+                    chunks.append(chunk)
+                # Drop from the front until the carried text fits the overlap and the new piece
+                while total > self.overlap or (total and total + size > self.chunk_size):
+                    total -= len(window.popleft())
+            window.append(piece)
+            total += size
+        chunk = "".join(window).strip()
+        if chunk:
+            chunks.append(chunk)
+        return chunks
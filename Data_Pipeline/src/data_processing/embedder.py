@@ -1,11 +1,8 @@
 # src/data_processing/embedder.py
 """Text embedding using FinE5 model optimized for financial text"""
 
-from sentence_transformers import SentenceTransformer
-from typing import List, Union
+from typing import Iterator, List, Tuple, Union
 import numpy as np
-import torch
-from transformers import AutoModel
 
 import sys
 from pathlib import Path
@@ -15,6 +12,9 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Chunks per batch yielded by embed_chunks (bounds peak embedding memory)
+STREAM_BATCH_SIZE = 1024
+
 
 class FinancialEmbedder:
     """
@@ -36,7 +36,9 @@ class FinancialEmbedder:
                     'model_name': 'FinanceMTEB/FinE5',
                     'device': 'cpu' or 'cuda',
                     'batch_size': 32,
-                    'max_length': 512
+                    'max_length': 512,
+                    'compile': torch.compile the transformer on CUDA (default False),
+                    'cpu_bf16': run in bfloat16 on CPU, for AMX/AVX512-BF16 CPUs (default False)
                 }
         """
         self.config = config
@@ -45,6 +47,10 @@ class FinancialEmbedder:
         self.batch_size = config.get('batch_size', 32)
         self.max_length = config.get('max_length', 512)
         
+        # Heavy imports deferred until an embedder is actually built
+        import torch
+        from sentence_transformers import SentenceTransformer
+        
         # Check GPU availability
         if self.device == 'cuda' and not torch.cuda.is_available():
             logger.warning("CUDA requested but not available, falling back to CPU")
@@ -52,11 +58,24 @@ class FinancialEmbedder:
         
         # Load model
         logger.info(f"Loading embedding model: {self.model_name} on {self.device}")
-        self.model = SentenceTransformer(self.model_name)
+        self.model = SentenceTransformer(self.model_name, device=self.device)
+        
+        # Reduced-precision inference: FP16 on GPU, optional BF16 on CPU
+        if self.device == 'cuda':
+            self.model.half()
+            if config.get('compile', False):
+                # Variable sequence lengths recompile per new shape; worth it for long jobs
+                self.model[0].auto_model = torch.compile(self.model[0].auto_model, mode="reduce-overhead")
+        elif config.get('cpu_bf16', False):
+            self.model.to(torch.bfloat16)
         
         # Get embedding dimension
         self.embedding_dim = self.model.get_sentence_embedding_dimension()
         
+        # Shared with TextChunker.for_embedder so chunks are sized in model tokens
+        self.tokenizer = self.model.tokenizer
+        self.max_seq_length = self.model.max_seq_length
+        
         logger.info(f"Embedder initialized: dim={self.embedding_dim}, device={self.device}")
     
     def embed(self, texts: Union[str, List[str]], 
@@ -75,39 +94,65 @@ class FinancialEmbedder:
         if isinstance(texts, str):
             texts = [texts]
         
+        import torch
+        
         # Embed
-        embeddings = self.model.encode(
-            texts,
-            batch_size=self.batch_size,
-            show_progress_bar=show_progress,
-            normalize_embeddings=True,  # L2 normalize for cosine similarity
-            convert_to_numpy=True
-        )
-        
-        return embeddings
+        with torch.inference_mode():
+            embeddings = self.model.encode(
+                texts,
+                batch_size=self.batch_size,
+                show_progress_bar=show_progress,
+                normalize_embeddings=True,  # L2 normalize for cosine similarity
+                convert_to_numpy=True
+            )
+        
+        # FP16/BF16 models still hand back float32 vectors
+        return embeddings.astype(np.float32, copy=False)
     
-    def embed_chunks(self, chunks: List[str], 
-                    show_progress: bool = True) -> List[List[float]]:
+    def embed_chunks(self, chunks: List[str],
+                    batch_size: int = STREAM_BATCH_SIZE,
+                    show_progress: bool = True) -> Iterator[Tuple[List[str], np.ndarray]]:
         """
-        Embed multiple chunks (convenience method)
+        Embed multiple chunks, yielding fixed-size batches
+        
+        Only one batch of embeddings is alive at a time, so callers can write
+        each batch to the vector store before the next one is computed.
+        Identical chunks within a batch (repeated boilerplate) are embedded once.
         
         Args:
             chunks: List of text chunks
+            batch_size: Chunks per yielded batch
             show_progress: Show progress bar
         
-        Returns:
-            List of embedding vectors
+        Yields:
+            (batch_texts, float32 array of shape (len(batch_texts), embedding_dim))
         """
         logger.info(f"Embedding {len(chunks)} chunks...")
         
-        embeddings = self.embed(chunks, show_progress=show_progress)
-        
-        # Convert to list of lists (for JSON serialization)
-        embeddings_list = [emb.tolist() for emb in embeddings]
+        for start in range(0, len(chunks), batch_size):
+            batch = chunks[start:start + batch_size]
+            yield batch, self._embed_unique(batch, show_progress=show_progress)
         
         logger.info(f"Embedded {len(chunks)} chunks successfully")
-        
-        return embeddings_list
+    
+    def _embed_unique(self, texts: List[str], show_progress: bool = False) -> np.ndarray:
+        """Embed texts, encoding each distinct text once and scattering rows back"""
+        first_index = {}
+        unique_texts = []
+        positions = []
+        for text in texts:
+            position = first_index.get(text)
+            if position is None:
+                position = first_index[text] = len(unique_texts)
+                unique_texts.append(text)
+            positions.append(position)
+        
+        embeddings = self.embed(unique_texts, show_progress=show_progress)
+        if len(unique_texts) == len(texts):
+            return embeddings
+        
+        logger.debug(f"Skipped {len(texts) - len(unique_texts)} duplicate chunks")
+        return embeddings[positions]
     
     def embed_query(self, query: str) -> List[float]:
         """
@@ -131,4 +176,5 @@ class FinancialEmbedder:
         if hasattr(self, 'model'):
             del self.model
             if self.device == 'cuda':
+                import torch
                 torch.cuda.empty_cache()
\ No newline at end of file
@@ -2,9 +2,14 @@
 """Parser for news article structure"""
 
 from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -13,6 +18,46 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Tags the extractors read (each kept with its subtree); everything else is never built
+PARSE_ONLY = SoupStrainer(['title', 'h1', 'meta', 'article', 'div', 'main', 'p', 'time', 'a', 'body'])
+
+# Removed before body extraction; a SoupStrainer can't drop these, since it keeps
+# the whole subtree of any matched tag (e.g. <body>)
+BOILERPLATE_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'form']
+
+# Compiled once instead of on every parse
+_TITLE_SPLIT_RE = re.compile(r'\s+[-|]\s+')  # "Headline - Site Name"
+_ARTICLE_CLASS_RE = re.compile(r'article|content|post|entry|story', re.I)
+_AUTHOR_RE = re.compile(r'author|byline|writer', re.I)
+_WORD_RE = re.compile(r'\S+')
+
+# Common article containers, cheapest/most specific first (regex attribute scans last)
+# Each (tag, attrs) has a CSS equivalent in FAST_ARTICLE_SELECTORS
+ARTICLE_SELECTORS = [
+    ('article', {}),
+    ('main', {}),
+    ('div', {'role': 'main'}),
+    ('div', {'class': _ARTICLE_CLASS_RE}),
+    ('div', {'id': _ARTICLE_CLASS_RE})
+]
+
+# selectolax versions of ARTICLE_SELECTORS: CSS selector, or (attribute, regex) over <div>s
+FAST_ARTICLE_SELECTORS = [
+    'article',
+    'main',
+    'div[role="main"]',
+    ('class', _ARTICLE_CLASS_RE),
+    ('id', _ARTICLE_CLASS_RE)
+]
+
+# A container with at least this much text is taken without trying further selectors
+MIN_ARTICLE_CHARS = 500
+
+
+def _word_count(text: str) -> int:
+    """Same count as len(text.split()) without building the list of words"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
 
 class NewsParser:
     """
@@ -25,9 +70,20 @@ class NewsParser:
     - Handles various news site structures
     """
     
-    def __init__(self):
-        """Initialize news parser"""
-        logger.info("NewsParser initialized")
+    def __init__(self, use_selectolax: bool = True):
+        """
+        Initialize news parser
+        
+        Args:
+            use_selectolax: Parse with selectolax (C parser, much faster) when it is
+                            installed; False keeps the BeautifulSoup path
+        """
+        self.use_selectolax = use_selectolax and HTMLParser is not None
+        
+        if use_selectolax and HTMLParser is None:
+            logger.warning("selectolax not installed, using BeautifulSoup")
+        
+        logger.info(f"NewsParser initialized ({'selectolax' if self.use_selectolax else 'BeautifulSoup'})")
     
     def parse(
         self,
@@ -50,19 +106,29 @@ class NewsParser:
         """
         logger.info(f"Parsing news article: {article_url[:60]}...")
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Both backends extract in the same order (body extraction drops boilerplate)
+        if self.use_selectolax:
+            doc = HTMLParser(html_content)
+            extract_title, extract_body, extract_date, extract_author = (
+                self._fast_title, self._fast_article_body, self._fast_date, self._fast_author
+            )
+        else:
+            doc = self._make_soup(html_content)
+            extract_title, extract_body, extract_date, extract_author = (
+                self._extract_title, self._extract_article_body, self._extract_date, self._extract_author
+            )
         
         # Use provided title or extract
-        title = article_title or self._extract_title(soup)
+        title = article_title or extract_title(doc)
         
         # Extract article body
-        body = self._extract_article_body(soup)
+        body = extract_body(doc)
         
         # Use provided date or extract
-        pub_date = published_date or self._extract_date(soup)
+        pub_date = published_date or extract_date(doc)
         
         # Extract author
-        author = self._extract_author(soup)
+        author = extract_author(doc)
         
         result = {
             "title": title,
@@ -70,7 +136,7 @@ class NewsParser:
             "author": author,
             "published_date": pub_date,
             "url": article_url,
-            "word_count": len(body.split()) if body else 0
+            "word_count": _word_count(body) if body else 0
         }
         
         logger.info(
@@ -79,6 +145,14 @@ class NewsParser:
         
         return result
     
+    def _make_soup(self, html_content: str) -> BeautifulSoup:
+        """Parse with lxml (C parser), falling back to the pure-Python html.parser"""
+        try:
+            return BeautifulSoup(html_content, 'lxml', parse_only=PARSE_ONLY)
+        except Exception as e:
+            logger.warning(f"lxml parse failed, using html.parser: {e}")
+            return BeautifulSoup(html_content, 'html.parser', parse_only=PARSE_ONLY)
+    
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract article title (PRODUCTION-READY)"""
         # Method 1: <title> tag
@@ -86,7 +160,7 @@ class NewsParser:
         if title_tag:
             title = title_tag.get_text().strip()
             # Remove site name
-            title = re.split(r'\s+[-|]\s+', title)[0]
+            title = _TITLE_SPLIT_RE.split(title, maxsplit=1)[0]
             return title
         
         # Method 2: h1
@@ -103,24 +177,21 @@ class NewsParser:
     
     def _extract_article_body(self, soup: BeautifulSoup) -> str:
         """Extract article body (PRODUCTION-READY)"""
-        # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'form']):
-            element.decompose()
-        
-        # Try common article selectors
-        selectors = [
-            ('article', {}),
-            ('div', {'class': re.compile(r'article|content|post|entry|story', re.I)}),
-            ('div', {'id': re.compile(r'article|content|post|entry|story', re.I)}),
-            ('main', {}),
-            ('div', {'role': 'main'})
-        ]
+        # Remove unwanted elements (detach only; decompose() would walk and destroy every descendant)
+        for element in soup(BOILERPLATE_TAGS):
+            element.extract()
         
+        # Try common article selectors; the first match is kept unless a later one is substantial
         article_content = None
         
-        for tag, attrs in selectors:
-            article_content = soup.find(tag, attrs)
-            if article_content:
+        for tag, attrs in ARTICLE_SELECTORS:
+            candidate = soup.find(tag, attrs)
+            if candidate is None:
+                continue
+            if article_content is None:
+                article_content = candidate
+            if len(candidate.get_text()) >= MIN_ARTICLE_CHARS:
+                article_content = candidate
                 break
         
         # Fallback
@@ -130,11 +201,11 @@ class NewsParser:
         # Extract paragraphs
         paragraphs = article_content.find_all('p')
         
-        # Filter out short paragraphs (likely not article content)
+        # Filter out short paragraphs (likely not article content); text extracted once each
         body_paragraphs = [
-            p.get_text().strip() 
-            for p in paragraphs 
-            if len(p.get_text().strip()) > 50  # At least 50 chars
+            text
+            for p in paragraphs
+            if len(text := p.get_text().strip()) > 50  # At least 50 chars
         ]
         
         body_text = '\n\n'.join(body_paragraphs)
@@ -149,7 +220,7 @@ class NewsParser:
             return author_meta['content'].strip()
         
         # By-line class
-        byline = soup.find(class_=re.compile(r'author|byline|writer', re.I))
+        byline = soup.find(class_=_AUTHOR_RE)
         if byline:
             return byline.get_text().strip()
         
@@ -179,6 +250,95 @@ class NewsParser:
         
         return None
     
+    # selectolax versions of the extractors above (same lookups, CSS selectors)
+    
+    @staticmethod
+    def _meta_content(tree, selector: str) -> Optional[str]:
+        """content attribute of the first node matching selector, if non-empty"""
+        node = tree.css_first(selector)
+        return node.attributes.get('content') if node else None
+    
+    def _fast_title(self, tree) -> str:
+        """Extract article title with selectolax"""
+        title_tag = tree.css_first('title')
+        if title_tag:
+            return _TITLE_SPLIT_RE.split(title_tag.text().strip(), maxsplit=1)[0]
+        
+        h1 = tree.css_first('h1')
+        if h1:
+            return h1.text().strip()
+        
+        og_title = self._meta_content(tree, 'meta[property="og:title"]')
+        if og_title:
+            return og_title.strip()
+        
+        return "Unknown Title"
+    
+    def _fast_article_body(self, tree) -> str:
+        """Extract article body with selectolax"""
+        tree.strip_tags(BOILERPLATE_TAGS)
+        
+        article_content = None
+        
+        for selector in FAST_ARTICLE_SELECTORS:
+            if isinstance(selector, str):
+                candidate = tree.css_first(selector)
+            else:
+                attr, pattern = selector
+                candidate = next(
+                    (div for div in tree.css('div') if pattern.search(div.attributes.get(attr) or '')),
+                    None
+                )
+            if candidate is None:
+                continue
+            if article_content is None:
+                article_content = candidate
+            if len(candidate.text()) >= MIN_ARTICLE_CHARS:
+                article_content = candidate
+                break
+        
+        if article_content is None:
+            article_content = tree.body or tree.root
+        if article_content is None:
+            return ''
+        
+        return '\n\n'.join(
+            text
+            for p in article_content.css('p')
+            if len(text := p.text().strip()) > 50  # At least 50 chars
+        )
+    
+    def _fast_author(self, tree) -> Optional[str]:
+        """Extract author with selectolax"""
+        author_meta = self._meta_content(tree, 'meta[name="author"]')
+        if author_meta:
+            return author_meta.strip()
+        
+        byline = next(
+            (node for node in tree.css('[class]') if _AUTHOR_RE.search(node.attributes.get('class') or '')),
+            None
+        )
+        if byline:
+            return byline.text().strip()
+        
+        author_link = tree.css_first('a[rel~="author"]')
+        if author_link:
+            return author_link.text().strip()
+        
+        return None
+    
+    def _fast_date(self, tree) -> Optional[str]:
+        """Extract publication date with selectolax"""
+        time_tag = tree.css_first('time')
+        if time_tag and time_tag.attributes.get('datetime'):
+            return time_tag.attributes['datetime']
+        
+        return (
+            self._meta_content(tree, 'meta[property="article:published_time"]')
+            or self._meta_content(tree, 'meta[itemprop="datePublished"]')
+            or None
+        )
+    
     def parse_simple(
         self,
         text: str,
@@ -203,5 +363,5 @@ class NewsParser:
             "body": text,
             "author": None,
             "published_date": published_date,
-            "word_count": len(text.split())
+            "word_count": _word_count(text)
         }
\ No newline at end of file
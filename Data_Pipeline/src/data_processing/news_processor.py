@@ -2,7 +2,9 @@
 """News article processor - orchestrates the complete news workflow"""
 
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import threading
 
 import sys
 from pathlib import Path
@@ -10,14 +12,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.data_ingestion.news_fetcher import NewsFetcher
 from src.data_processing.embedder import FinancialEmbedder
+from src.data_processing.chunker import CharacterSplitter
 from src.storage.postgres_manager import PostgresManager
 from src.storage.qdrant_manager import QdrantManager
+from src.cloud.qdrant_connector import QdrantConnector
 from src.utils.config import config
+from src.utils.thread_safety import SerializedProxy
 from src.utils.logging_config import get_logger
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 logger = get_logger(__name__)
 
+# Tickers processed concurrently (fetching is network-bound; DB/Qdrant calls
+# take turns, see __init__)
+MAX_TICKER_WORKERS = 8
+
+# How long a news article is kept after publication
+NEWS_TTL = timedelta(days=3)
+
+# Collection used when qdrant.collection_name is not configured
+DEFAULT_COLLECTION = "financial_data"
+
 
 class NewsProcessor:
     """
@@ -46,20 +60,23 @@ class NewsProcessor:
             qdrant_manager: Qdrant manager instance
             embedder: Embedder instance
         """
-        self.postgres = postgres_manager
-        self.qdrant = qdrant_manager
+        # Tickers run in threads that share these managers; neither is known
+        # to be thread-safe (PostgresManager holds one connection), so each
+        # call takes the manager's lock. Fetching and embedding still overlap.
+        self.postgres = SerializedProxy(postgres_manager)
+        self.qdrant = SerializedProxy(qdrant_manager)
         self.embedder = embedder
         
-        # Initialize components
+        # Initialize components (one fetcher for all tickers, so its
+        # EXTRACTION_WORKERS download pool bounds the total fan-out)
         self.fetcher = NewsFetcher()
         
-        # Initialize text splitter
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=768,
-            chunk_overlap=256,
-            length_function=len,
-            is_separator_regex=False,
-        )
+        # One embedding call at a time: tickers run in threads, and the model's
+        # fast tokenizer must not be used concurrently
+        self._embed_lock = threading.Lock()
+        
+        # Initialize text splitter (character-based, RecursiveCharacterTextSplitter boundaries)
+        self.text_splitter = CharacterSplitter(chunk_size=768, overlap=256)
         
         logger.info("NewsProcessor initialized")
     
@@ -111,20 +128,25 @@ class NewsProcessor:
             
             logger.info(f"Fetched {len(articles)} articles for {ticker}")
             
-            # Process each article
+            # Look up which articles are already stored in one query
+            existing_rows = self.postgres.execute_query(
+                "SELECT article_url FROM news_metadata WHERE article_url = ANY(%s)",
+                ([article['url'] for article in articles],),
+                fetch=True
+            )
+            existing_urls = {row['article_url'] for row in existing_rows or []}
+            
+            # Phase 1: register each new article and split it into chunks
             processed_count = 0
             failed_count = 0
+            pending = []  # (article, article_id, published_date, expires_at, chunks)
+            
+            # Expiry for articles without a publication date (computed once per run)
+            default_expires_at = datetime.now() + NEWS_TTL
             
             for article in articles:
                 try:
-                    # Check if article already exists in database
-                    existing = self.postgres.execute_query(
-                        "SELECT id FROM news_metadata WHERE article_url = %s",
-                        (article['url'],),
-                        fetch=True
-                    )
-                    
-                    if existing:
+                    if article['url'] in existing_urls:
                         logger.debug(f"Article already exists: {article['title'][:50]}...")
                         continue
                     
@@ -139,11 +161,11 @@ class NewsProcessor:
                     
                     # Calculate expiry date (3 days from publication)
                     published_date = article.get('published_date')
-                    if published_date and isinstance(published_date, datetime):
-                        expires_at = published_date + timedelta(days=3)
+                    if isinstance(published_date, datetime):
+                        expires_at = published_date + NEWS_TTL
                     else:
                         # If no published date, use current time + 3 days
-                        expires_at = datetime.now() + timedelta(days=3)
+                        expires_at = default_expires_at
                     
                     # Insert article metadata into PostgreSQL
                     article_data = {
@@ -164,24 +186,54 @@ class NewsProcessor:
                     # Chunk the content
                     chunks = self.text_splitter.split_text(content)
                     logger.debug(f"Split article into {len(chunks)} chunks")
-
-                    # Embed all chunks
-                    logger.debug(f"Embedding {len(chunks)} chunks for article: {article['title'][:50]}...")
-                    embeddings = self.embedder.embed_chunks(chunks, show_progress=False)
                     
-                    if not embeddings or len(embeddings) != len(chunks):
-                        logger.error(f"Failed to embed article chunks: {article['title'][:50]}...")
-                        self.postgres.update_news_status(
-                            article_id, 
-                            'failed', 
-                            error='Embedding failed'
-                        )
-                        failed_count += 1
-                        continue
+                    pending.append((article, article_id, published_date, expires_at, chunks))
+                    
+                except Exception as e:
+                    logger.error(f"Failed to process article {article.get('url', 'Unknown')}: {e}")
+                    failed_count += 1
+            
+            # Phase 2: metadata shared by every chunk of each article
+            fetched_date = datetime.now().isoformat()
+            base_metadatas = [
+                {
+                    'data_source_type': 'news',
+                    'fetched_date': fetched_date,
+                    'ticker': ticker,
+                    'company_name': company.name,
+                    'article_title': article.get('title', 'Unknown'),
+                    'article_url': article['url'],
+                    'news_source': article.get('source', 'Unknown'),
+                    'published_date': published_date.isoformat() if isinstance(published_date, datetime) else str(published_date),
+                    'relevance_score': article.get('relevance_score', 0.0),
+                    'total_chunks': len(chunks),
+                    'expires_at': expires_at.isoformat()
+                }
+                for article, article_id, published_date, expires_at, chunks in pending
+            ]
+            
+            # Phase 3: embed the chunks of all articles batch by batch, storing
+            # each batch in Qdrant before the next one is embedded
+            # (article position, chunk index within the article) for every chunk, in embedding order
+            refs = [(position, i) for position, (*_, chunks) in enumerate(pending) for i in range(len(chunks))]
+            all_chunks = [pending[position][4][i] for position, i in refs]
+            logger.debug(f"Embedding {len(all_chunks)} chunks from {len(pending)} articles")
+            
+            try:
+                batches = self.embedder.embed_chunks(all_chunks, show_progress=False)
+                stored = 0
+                while True:
+                    # Only embedding needs the lock; upserts run outside it
+                    with self._embed_lock:
+                        batch = next(batches, None)
+                    if batch is None:
+                        break
                     
-                    # Prepare chunks for Qdrant
+                    batch_texts, batch_embeddings = batch
                     qdrant_chunks = []
-                    for i, (chunk_text, embedding) in enumerate(zip(chunks, embeddings)):
+                    for (position, i), chunk_text, embedding in zip(
+                        refs[stored:stored + len(batch_texts)], batch_texts, batch_embeddings.tolist()
+                    ):
                         # Generate chunk ID
                         chunk_id = QdrantManager.generate_chunk_id(
                             ticker=ticker,
@@ -192,22 +244,11 @@ class NewsProcessor:
                         
                         # Prepare metadata for Qdrant
                         metadata = {
-                            'data_source_type': 'news',
-                            'fetched_date': datetime.now().isoformat(),
-                            'ticker': ticker,
-                            'company_name': company.name,
-                            'article_title': article.get('title', 'Unknown'),
-                            'article_url': article['url'],
-                            'news_source': article.get('source', 'Unknown'),
-                            'published_date': published_date.isoformat() if isinstance(published_date, datetime) else str(published_date),
-                            'relevance_score': article.get('relevance_score', 0.0),
+                            **base_metadatas[position],
                             'chunk_length': len(chunk_text),
-                            'chunk_index': i,
-                            'total_chunks': len(chunks),
-                            'expires_at': expires_at.isoformat()
+                            'chunk_index': i
                         }
                         
-                        # Store in Qdrant
                         qdrant_chunks.append({
                             'chunk_id': chunk_id,
                             'vector': embedding,
@@ -215,18 +256,26 @@ class NewsProcessor:
                             'metadata': metadata
                         })
                     
-                    self.qdrant.upsert_chunks(qdrant_chunks, batch_size=10)
-                    
-                    # Update status in PostgreSQL
+                    self.qdrant.upsert_chunks(qdrant_chunks, batch_size=256)
+                    stored += len(batch_texts)
+                
+            except Exception as e:
+                logger.error(f"Failed to embed or store news chunks for {ticker}: {e}")
+                for article, article_id, *_ in pending:
+                    self.postgres.update_news_status(article_id, 'failed', error=str(e))
+                failed_count += len(pending)
+                pending = []
+            
+            # Update status in PostgreSQL
+            for article, article_id, published_date, expires_at, chunks in pending:
+                try:
                     self.postgres.update_news_status(
                         article_id=article_id,
                         status='completed',
                         chunks=len(chunks)
                     )
-                    
                     processed_count += 1
                     logger.debug(f"✓ Processed article: {article['title'][:50]}...")
-                    
                 except Exception as e:
                     logger.error(f"Failed to process article {article.get('url', 'Unknown')}: {e}")
                     failed_count += 1
@@ -273,29 +322,34 @@ class NewsProcessor:
             
             logger.info(f"Found {len(expired_articles)} expired articles")
             
+            # Group by ticker so each ticker needs one Qdrant delete
+            articles_by_ticker = {}
+            for article in expired_articles:
+                articles_by_ticker.setdefault(article['ticker'], []).append(article)
+            
+            collection_name = config.qdrant_config.get('collection_name', DEFAULT_COLLECTION)
             deleted_count = 0
             
-            for article in expired_articles:
+            for ticker, ticker_articles in articles_by_ticker.items():
                 try:
-                    ticker = article['ticker']
-                    article_url = article['article_url']
-                    article_id = article['id']
-                    
-                    # Delete from Qdrant (filter by ticker and URL)
-                    self.qdrant.delete_by_filter({
+                    # Delete from Qdrant: one filter matching any of the ticker's expired URLs
+                    qdrant_filter = QdrantConnector.match_filter({
                         'ticker': ticker,
                         'data_source_type': 'news',
-                        'article_url': article_url
+                        'article_url': [article['article_url'] for article in ticker_articles]
                     })
+                    if not self.qdrant.qdrant_client.delete_vectors(collection_name, filters=qdrant_filter):
+                        raise RuntimeError("Qdrant delete failed")
                     
-                    # Delete from PostgreSQL
-                    self.postgres.delete_news_article(article_id)
+                    # Delete from PostgreSQL (only once the vectors are gone)
+                    for article in ticker_articles:
+                        self.postgres.delete_news_article(article['id'])
                     
-                    deleted_count += 1
-                    logger.debug(f"Deleted expired article: {article.get('title', 'Unknown')[:50]}...")
+                    deleted_count += len(ticker_articles)
+                    logger.debug(f"Deleted {len(ticker_articles)} expired articles for {ticker}")
                     
                 except Exception as e:
-                    logger.error(f"Failed to delete article {article.get('article_url', 'Unknown')}: {e}")
+                    logger.error(f"Failed to delete expired articles for {ticker}: {e}")
             
             logger.info(f"✓ Cleaned up {deleted_count} expired articles")
             
@@ -345,16 +399,22 @@ class NewsProcessor:
             'details': []
         }
         
-        for ticker in tickers:
-            logger.info(f"\n--- Processing {ticker} ---")
-            
-            try:
-                result = self.process_company_news(
+        with ThreadPoolExecutor(max_workers=MAX_TICKER_WORKERS) as executor:
+            futures = {}
+            for ticker in tickers:
+                logger.info(f"\n--- Processing {ticker} ---")
+                futures[ticker] = executor.submit(
+                    self.process_company_news,
                     ticker=ticker,
                     days_back=days_back,
                     max_articles=max_articles_per_company,
                     relevance_threshold=relevance_threshold
                 )
+        
+        # Collect in ticker order so the summary is deterministic
+        for ticker, future in futures.items():
+            try:
+                result = future.result()
                 
                 processing_results['companies_processed'] += 1
                 processing_results['total_articles'] += result.get('articles_fetched', 0)
@@ -2,10 +2,15 @@
 """Parser for SEC filing HTML using MarkItDown"""
 
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from markitdown import MarkItDown
+from io import BytesIO
 import re
-import tempfile
-import os
+
+try:
+    from markitdown.converters import HtmlConverter
+except ImportError:  # markitdown < 0.1
+    HtmlConverter = None
 
 import sys
 from pathlib import Path
@@ -15,6 +20,57 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+HR_CHARS = '-_*'
+
+# Upper bound on sections converted concurrently by parse_multiple_sections
+SECTION_PARSE_WORKERS = 8
+
+# Compiled once instead of per call / per line
+_MULTI_NL_RE = re.compile(r'\n{4,}')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')  # MarkItDown's own post-conversion normalization
+
+# Text-bearing tags kept by the streaming fallback when MarkItDown fails
+FALLBACK_TEXT_TAGS = ('p', 'h1', 'h2', 'h3', 'li', 'td', 'th')
+
+
+def _is_horizontal_rule(line: str) -> bool:
+    """True for a line of 3+ rule characters (-, _, *), optionally padded with whitespace"""
+    stripped = line.strip()
+    if len(stripped) < 3 or stripped[0] not in HR_CHARS:
+        return False
+    return stripped.count('-') + stripped.count('_') + stripped.count('*') == len(stripped)
+
+
+def _take_text_before(ancestor, elem) -> str:
+    """
+    Text of ancestor that precedes its descendant elem, in document order
+    
+    The nodes read are removed from the tree (and ancestor's leading text
+    reset), so the text is not emitted again when ancestor ends.
+    """
+    # Path from ancestor's child down to elem
+    path = [elem]
+    for node in elem.iterancestors():
+        if node is ancestor:
+            break
+        path.append(node)
+    path.reverse()
+    
+    parts = []
+    node = ancestor
+    for next_node in path:
+        parts.append(node.text or '')
+        node.text = None
+        for child in list(node):
+            if child is next_node:
+                break
+            if isinstance(child.tag, str):  # skip comments / processing instructions
+                parts.extend(child.itertext())
+            parts.append(child.tail or '')
+            node.remove(child)
+        node = next_node
+    return ''.join(parts)
+
 
 class SECParser:
     """
@@ -29,7 +85,11 @@ class SECParser:
     
     def __init__(self):
         """Initialize SEC parser"""
-        self.markitdown = MarkItDown()
+        # Input is always HTML: with markitdown >= 0.1 the HTML converter is called
+        # directly, skipping plugin discovery, per-call file type detection (magika)
+        # and the accepts() scan over every registered converter
+        self.html_converter = HtmlConverter() if HtmlConverter is not None else None
+        self.markitdown = MarkItDown() if self.html_converter is None else None
         logger.info("SECParser initialized (MarkItDown)")
     
     def parse_filing_section(
@@ -80,8 +140,7 @@ class SECParser:
         """
         Convert HTML to Markdown using MarkItDown
         
-        MarkItDown requires a file path, not HTML content string.
-        So we save to a temp file first.
+        The HTML goes to MarkItDown's HTML converter in memory (no temp file).
         
         Args:
             html_content: Raw HTML string
@@ -89,21 +148,15 @@ class SECParser:
         Returns:
             Markdown text
         """
-        temp_file = None
-        
         try:
-            # Create a temporary HTML file
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.html',
-                delete=False,
-                encoding='utf-8'
-            ) as f:
-                f.write(html_content)
-                temp_file = f.name
+            if self.html_converter is not None:
+                result = self.html_converter.convert_string(html_content)
+                # Same blank-line collapsing MarkItDown.convert_stream applies after converting
+                return _BLANK_LINES_RE.sub('\n\n', self._clean_markdown(result.text_content))
             
-            # Convert using MarkItDown (pass file path)
-            result = self.markitdown.convert(temp_file)
+            # Convert using MarkItDown (extension tells it to use the HTML converter)
+            stream = BytesIO(html_content.encode('utf-8'))
+            result = self.markitdown.convert_stream(stream, file_extension='.html')
             
             # Extract text content
             # MarkItDown returns a DocumentConverterResult object with text_content attribute
@@ -116,21 +169,56 @@ class SECParser:
             
         except Exception as e:
             logger.error(f"Failed to convert HTML to Markdown: {e}")
-            # Fallback: return raw HTML
-            return html_content
+            # Fallback: plain text streamed out of the HTML
+            try:
+                return self._html_to_text_streaming(html_content)
+            except Exception as fallback_err:
+                logger.error(f"Streaming text fallback failed, returning raw HTML: {fallback_err}")
+                return html_content
+    
+    def _html_to_text_streaming(self, html_content: str) -> str:
+        """
+        Extract paragraph-level text with lxml iterparse
+        
+        Elements are cleared as soon as their text is taken, so memory stays
+        bounded even for multi-megabyte filings.
+        
+        Args:
+            html_content: Raw HTML string
+        
+        Returns:
+            Text blocks separated by blank lines
+        """
+        from lxml import etree
+        
+        text_parts = []
+        open_blocks = []  # text tags started but not yet ended, outermost first
+        for event, elem in etree.iterparse(
+            BytesIO(html_content.encode('utf-8')),
+            events=('start', 'end'),
+            tag=FALLBACK_TEXT_TAGS,
+            html=True
+        ):
+            if event == 'start':
+                # A nested text tag: emit the enclosing block's text before it first
+                if open_blocks:
+                    text_parts.append(_take_text_before(open_blocks[-1], elem))
+                open_blocks.append(elem)
+                continue
             
-        finally:
-            # Clean up temp file
-            if temp_file and os.path.exists(temp_file):
-                try:
-                    os.unlink(temp_file)
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp file {temp_file}: {e}")
+            # Nested text tags were already taken (and cleared) at their own end event
+            open_blocks.pop()
+            text_parts.append(''.join(elem.itertext()))
+            elem.clear(keep_tail=True)
+        
+        text_parts = [' '.join(part.split()) for part in text_parts]
+        
+        return self._clean_markdown('\n\n'.join(part for part in text_parts if part))
     
     def _clean_markdown(self, markdown: str) -> str:
         """Clean up converted markdown"""
         # Remove excessive newlines (more than 3 consecutive)
-        markdown = re.sub(r'\n{4,}', '\n\n\n', markdown)
+        markdown = _MULTI_NL_RE.sub('\n\n\n', markdown)
         
         # Remove leading/trailing whitespace from each line
         lines = markdown.split('\n')
@@ -154,32 +242,28 @@ class SECParser:
         Returns:
             List of text chunks
         """
-        # Pattern for horizontal lines
-        # Must be on its own line with optional whitespace
-        hr_pattern = r'^\s*[-_*]{3,}\s*$'
-        
-        lines = markdown.split('\n')
+        # Linear str.find scan over line boundaries; chunks are sliced straight out
+        # of the text (rules must be on their own line)
         chunks = []
-        current_chunk = []
-        
-        for line in lines:
-            # Check if line is a horizontal rule
-            if re.match(hr_pattern, line):
-                # Save current chunk if not empty
-                if current_chunk:
-                    chunk_text = '\n'.join(current_chunk).strip()
-                    if chunk_text:
-                        chunks.append(chunk_text)
-                    current_chunk = []
-                continue
+        chunk_start = pos = 0
+        
+        while True:
+            nl = markdown.find('\n', pos)
+            line_end = len(markdown) if nl == -1 else nl
+            
+            if _is_horizontal_rule(markdown[pos:line_end]):
+                chunk = markdown[chunk_start:pos].strip()
+                if chunk:
+                    chunks.append(chunk)
+                chunk_start = line_end + 1
             
-            current_chunk.append(line)
+            if nl == -1:
+                break
+            pos = nl + 1
         
-        # Add last chunk
-        if current_chunk:
-            chunk_text = '\n'.join(current_chunk).strip()
-            if chunk_text:
-                chunks.append(chunk_text)
+        chunk = markdown[chunk_start:].strip()
+        if chunk:
+            chunks.append(chunk)
         
         logger.debug(f"Split markdown into {len(chunks)} chunks by horizontal lines")
         
@@ -202,19 +286,24 @@ class SECParser:
         Returns:
             List of parsed section dicts
         """
-        parsed_sections = []
+        if not sections_html:
+            return []
         
-        for section_code, html_content in sections_html.items():
-            section_name = section_names.get(section_code, f"Section {section_code}")
-            
-            parsed = self.parse_filing_section(
-                html_content=html_content,
+        section_codes = list(sections_html)
+        
+        def parse_one(section_code: str) -> Dict[str, Any]:
+            return self.parse_filing_section(
+                html_content=sections_html[section_code],
                 section_code=section_code,
-                section_name=section_name,
+                section_name=section_names.get(section_code, f"Section {section_code}"),
                 filing_metadata=filing_metadata
             )
-            
-            parsed_sections.append(parsed)
+        
+        # Sections convert concurrently on the shared converter (it keeps no per-call
+        # state); map() keeps the input section order
+        workers = min(SECTION_PARSE_WORKERS, len(section_codes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parsed_sections = list(executor.map(parse_one, section_codes))
         
         logger.info(f"Parsed {len(parsed_sections)} sections from filing")
         
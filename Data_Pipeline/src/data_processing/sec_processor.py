@@ -2,6 +2,7 @@
 """SEC filing processor - orchestrates the complete SEC workflow"""
 
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import sys
@@ -17,10 +18,27 @@ from src.storage.postgres_manager import PostgresManager
 from src.storage.qdrant_manager import QdrantManager
 from src.utils.llm_client import LLMClient
 from src.utils.config import config
+from src.utils.thread_safety import SerializedProxy
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Default for llm.max_llm_concurrency: table-header requests in flight at once
+# (across all filings being prepared)
+MAX_LLM_CONCURRENCY = 8
+
+# Default for sec filing_concurrency: filings fetched, parsed and chunked at once
+# (SEC requests are paced by edgartools' limiter)
+FILING_WORKERS = 4
+
+# Most chunks embedded in one run across filings (bounds memory held per run)
+MAX_EMBED_TEXTS = 10000
+
+# Defaults for qdrant.upsert_batch_size / qdrant.upsert_concurrency: points per
+# upsert request, and embedding batches being uploaded at once
+QDRANT_UPSERT_BATCH_SIZE = 256
+QDRANT_UPSERT_CONCURRENCY = 2
+
 
 class SECProcessor:
     """
@@ -54,15 +72,24 @@ class SECProcessor:
             embedder: Embedder instance
             llm_client: LLM client instance
         """
-        self.postgres = postgres_manager
+        # Filings are prepared in threads that share this manager; it isn't
+        # known to be thread-safe (one connection), so each call takes its lock
+        self.postgres = SerializedProxy(postgres_manager)
         self.qdrant = qdrant_manager
         self.embedder = embedder
         self.llm_client = llm_client
         
+        # One pool for table-header requests from every filing, so
+        # max_llm_concurrency bounds the requests in flight overall
+        self._llm_pool = ThreadPoolExecutor(
+            max_workers=config.llm_config.get('max_llm_concurrency', MAX_LLM_CONCURRENCY),
+            thread_name_prefix='sec-llm'
+        )
+        
         # Initialize components
         self.fetcher = SECFetcher()
         self.parser = SECParser()
-        self.chunker = TextChunker(chunk_size=800, overlap=100)
+        self.chunker = TextChunker.for_embedder(embedder, chunk_size=800, overlap=100)
         self.table_detector = FinancialTableDetector(
             confidence_threshold=config.llm_config.get('table_confidence_threshold', 0.6)
         )
@@ -94,6 +121,41 @@ class SECProcessor:
         Returns:
             Processing result dict
         """
+        prepared = self._prepare_filing(
+            ticker=ticker,
+            filing_type=filing_type,
+            accession_number=accession_number,
+            filing_date=filing_date,
+            fiscal_year=fiscal_year,
+            fiscal_quarter=fiscal_quarter,
+            filing_url=filing_url
+        )
+        
+        if prepared['status'] != 'prepared':
+            return prepared
+        
+        return self._store_filings(ticker, [prepared])[0]
+    
+    def _prepare_filing(
+        self,
+        ticker: str,
+        filing_type: str,
+        accession_number: str,
+        filing_date: str,
+        fiscal_year: int,
+        fiscal_quarter: Optional[int] = None,
+        filing_url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch, parse and chunk a filing (everything before embedding)
+        
+        Args:
+            Same as process_filing
+        
+        Returns:
+            Dict with status 'prepared', filing_id, filing_data, sections_processed
+            and chunks_data, or a failed processing result dict
+        """
         logger.info(f"Processing {ticker} {filing_type} FY{fiscal_year} "
                    f"{'Q' + str(fiscal_quarter) if fiscal_quarter else ''}")
         
@@ -145,10 +207,18 @@ class SECProcessor:
                 filing_metadata=filing_data
             )
             
+            # Detect financial tables in every section, then generate all LLM
+            # table headers concurrently instead of one blocking call per table
+            table_analyses = [
+                [self.table_detector.analyze_chunk(chunk) for chunk in section['chunks']]
+                for section in parsed_sections
+            ]
+            llm_headers = self._generate_table_headers(parsed_sections, table_analyses, filing_data)
+            
             # Process all chunks from all sections
             all_chunks_data = []
             
-            for section in parsed_sections:
+            for section, section_analyses, section_headers in zip(parsed_sections, table_analyses, llm_headers):
                 logger.info(f"Processing section {section['section_code']}: {section['section_name']}")
                 
                 # Process each chunk from the section
@@ -156,102 +226,227 @@ class SECProcessor:
                     chunks=section['chunks'],
                     section_code=section['section_code'],
                     section_name=section['section_name'],
-                    filing_metadata=filing_data
+                    filing_metadata=filing_data,
+                    table_analyses=section_analyses,
+                    llm_headers=section_headers
                 )
                 
                 all_chunks_data.extend(chunks_data)
             
             logger.info(f"Total chunks to embed and store: {len(all_chunks_data)}")
             
-            # Embed all chunks
-            logger.info("Embedding chunks...")
-            chunk_texts = [c['chunk_text'] for c in all_chunks_data]
-            embeddings = self.embedder.embed_chunks(chunk_texts, show_progress=True)
-            
-            # Add embeddings to chunks
-            for i, chunk_data in enumerate(all_chunks_data):
-                chunk_data['vector'] = embeddings[i]
+            return {
+                'status': 'prepared',
+                'filing_id': filing_id,
+                'filing_data': filing_data,
+                'sections_processed': len(parsed_sections),
+                'chunks_data': all_chunks_data
+            }
             
-            # Prepare for Qdrant storage
-            qdrant_chunks = []
-            for i, chunk_data in enumerate(all_chunks_data):
-                chunk_id = QdrantManager.generate_chunk_id(
-                    ticker=ticker,
-                    source='sec',
-                    content=chunk_data['chunk_text'],
-                    index=i
-                )
+        except Exception as e:
+            return self._fail_filing(filing_id, e)
+    
+    def _fail_filing(self, filing_id: int, error: Exception) -> Dict[str, Any]:
+        """Mark a filing failed in PostgreSQL and build its result dict"""
+        logger.error(f"Failed to process filing: {error}", exc_info=True)
+        
+        # Update status to failed
+        self.postgres.update_sec_filing_status(
+            filing_id=filing_id,
+            status='failed',
+            error=str(error)
+        )
+        
+        return {
+            'status': 'failed',
+            'error': str(error),
+            'filing_id': filing_id
+        }
+    
+    def _store_filings(self, ticker: str, prepared_filings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Embed and store prepared filings, several filings per embedding run
+        
+        Filings are grouped so each group's chunks go through one embed_chunks
+        call (full batches across filing boundaries), up to MAX_EMBED_TEXTS
+        chunks per group to bound memory.
+        
+        Args:
+            ticker: Company ticker
+            prepared_filings: Results of _prepare_filing with status 'prepared'
+        
+        Returns:
+            Processing result dict per filing, in input order
+        """
+        results = []
+        group, group_size = [], 0
+        
+        for prepared in prepared_filings:
+            if group and group_size + len(prepared['chunks_data']) > MAX_EMBED_TEXTS:
+                results.extend(self._embed_and_store(ticker, group))
+                group, group_size = [], 0
+            group.append(prepared)
+            group_size += len(prepared['chunks_data'])
+        
+        if group:
+            results.extend(self._embed_and_store(ticker, group))
+        
+        return results
+    
+    def _embed_and_store(self, ticker: str, group: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Embed all chunks of a group of filings in one run and store them in Qdrant"""
+        # (filing, chunk index within the filing) for every text, in embedding order
+        refs = [(prepared, i) for prepared in group for i in range(len(prepared['chunks_data']))]
+        chunk_texts = [prepared['chunks_data'][i]['chunk_text'] for prepared, i in refs]
+        
+        # Embed chunks batch by batch; each batch is uploaded to Qdrant in the background
+        # while the next one is embedded (a few uploads in flight at once)
+        logger.info(f"Embedding and storing {len(chunk_texts)} chunks from {len(group)} filings...")
+        upsert_batch_size = config.qdrant_config.get('upsert_batch_size', QDRANT_UPSERT_BATCH_SIZE)
+        upsert_concurrency = config.qdrant_config.get('upsert_concurrency', QDRANT_UPSERT_CONCURRENCY)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=upsert_concurrency) as upload_pool:
+                uploads = []
+                stored = 0
+                for batch_texts, batch_embeddings in self.embedder.embed_chunks(chunk_texts, show_progress=True):
+                    qdrant_chunks = []
+                    for (prepared, i), embedding in zip(refs[stored:stored + len(batch_texts)], batch_embeddings.tolist()):
+                        chunk_data = prepared['chunks_data'][i]
+                        chunk_id = QdrantManager.generate_chunk_id(
+                            ticker=ticker,
+                            source='sec',
+                            content=chunk_data['chunk_text'],
+                            index=i
+                        )
+                        
+                        qdrant_chunks.append({
+                            'chunk_id': chunk_id,
+                            'vector': embedding,
+                            'raw_chunk': chunk_data['chunk_text'],
+                            'metadata': chunk_data['metadata']
+                        })
+                    
+                    logger.info(f"Storing {len(qdrant_chunks)} chunks in Qdrant...")
+                    uploads.append(upload_pool.submit(
+                        self.qdrant.upsert_chunks, qdrant_chunks, batch_size=upsert_batch_size
+                    ))
+                    stored += len(batch_texts)
                 
-                qdrant_chunks.append({
-                    'chunk_id': chunk_id,
-                    'vector': chunk_data['vector'],
-                    'raw_chunk': chunk_data['chunk_text'],
-                    'metadata': chunk_data['metadata']
-                })
+                # Surface any upload error before the filings are marked completed
+                for upload in uploads:
+                    upload.result()
             
-            # Store in Qdrant
-            logger.info(f"Storing {len(qdrant_chunks)} chunks in Qdrant...")
-            self.qdrant.upsert_chunks(qdrant_chunks, batch_size=100)
+        except Exception as e:
+            return [self._fail_filing(prepared['filing_id'], e) for prepared in group]
+        
+        results = []
+        for prepared in group:
+            filing_id = prepared['filing_id']
+            filing_data = prepared['filing_data']
+            all_chunks_data = prepared['chunks_data']
             
-            # Update filing status in PostgreSQL
-            self.postgres.update_sec_filing_status(
-                filing_id=filing_id,
-                status='completed',
-                chunks=len(qdrant_chunks)
-            )
+            try:
+                # Update filing status in PostgreSQL
+                self.postgres.update_sec_filing_status(
+                    filing_id=filing_id,
+                    status='completed',
+                    chunks=len(all_chunks_data)
+                )
+            except Exception as e:
+                results.append(self._fail_filing(filing_id, e))
+                continue
             
-            result = {
+            results.append({
                 'status': 'success',
                 'filing_id': filing_id,
-                'sections_processed': len(parsed_sections),
-                'total_chunks': len(qdrant_chunks),
+                'sections_processed': prepared['sections_processed'],
+                'total_chunks': len(all_chunks_data),
                 'financial_table_chunks': sum(
                     1 for c in all_chunks_data 
                     if c['metadata'].get('contains_financial_table', False)
                 )
-            }
+            })
             
-            logger.info(f"✓ Successfully processed {ticker} {filing_type} FY{fiscal_year}")
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Failed to process filing: {e}", exc_info=True)
-            
-            # Update status to failed
-            self.postgres.update_sec_filing_status(
-                filing_id=filing_id,
-                status='failed',
-                error=str(e)
+            logger.info(f"✓ Successfully processed {ticker} {filing_data['filing_type']} FY{filing_data['fiscal_year']}")
+        
+        return results
+    
+    def _generate_table_headers(
+        self,
+        parsed_sections: List[Dict[str, Any]],
+        table_analyses: List[List[Dict[str, Any]]],
+        filing_metadata: Dict[str, Any]
+    ) -> List[Dict[int, Optional[str]]]:
+        """
+        Generate LLM headers for all high-confidence financial tables of a filing
+        
+        Requests run in the processor's shared LLM pool (they are
+        network-bound), so filings prepared concurrently stay within
+        llm.max_llm_concurrency together.
+        
+        Args:
+            parsed_sections: Parsed section dicts (from SECParser)
+            table_analyses: Table analysis per chunk, per section
+            filing_metadata: Filing metadata dict
+        
+        Returns:
+            Per section, a dict mapping chunk index -> generated header (None if empty)
+        """
+        headers = [{} for _ in parsed_sections]
+        threshold = self.table_detector.confidence_threshold
+        
+        tables = [
+            (section_index, chunk_index, chunk, section['section_name'])
+            for section_index, (section, analyses) in enumerate(zip(parsed_sections, table_analyses))
+            for chunk_index, (chunk, analysis) in enumerate(zip(section['chunks'], analyses))
+            if analysis['is_financial_table'] and analysis['confidence'] >= threshold
+        ]
+        if not tables:
+            return headers
+        
+        def generate(table) -> Optional[str]:
+            _, _, chunk, section_name = table
+            return self.llm_client.generate_table_header(
+                table_chunk=chunk,
+                company_name=filing_metadata['company_name'],
+                filing_type=filing_metadata['filing_type'],
+                section_name=section_name,
+                fiscal_year=filing_metadata['fiscal_year'],
+                fiscal_quarter=filing_metadata.get('fiscal_quarter')
             )
-            
-            return {
-                'status': 'failed',
-                'error': str(e),
-                'filing_id': filing_id
-            }
+        
+        logger.info(f"Generating LLM headers for {len(tables)} financial tables")
+        
+        for (section_index, chunk_index, *_), header in zip(tables, self._llm_pool.map(generate, tables)):
+            headers[section_index][chunk_index] = header
+        
+        return headers
     
     def _process_section_chunks(
         self,
         chunks: List[str],
         section_code: str,
         section_name: str,
-        filing_metadata: Dict[str, Any]
+        filing_metadata: Dict[str, Any],
+        table_analyses: List[Dict[str, Any]],
+        llm_headers: Dict[int, Optional[str]]
     ) -> List[Dict[str, Any]]:
         """
         Process chunks from a section with comprehensive metadata
         
         Steps:
-        1. Detect financial tables
-        2. Generate LLM headers for high-confidence tables
-        3. Sub-chunk large chunks if needed
-        4. Add comprehensive metadata (matching test_apple_2024.py structure)
+        1. Prepend LLM headers to high-confidence tables
+        2. Sub-chunk large chunks if needed
+        3. Add comprehensive metadata (matching test_apple_2024.py structure)
         
         Args:
             chunks: List of text chunks (split by ---)
             section_code: Section code (e.g., 'Item7')
             section_name: Section name (e.g., 'MD&A')
             filing_metadata: Filing metadata dict
+            table_analyses: Table analysis per chunk (FinancialTableDetector.analyze_chunk)
+            llm_headers: Chunk index -> LLM table header (from _generate_table_headers)
         
         Returns:
             List of processed chunk dicts with comprehensive metadata
@@ -260,16 +455,23 @@ class SECProcessor:
         ticker = filing_metadata['ticker']
         accession = filing_metadata['accession_number']
         
-        # Calculate total chunks first (needed for metadata)
-        temp_chunks_count = 0
-        for chunk in chunks:
-            table_analysis = self.table_detector.analyze_chunk(chunk)
-            is_financial_table = table_analysis['is_financial_table']
-            preserve_tables = is_financial_table
-            sub_chunks = self.chunker.chunk_text(chunk, preserve_tables=preserve_tables)
-            temp_chunks_count += len(sub_chunks)
+        # Sub-chunk once, up front (tables preserved as single chunks): total chunks
+        # is needed for metadata, and the main loop reuses these, re-chunking only
+        # chunks that get an LLM header
+        section_sub_chunks = [
+            self.chunker.chunk_text(chunk, preserve_tables=table_analysis['is_financial_table'])
+            for chunk, table_analysis in zip(chunks, table_analyses)
+        ]
         
-        total_chunks = temp_chunks_count
+        total_chunks = sum(len(sub_chunks) for sub_chunks in section_sub_chunks)
+        
+        # Token counts for all of them in one batched tokenizer call
+        flat_token_counts = iter(self.chunker.count_tokens_batch(
+            [sub_chunk for sub_chunks in section_sub_chunks for sub_chunk in sub_chunks]
+        ))
+        section_token_counts = [
+            [next(flat_token_counts) for _ in sub_chunks] for sub_chunks in section_sub_chunks
+        ]
         chunk_counter = 0
         
         # Construct GCS path
@@ -277,40 +479,28 @@ class SECProcessor:
         
         # Process chunks (second pass)
         for i, chunk in enumerate(chunks):
-            # Detect if chunk contains financial table
-            table_analysis = self.table_detector.analyze_chunk(chunk)
+            # Financial table detection (already run for the whole filing)
+            table_analysis = table_analyses[i]
             
             is_financial_table = table_analysis['is_financial_table']
             table_confidence = table_analysis['confidence']
             
-            # Generate LLM header for high-confidence tables
-            llm_header = None
-            if is_financial_table and table_confidence >= self.table_detector.confidence_threshold:
-                logger.info(f"Generating LLM header for financial table (confidence: {table_confidence:.2f})")
-                
-                llm_header = self.llm_client.generate_table_header(
-                    table_chunk=chunk,
-                    company_name=filing_metadata['company_name'],
-                    filing_type=filing_metadata['filing_type'],
-                    section_name=section_name,
-                    fiscal_year=filing_metadata['fiscal_year'],
-                    fiscal_quarter=filing_metadata.get('fiscal_quarter')
-                )
-                
-                if llm_header:
-                    # Prepend header to chunk
-                    chunk = f"**Table Description:** {llm_header}\\n\\n{chunk}"
-            
-            # Sub-chunk if needed (but preserve tables as single chunks)
-            preserve_tables = is_financial_table
-            sub_chunks = self.chunker.chunk_text(chunk, preserve_tables=preserve_tables)
+            # LLM header generated up front for high-confidence tables
+            llm_header = llm_headers.get(i)
+            sub_chunks = section_sub_chunks[i]
+            token_counts = section_token_counts[i]
+            if llm_header:
+                # Prepend header to chunk
+                chunk = f"**Table Description:** {llm_header}\\n\\n{chunk}"
+                sub_chunks = self.chunker.chunk_text(chunk, preserve_tables=is_financial_table)
+                token_counts = self.chunker.count_tokens_batch(sub_chunks)
             
             # Add metadata to each sub-chunk
             current_time = datetime.utcnow().isoformat() + 'Z'
             
             for j, sub_chunk in enumerate(sub_chunks):
-                # Calculate token count
-                chunk_tokens = len(self.chunker.encoding.encode(sub_chunk)) if hasattr(self.chunker, 'encoding') else len(sub_chunk) // 4
+                # Token count (computed in batch above)
+                chunk_tokens = token_counts[j]
                 
                 # Extract table references from chunk
                 # (This requires TableProcessor - simplified for now)
@@ -438,9 +628,9 @@ class SECProcessor:
             'details': []
         }
         
-        for filing in filings:
+        def prepare(filing: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             try:
-                result = self.process_filing(
+                return self._prepare_filing(
                     ticker=ticker,
                     filing_type=filing['filing_type'],
                     accession_number=filing['accession_number'],
@@ -450,16 +640,33 @@ class SECProcessor:
                     filing_url=filing.get('filing_url')  # Pass filing URL
                 )
                 
-                if result['status'] == 'success':
-                    results['processed'] += 1
-                else:
-                    results['failed'] += 1
-                
-                results['details'].append(result)
-                
             except Exception as e:
                 logger.error(f"Failed to process filing {filing['accession_number']}: {e}")
+                return None
+        
+        # Fetch, parse and chunk filings concurrently (network-bound; the chunker
+        # gives each worker its own tokenizer copy), then embed and store them
+        # together on this thread
+        workers = max(1, min(config.sec_config.get('filing_concurrency', FILING_WORKERS), len(filings)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # per filing: failed result or prepared filing, in filing order
+            outcomes = list(executor.map(prepare, filings))
+        
+        results['failed'] += sum(1 for outcome in outcomes if outcome is None)
+        outcomes = [outcome for outcome in outcomes if outcome is not None]
+        
+        prepared_filings = [outcome for outcome in outcomes if outcome['status'] == 'prepared']
+        stored = iter(self._store_filings(ticker, prepared_filings))
+        
+        for outcome in outcomes:
+            result = next(stored) if outcome['status'] == 'prepared' else outcome
+            
+            if result['status'] == 'success':
+                results['processed'] += 1
+            else:
                 results['failed'] += 1
+            
+            results['details'].append(result)
         
         logger.info(f"Completed {ticker}: {results['processed']} processed, "
                    f"{results['failed']} failed")
@@ -15,11 +15,15 @@ from src.data_processing.chunker import TextChunker
 from src.data_processing.embedder import FinancialEmbedder
 from src.storage.postgres_manager import PostgresManager
 from src.storage.qdrant_manager import QdrantManager
+from src.cloud.qdrant_connector import QdrantConnector
 from src.utils.config import config
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Collection used when qdrant.collection_name is not configured
+DEFAULT_COLLECTION = "financial_data"
+
 
 class WikipediaProcessor:
     """
@@ -29,7 +33,7 @@ class WikipediaProcessor:
     1. Fetch Wikipedia page
     2. Parse HTML → structured content
     3. Check if content changed (revision ID)
-    4. If changed: delete old chunks, process new
+    4. If changed: process new chunks, then delete the old ones
     5. Chunk text
     6. Embed chunks
     7. Store in Qdrant + PostgreSQL
@@ -56,7 +60,7 @@ class WikipediaProcessor:
         # Initialize components
         self.fetcher = WikipediaFetcher()
         self.parser = WikipediaParser()
-        self.chunker = TextChunker(chunk_size=800, overlap=100)
+        self.chunker = TextChunker.for_embedder(embedder, chunk_size=800, overlap=100)
         
         logger.info("WikipediaProcessor initialized")
     
@@ -122,9 +126,6 @@ class WikipediaProcessor:
             
             logger.info(f"Chunked Wikipedia into {total_chunks} chunks")
             
-            # Embed chunks
-            embeddings = self.embedder.embed_chunks(chunks, show_progress=True)
-            
             # Construct GCS path
             gcs_path = f"raw/wikipedia/{ticker}/{page_data['page_title'].replace(' ', '_')}.json"
             
@@ -134,79 +135,89 @@ class WikipediaProcessor:
             if last_modified and not last_modified.endswith('Z'):
                 last_modified += 'Z'
             
-            # Prepare for Qdrant
-            qdrant_chunks = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                chunk_id = QdrantManager.generate_chunk_id(
-                    ticker=ticker,
-                    source='wikipedia',
-                    content=chunk,
-                    index=i
-                )
-                
-                # Calculate token count
-                chunk_tokens = len(self.chunker.encoding.encode(chunk)) if hasattr(self.chunker, 'encoding') else len(chunk) // 4
-                
-                # Enhanced metadata structure (matching test_apple_2024.py)
-                metadata = {
-                    # ===== Core Identifiers =====
-                    'ticker': ticker,
-                    'company_name': company.name,
-                    'source': 'wikipedia',  # Was 'data_source_type'
-                    
-                    # ===== Page Metadata =====
-                    'page_title': page_data['page_title'],
-                    'page_url': page_data.get('page_url', ''),
-                    'revision_id': current_revision,
-                    'last_modified': last_modified,  # NEW
+            # Embed chunks batch by batch, storing each batch in Qdrant before
+            # the next one is embedded
+            logger.info(f"Storing {total_chunks} Wikipedia chunks in Qdrant")
+            stored = 0
+            for batch_chunks, batch_embeddings in self.embedder.embed_chunks(chunks, show_progress=True):
+                # Prepare for Qdrant
+                qdrant_chunks = []
+                for i, chunk, embedding in zip(
+                    range(stored, stored + len(batch_chunks)), batch_chunks, batch_embeddings.tolist()
+                ):
+                    chunk_id = QdrantManager.generate_chunk_id(
+                        ticker=ticker,
+                        source='wikipedia',
+                        content=chunk,
+                        index=i
+                    )
                     
-                    # ===== Chunk Metadata =====
-                    'chunk_index': i,
-                    'total_chunks': total_chunks,  # NEW
-                    'chunk_size': len(chunk),  # Was 'chunk_length'
-                    'chunk_tokens': chunk_tokens,  # NEW
-                    'chunk_text': chunk,  # For compatibility
+                    # Calculate token count
+                    chunk_tokens = self.chunker.count_tokens(chunk)
                     
-                    # ===== Section Metadata =====  
-                    'section': 'Introduction',  # TODO: Track during parsing
+                    # Enhanced metadata structure (matching test_apple_2024.py)
+                    metadata = {
+                        # ===== Core Identifiers =====
+                        'ticker': ticker,
+                        'company_name': company.name,
+                        'source': 'wikipedia',  # Was 'data_source_type'
+                        
+                        # ===== Page Metadata =====
+                        'page_title': page_data['page_title'],
+                        'page_url': page_data.get('page_url', ''),
+                        'revision_id': current_revision,
+                        'last_modified': last_modified,  # NEW
+                        
+                        # ===== Chunk Metadata =====
+                        'chunk_index': i,
+                        'total_chunks': total_chunks,  # NEW
+                        'chunk_size': len(chunk),  # Was 'chunk_length'
+                        'chunk_tokens': chunk_tokens,  # NEW
+                        'chunk_text': chunk,  # For compatibility
+                        
+                        # ===== Section Metadata =====  
+                        'section': 'Introduction',  # TODO: Track during parsing
+                        
+                        # ===== Table Metadata =====
+                        'has_tables': False,  # NEW (Wikipedia doesn't have tables in this impl)
+                        'table_references': [],  # NEW
+                        
+                        # ===== Storage =====
+                        'gcs_path': gcs_path,  # NEW
+                        
+                        # ===== Timestamps =====
+                        'processed_date': current_time,  # NEW
+                        'fetched_date': current_time,
+                        'created_at': current_time,  # NEW
+                        'last_revision_check': current_time,  # NEW
+                        'expires_at': None,  # Wikipedia doesn't expire
+                        
+                        # ===== Bias Mitigation =====
+                        'boost_factor': 0.12,  # NEW (default for medium companies)
+                        'coverage_classification': 'medium'  # NEW
+                    }
                     
-                    # ===== Table Metadata =====
-                    'has_tables': False,  # NEW (Wikipedia doesn't have tables in this impl)
-                    'table_references': [],  # NEW
-                    
-                    # ===== Storage =====
-                    'gcs_path': gcs_path,  # NEW
-                    
-                    # ===== Timestamps =====
-                    'processed_date': current_time,  # NEW
-                    'fetched_date': current_time,
-                    'created_at': current_time,  # NEW
-                    'last_revision_check': current_time,  # NEW
-                    'expires_at': None,  # Wikipedia doesn't expire
-                    
-                    # ===== Bias Mitigation =====
-                    'boost_factor': 0.12,  # NEW (default for medium companies)
-                    'coverage_classification': 'medium'  # NEW
-                }
+                    qdrant_chunks.append({
+                        'chunk_id': chunk_id,
+                        'vector': embedding,
+                        'raw_chunk': chunk,
+                        'metadata': metadata
+                    })
                 
-                qdrant_chunks.append({
-                    'chunk_id': chunk_id,
-                    'vector': embedding,
-                    'raw_chunk': chunk,
-                    'metadata': metadata
-                })
+                self.qdrant.upsert_chunks(qdrant_chunks, batch_size=100)
+                stored += len(batch_chunks)
             
-            # Delete old chunks if this is an update
+            # Delete old chunks if this is an update, only once the new ones are
+            # stored: every point of the page not written by this run is stale
             if existing_page:
                 logger.info(f"Deleting old Wikipedia chunks for {ticker}")
-                self.qdrant.delete_by_filter({
-                    'ticker': ticker,
-                    'source': 'wikipedia'  # Was 'data_source_type'
-                })
-            
-            # Store new chunks in Qdrant
-            logger.info(f"Storing {len(qdrant_chunks)} Wikipedia chunks in Qdrant")
-            self.qdrant.upsert_chunks(qdrant_chunks, batch_size=100)
+                stale_filter = QdrantConnector.match_filter(
+                    {'ticker': ticker, 'source': 'wikipedia'},  # Was 'data_source_type'
+                    exclude={'processed_date': current_time}
+                )
+                collection_name = config.qdrant_config.get('collection_name', DEFAULT_COLLECTION)
+                if not self.qdrant.qdrant_client.delete_vectors(collection_name, filters=stale_filter):
+                    raise RuntimeError(f"Failed to delete old Wikipedia chunks for {ticker}")
             
             # Update PostgreSQL
             page_metadata = {
@@ -219,13 +230,13 @@ class WikipediaProcessor:
             }
             
             wiki_id = self.postgres.upsert_wikipedia_page(page_metadata)
-            self.postgres.update_wikipedia_status(ticker, 'completed', chunks=len(qdrant_chunks))
+            self.postgres.update_wikipedia_status(ticker, 'completed', chunks=total_chunks)
             
             result = {
                 'status': 'success',
                 'ticker': ticker,
                 'revision_id': current_revision,
-                'total_chunks': len(qdrant_chunks),
+                'total_chunks': total_chunks,
                 'action': 'updated' if existing_page else 'created'
             }
             
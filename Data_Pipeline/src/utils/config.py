@@ -70,6 +70,11 @@ class Config:
         # Load companies
         self.companies = self._load_companies()
         
+        # Ticker lookups are dict hits instead of list scans (first entry wins on duplicates)
+        self._companies_by_ticker = {}
+        for company in self.companies:
+            self._companies_by_ticker.setdefault(company.ticker, company)
+        
         # Load SEC config
         self.sec_config = self._load_yaml('sec_config.yaml')
         
@@ -110,10 +115,7 @@ class Config:
     
     def get_company_by_ticker(self, ticker: str) -> Optional[Company]:
         """Get company info by ticker"""
-        for company in self.companies:
-            if company.ticker == ticker:
-                return company
-        return None
+        return self._companies_by_ticker.get(ticker)
     
     def get_company_by_cik(self, cik: str) -> Optional[Company]:
         """Get company info by CIK"""
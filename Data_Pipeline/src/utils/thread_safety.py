@@ -0,0 +1,52 @@
+# src/utils/thread_safety.py
+"""Serialize calls to clients of unknown thread-safety shared by worker threads"""
+
+from typing import Any
+import functools
+import threading
+import weakref
+
+# One lock per wrapped object, shared by every proxy of it
+_LOCKS: "weakref.WeakKeyDictionary[Any, threading.RLock]" = weakref.WeakKeyDictionary()
+_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_for(target: Any) -> threading.RLock:
+    """The lock guarding target (created on first use)"""
+    with _LOCKS_GUARD:
+        lock = _LOCKS.get(target)
+        if lock is None:
+            lock = _LOCKS[target] = threading.RLock()
+        return lock
+
+
+class SerializedProxy:
+    """
+    Wrap an object so its method calls run one at a time
+    
+    For clients shared by worker threads whose thread-safety can't be
+    relied on, e.g. a manager holding a single psycopg2 connection: each
+    call holds the object's lock, so one thread's transaction or rollback
+    never interleaves with another's. Non-callable attributes are returned
+    as is. Proxies of the same object (e.g. in two processors) share the lock.
+    """
+    
+    def __init__(self, target: Any):
+        """
+        Args:
+            target: Object whose method calls should be serialized
+        """
+        self._target = target
+        self._lock = _lock_for(target)
+    
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        
+        @functools.wraps(attr)
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        
+        return locked